@@ -1,34 +1,78 @@
 import asyncio
-import json
+import copy
 import logging
 import random
+import time
+from dataclasses import replace
 from datetime import timedelta
+from functools import partial
 from typing import Any
 
 import requests
-from bs4 import BeautifulSoup
 from get_chefkoch import Search  # type: ignore[import-untyped]
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_NAME
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, SupportsResponse
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
-
-from .const import DEFAULT_UPDATE_INTERVAL, DOMAIN
+from requests.adapters import HTTPAdapter
+
+from .api import ChefkochClient, ChefkochRequestError, CircuitOpenError
+from .const import (
+    DEFAULT_ASYNC_CLIENT,
+    DEFAULT_FALLBACK_TIMEOUT,
+    DEFAULT_MAX_CONCURRENCY,
+    DEFAULT_POOL_CONNECTIONS,
+    DEFAULT_POOL_MAXSIZE,
+    DEFAULT_RATE_LIMIT,
+    DEFAULT_RECIPE_CACHE_SIZE,
+    DEFAULT_RECIPE_CACHE_TTL,
+    DEFAULT_SEARCH_CACHE_SIZE,
+    DEFAULT_SEARCH_CACHE_TTL,
+    DEFAULT_STAGGER_REFRESH,
+    DEFAULT_UPDATE_INTERVAL,
+    DOMAIN,
+)
+from .jsonld import find_recipe_json_ld
+from .models import (
+    GROUP_HEADER_PREFIX,
+    GROUP_HEADER_SUFFIX,
+    Ingredient,
+    Recipe,
+    parse_amount,
+    parse_ingredients,
+)
+from .reservoir import PAGE_SIZE, RecipeReservoir
+from .scheduler import SensorScheduler
+from .store import RecipeStore, recipe_settings
 
 _LOGGER = logging.getLogger(__name__)
 
 CHEFKOCH_BASE_URL = "https://www.chefkoch.de/rezepte/"
-
-
-async def async_update_data(hass: HomeAssistant, entry: ConfigEntry) -> dict[str, Any]:
-    """Fetch data from Chefkoch for all configured sensors."""
+CHEFKOCH_API_URL = "https://api.chefkoch.de/v2/recipes"
+JSON_LD_MARKER = b"application/ld+json"
+# Retries of a recipe detail request before falling back to scraping
+DETAIL_RETRIES = 2
+# Seconds the comments may take once the recipe details have arrived
+COMMENTS_GRACE_PERIOD = 0.5
+
+
+async def async_update_data(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    only: list[dict[str, Any]] | None = None,
+) -> dict[str, Recipe]:
+    """Fetch data from Chefkoch for the sensors that are due.
+
+    If only is given, exactly those sensors are fetched, whether due or not.
+    """
     sensors: list[dict[str, Any]] = entry.options.get("sensors", [])
     if not sensors:
         return {}
 
     # Get current data to prevent flickering during partial updates
     # We check both the active coordinator and the persistent cache
-    current_data: dict[str, Any] = {}
+    current_data: dict[str, Recipe] = {}
 
     # 1. Try active coordinator
     if (
@@ -42,28 +86,51 @@ async def async_update_data(hass: HomeAssistant, entry: ConfigEntry) -> dict[str
     if not current_data:
         current_data = hass.data.get(DOMAIN, {}).get(f"cache_{entry.entry_id}", {})
 
-    data: dict[str, Any] = dict(current_data)
+    data: dict[str, Recipe] = dict(current_data)
+    entry_data = hass.data[DOMAIN][entry.entry_id]
+    # Responses downloaded during this refresh (e.g. by the Plus check) are reused
+    client: ChefkochClient = entry_data["client"]
+    client = client.with_response_cache()
+    store: RecipeStore = entry_data["store"]
+    scheduler: SensorScheduler = entry_data["scheduler"]
+    now = time.time()
+    due_sensors = only if only is not None else scheduler.due(sensors, now)
+    fallback_timeout = entry.options.get("fallback_timeout", DEFAULT_FALLBACK_TIMEOUT)
 
     async def fetch_and_process_sensor(sensor_config: dict[str, Any]) -> None:
         sensor_id = sensor_config["id"]
         sensor_name = sensor_config.get(CONF_NAME, f"Chefkoch Sensor {sensor_id}")
 
+        scheduler.mark_updated(sensor_id, now)
+        recipe_url: str | None
         try:
-            recipe_url = await _fetch_recipe_url(sensor_config)
+            if next_recipe := _take_prefetched(entry_data, sensor_config):
+                _LOGGER.debug("Using prefetched recipe for sensor %s", sensor_name)
+                recipe_url, recipe = next_recipe
+            else:
+                recipe_url = await _fetch_recipe_url(
+                    client,
+                    sensor_config,
+                    fallback_timeout,
+                    _get_reservoir(entry_data, sensor_config),
+                )
+                if recipe_url:
+                    recipe = await extract_recipe_attributes(client, recipe_url, store)
+            _schedule_prefetch(hass, entry, sensor_config)
             if recipe_url:
-                attributes = await hass.async_add_executor_job(
-                    extract_recipe_attributes, recipe_url
+                data[sensor_id] = recipe
+                store.set_sensor_recipe(
+                    sensor_config, _get_id_from_url(recipe_url), now
                 )
-                data[sensor_id] = attributes
             else:
                 _LOGGER.warning("No recipe found for sensor %s", sensor_name)
                 # Only set error state if we don't have old data
                 if sensor_id not in data:
-                    data[sensor_id] = {
-                        "title": "No recipe found",
-                        "status": "warning",
-                        "error_message": "No matching recipe found.",
-                    }
+                    data[sensor_id] = Recipe.error(
+                        "No recipe found",
+                        "No matching recipe found.",
+                        status="warning",
+                    )
         except Exception as e:
             _LOGGER.exception(
                 "Error during data fetching for sensor %s",
@@ -71,17 +138,101 @@ async def async_update_data(hass: HomeAssistant, entry: ConfigEntry) -> dict[str
             )
             # Only set error state if we don't have old data
             if sensor_id not in data:
-                data[sensor_id] = {
-                    "title": "Error fetching data",
-                    "status": "error",
-                    "error_message": str(e),
-                }
+                data[sensor_id] = Recipe.error("Error fetching data", str(e))
 
-    tasks = [fetch_and_process_sensor(s) for s in sensors]
+    # Bound the number of sensors fetched at once
+    semaphore = asyncio.Semaphore(
+        entry.options.get("max_concurrency", DEFAULT_MAX_CONCURRENCY)
+    )
+
+    async def fetch_bounded(sensor_config: dict[str, Any]) -> None:
+        async with semaphore:
+            await fetch_and_process_sensor(sensor_config)
+
+    tasks = [fetch_bounded(s) for s in due_sensors]
     await asyncio.gather(*tasks)
+
+    # Wake up again when the next sensor is due
+    if (coordinator := entry_data.get("coordinator")) is not None:
+        coordinator.update_interval = scheduler.next_refresh(sensors, time.time())
     return data
 
 
+def _take_prefetched(
+    entry_data: dict[str, Any], sensor_config: dict[str, Any]
+) -> tuple[str, Recipe] | None:
+    """Return and remove the prefetched next recipe of a sensor."""
+    prefetched = entry_data.get("prefetched", {}).pop(sensor_config["id"], None)
+    if prefetched is None or prefetched["settings"] != recipe_settings(sensor_config):
+        return None
+    return prefetched["url"], prefetched["recipe"]
+
+
+def _get_reservoir(
+    entry_data: dict[str, Any], sensor_config: dict[str, Any]
+) -> RecipeReservoir | None:
+    """Return the reservoir of a random sensor, empty if its settings changed."""
+    reservoirs = entry_data.get("reservoirs")
+    if reservoirs is None or sensor_config["type"] != "random":
+        return None
+    settings = recipe_settings(sensor_config)
+    reservoir = reservoirs.get(sensor_config["id"])
+    if reservoir is None or reservoir.settings != settings:
+        reservoir = reservoirs[sensor_config["id"]] = RecipeReservoir(settings)
+    return reservoir
+
+
+def _schedule_prefetch(
+    hass: HomeAssistant, entry: ConfigEntry, sensor_config: dict[str, Any]
+) -> None:
+    """Fetch the next recipe of a sensor in the background.
+
+    The daily recipe only changes once per day, so it is not prefetched.
+    """
+    entry_data = hass.data[DOMAIN][entry.entry_id]
+    tasks = entry_data.get("prefetch_tasks")
+    sensor_id = sensor_config["id"]
+    if tasks is None or sensor_config["type"] == "daily" or sensor_id in tasks:
+        return
+    task = entry.async_create_background_task(
+        hass,
+        _async_prefetch_recipe(hass, entry, sensor_config),
+        f"chefkoch_ha prefetch {sensor_id}",
+    )
+    tasks[sensor_id] = task
+    task.add_done_callback(lambda _: tasks.pop(sensor_id, None))
+
+
+async def _async_prefetch_recipe(
+    hass: HomeAssistant, entry: ConfigEntry, sensor_config: dict[str, Any]
+) -> None:
+    """Fetch the next recipe of a sensor and keep it ready."""
+    entry_data = hass.data[DOMAIN][entry.entry_id]
+    client: ChefkochClient = entry_data["client"]
+    client = client.with_response_cache()
+    try:
+        recipe_url = await _fetch_recipe_url(
+            client,
+            sensor_config,
+            entry.options.get("fallback_timeout", DEFAULT_FALLBACK_TIMEOUT),
+            _get_reservoir(entry_data, sensor_config),
+        )
+        if not recipe_url:
+            return
+        recipe = await extract_recipe_attributes(
+            client, recipe_url, entry_data["store"]
+        )
+    except ChefkochRequestError as err:
+        _LOGGER.debug("Prefetching for sensor %s failed: %s", sensor_config["id"], err)
+        return
+    if recipe.status == "success":
+        entry_data["prefetched"][sensor_config["id"]] = {
+            "settings": recipe_settings(sensor_config),
+            "url": recipe_url,
+            "recipe": recipe,
+        }
+
+
 def _get_id_from_url(url: str | None) -> str | None:
     """Extract recipe ID from URL manually."""
     if not url:
@@ -93,13 +244,138 @@ def _get_id_from_url(url: str | None) -> str | None:
     return None
 
 
-async def _fetch_recipe_url(sensor_config: dict[str, Any]) -> str | None:
-    """Fetch the recipe URL based on sensor config using get_chefkoch."""
+def _create_session(entry: ConfigEntry) -> requests.Session:
+    """Create a keep-alive HTTP session shared by all requests of an entry."""
+    adapter = HTTPAdapter(
+        pool_connections=entry.options.get(
+            "pool_connections", DEFAULT_POOL_CONNECTIONS
+        ),
+        pool_maxsize=entry.options.get("pool_maxsize", DEFAULT_POOL_MAXSIZE),
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+async def _is_valid_recipe_page(client: ChefkochClient, url: str) -> bool:
+    """Return True if the recipe page is accessible and not a Plus recipe.
+
+    The isPlus flag of the API metadata is checked first. Without it, only the
+    start of the recipe page is streamed until the JSON-LD marker shows up or
+    the <head> ends, instead of downloading the whole page.
+    """
+    headers = {"User-Agent": "Mozilla/5.0"}
+    recipe_id = _get_id_from_url(url)
+    if recipe_id:
+        try:
+            resp = await client.async_get(
+                f"{CHEFKOCH_API_URL}/{recipe_id}",
+                headers=headers,
+                timeout=5,
+                revalidate=True,
+            )
+            if resp.status == 200:
+                data = resp.json()
+                if isinstance(data, dict) and data.get("title"):
+                    return not data.get("isPlus")
+        except (ChefkochRequestError, ValueError) as err:
+            _LOGGER.debug("Plus flag unavailable for %s (%s)", url, err)
+
+    resp = await client.async_get(
+        url, headers=headers, timeout=5, stop_at=(JSON_LD_MARKER, b"</head>")
+    )
+    # Plus recipes do not expose JSON-LD
+    return resp.status == 200 and JSON_LD_MARKER in resp.body
+
+
+async def _probe_recipe_pages(client: ChefkochClient, urls: list[str]) -> str | None:
+    """Probe recipe pages concurrently and return the first valid one.
+
+    The remaining probes are cancelled as soon as a valid page is found.
+    """
+    tasks = {
+        asyncio.create_task(_is_valid_recipe_page(client, url)): url for url in urls
+    }
+    pending = set(tasks)
+    try:
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                url = tasks[task]
+                try:
+                    if task.result():
+                        return url
+                    _LOGGER.debug("Skipping Plus or invalid recipe: %s", url)
+                except ChefkochRequestError as e:
+                    _LOGGER.debug("Error during Plus check for %s: %s", url, e)
+    finally:
+        for task in pending:
+            task.cancel()
+    return None
+
+
+def _search_params(
+    sensor_cfg: dict[str, Any], query: str, limit: int
+) -> dict[str, str]:
+    """Return the API search parameters of a sensor config.
+
+    The query is normalized so equivalent searches share one cached result page.
+    """
+    query = " ".join(query.split()).lower()
+    params: dict[str, str] = {"query": query, "limit": str(limit)}
+
+    prep_times = sensor_cfg.get("prep_times")
+    if prep_times and prep_times != "Alle":
+        try:
+            params["maxTime"] = str(int(prep_times))
+        except ValueError:
+            pass
+
+    ratings = sensor_cfg.get("ratings")
+    ratings_map = {"2": "2.0", "3": "3.0", "4": "4.0", "Top": "4.5"}
+    if ratings and ratings in ratings_map:
+        params["minimumRating"] = ratings_map[ratings]
+
+    sort = sensor_cfg.get("sort")
+    sort_map = {"Bewertung": "rating", "Neuheiten": "createdAt"}
+    if sort and sort in sort_map:
+        params["orderBy"] = sort_map[sort]
+    return params
+
+
+def _parse_search_results(data: dict[str, Any]) -> list[tuple[str, str]]:
+    """Return URL and title of the non-Plus recipes of an API search result."""
+    valid_recipes = []
+    for item in data.get("results", []):
+        recipe = item.get("recipe", {})
+        if recipe and not recipe.get("isPlus"):
+            rid = recipe.get("id")
+            if rid:
+                valid_recipes.append(
+                    (
+                        f"{CHEFKOCH_BASE_URL}{rid}/",
+                        recipe.get("title", "Search Recipe"),
+                    )
+                )
+    return valid_recipes
+
+
+async def _fetch_recipe_url(
+    client: ChefkochClient,
+    sensor_config: dict[str, Any],
+    fallback_timeout: float = DEFAULT_FALLBACK_TIMEOUT,
+    reservoir: RecipeReservoir | None = None,
+) -> str | None:
+    """Fetch the recipe URL based on sensor config."""
     sensor_type = sensor_config["type"]
 
-    def _get_daily_url():
-        searcher = Search()
-        recipe = searcher.recipeOfTheDay()
+    async def _get_daily_url():
+        # get_chefkoch requests the website itself, count it against its limit
+        await client.async_throttle(CHEFKOCH_BASE_URL)
+        recipe = await client.async_run_blocking(Search().recipeOfTheDay)
         if recipe:
             # Try to get ID without triggering getMeta if possible
             recipe_id = getattr(recipe, "_id", None)
@@ -110,9 +386,7 @@ async def _fetch_recipe_url(sensor_config: dict[str, Any]) -> str | None:
                 url = f"{CHEFKOCH_BASE_URL}{recipe_id}/"
                 # Check for Plus recipe (no JSON-LD)
                 try:
-                    headers = {"User-Agent": "Mozilla/5.0"}
-                    resp = requests.get(url, headers=headers, timeout=5)
-                    if resp.status_code == 200 and "application/ld+json" in resp.text:
+                    if await _is_valid_recipe_page(client, url):
                         # Avoid triggering getMeta via .name property
                         recipe_name = "Daily Recipe"
                         if hasattr(recipe, "_gotMeta") and recipe._gotMeta:
@@ -120,11 +394,11 @@ async def _fetch_recipe_url(sensor_config: dict[str, Any]) -> str | None:
                         return url, recipe_name
                     else:
                         _LOGGER.debug("Daily recipe is Plus or invalid: %s", url)
-                except (requests.RequestException, ValueError) as e:
+                except ChefkochRequestError as e:
                     _LOGGER.debug("Error during Daily Plus check for %s: %s", url, e)
         return None, None
 
-    def _get_search_url(query_or_config, limit=20):
+    async def _get_search_url(query_or_config, limit=20):
         if isinstance(query_or_config, dict):
             sensor_cfg = query_or_config
             query = sensor_cfg.get("search_query", "").strip() or "Rezept"
@@ -133,82 +407,69 @@ async def _fetch_recipe_url(sensor_config: dict[str, Any]) -> str | None:
             query = str(query_or_config)
 
         # Try direct API search with parameters first
-        params: dict[str, str] = {"query": query, "limit": str(limit)}
-
-        prep_times = sensor_cfg.get("prep_times")
-        if prep_times and prep_times != "Alle":
-            try:
-                params["maxTime"] = str(int(prep_times))
-            except ValueError:
-                pass
-
-        ratings = sensor_cfg.get("ratings")
-        ratings_map = {"2": "2.0", "3": "3.0", "4": "4.0", "Top": "4.5"}
-        if ratings and ratings in ratings_map:
-            params["minimumRating"] = ratings_map[ratings]
+        params = _search_params(sensor_cfg, query, limit)
 
-        sort = sensor_cfg.get("sort")
-        sort_map = {"Bewertung": "rating", "Neuheiten": "createdAt"}
-        if sort and sort in sort_map:
-            params["orderBy"] = sort_map[sort]
-
-        api_search_url = "https://api.chefkoch.de/v2/recipes"
+        api_search_url = CHEFKOCH_API_URL
         headers = {"User-Agent": "Mozilla/5.0"}
         try:
-            resp = requests.get(
-                api_search_url, params=params, headers=headers, timeout=5
+            resp = await client.async_get(
+                api_search_url,
+                params=params,
+                headers=headers,
+                timeout=5,
+                ttl_cache=True,
             )
-            if resp.status_code == 200:
-                data = resp.json()
-                results = data.get("results", [])
-                valid_recipes = []
-                for item in results:
-                    recipe = item.get("recipe", {})
-                    if recipe and not recipe.get("isPlus"):
-                        rid = recipe.get("id")
-                        if rid:
-                            valid_recipes.append(
-                                (
-                                    f"{CHEFKOCH_BASE_URL}{rid}/",
-                                    recipe.get("title", "Search Recipe"),
-                                )
-                            )
+            if resp.status == 200:
+                valid_recipes = resp.memo.get("valid_recipes")
+                if valid_recipes is None:
+                    valid_recipes = _parse_search_results(resp.json())
+                    resp.memo["valid_recipes"] = valid_recipes
 
                 if valid_recipes:
                     attempts = min(5, len(valid_recipes))
                     choice = random.choice(valid_recipes[:attempts])
                     return choice[0], choice[1]
-        except (requests.RequestException, ValueError, TypeError) as err:
+        except (ChefkochRequestError, ValueError, TypeError) as err:
             _LOGGER.debug("API search failed (%s), falling back to Search()", err)
 
-        # Fallback to get_chefkoch Search()
+        # Fallback to get_chefkoch Search(), bounded by an overall deadline
+        deadline = asyncio.get_running_loop().time() + fallback_timeout
         searcher = Search(query)
-        recipes = searcher.recipes(limit=limit)
+        try:
+            async with asyncio.timeout_at(deadline):
+                await client.async_throttle(CHEFKOCH_BASE_URL)
+                recipes = await client.async_run_blocking(
+                    partial(searcher.recipes, limit=limit)
+                )
+        except TimeoutError:
+            _LOGGER.debug("Search() fallback for '%s' exceeded its deadline", query)
+            return None, None
+
         if recipes:
             attempts = min(5, len(recipes))
             sampled_recipes = random.sample(recipes, attempts)
 
+            candidates: dict[str, Any] = {}
             for choice in sampled_recipes:
                 recipe_id = getattr(choice, "_id", None)
                 if not recipe_id:
                     recipe_id = _get_id_from_url(getattr(choice, "_url", ""))
-
                 if recipe_id:
-                    url = f"{CHEFKOCH_BASE_URL}{recipe_id}/"
-                    try:
-                        resp = requests.get(url, headers=headers, timeout=5)
-                        if (
-                            resp.status_code == 200
-                            and "application/ld+json" in resp.text
-                        ):
-                            recipe_name = "Search Recipe"
-                            if hasattr(choice, "_gotMeta") and choice._gotMeta:
-                                recipe_name = getattr(choice, "name", recipe_name)
-                            return url, recipe_name
-                        else:
-                            _LOGGER.debug("Skipping Plus or invalid recipe: %s", url)
-                    except (requests.RequestException, ValueError) as e:
-                        _LOGGER.debug("Error during Plus check for %s: %s", url, e)
+                    candidates.setdefault(f"{CHEFKOCH_BASE_URL}{recipe_id}/", choice)
+
+            try:
+                async with asyncio.timeout_at(deadline):
+                    url = await _probe_recipe_pages(client, list(candidates))
+            except TimeoutError:
+                _LOGGER.debug("Plus check for '%s' exceeded its deadline", query)
+                url = None
+
+            if url:
+                choice = candidates[url]
+                recipe_name = "Search Recipe"
+                if hasattr(choice, "_gotMeta") and choice._gotMeta:
+                    recipe_name = getattr(choice, "name", recipe_name)
+                return url, recipe_name
 
             choice = recipes[0]
             recipe_id = _get_id_from_url(getattr(choice, "_url", ""))
@@ -216,6 +477,30 @@ async def _fetch_recipe_url(sensor_config: dict[str, Any]) -> str | None:
 
         return None, None
 
+    async def _draw_from_reservoir(reservoir: RecipeReservoir):
+        if reservoir.needs_refill():
+            query = sensor_config.get("search_query", "").strip() or "Rezept"
+            params = _search_params(sensor_config, query, PAGE_SIZE)
+            params["offset"] = str(reservoir.offset)
+            try:
+                resp = await client.async_get(
+                    CHEFKOCH_API_URL,
+                    params=params,
+                    headers={"User-Agent": "Mozilla/5.0"},
+                    timeout=5,
+                    ttl_cache=True,
+                )
+                if resp.status == 200:
+                    data = resp.json()
+                    reservoir.fill(
+                        _parse_search_results(data),
+                        PAGE_SIZE,
+                        data.get("count"),
+                    )
+            except (ChefkochRequestError, ValueError, TypeError, AttributeError) as err:
+                _LOGGER.debug("Reservoir refill failed (%s)", err)
+        return reservoir.draw() or (None, None)
+
     try:
         _LOGGER.debug("Fetching recipe URL for sensor type: %s", sensor_type)
         url = None
@@ -223,7 +508,7 @@ async def _fetch_recipe_url(sensor_config: dict[str, Any]) -> str | None:
 
         if sensor_type == "daily":
             try:
-                url, name = await asyncio.to_thread(_get_daily_url)
+                url, name = await _get_daily_url()
             except (
                 requests.RequestException,
                 AttributeError,
@@ -235,14 +520,17 @@ async def _fetch_recipe_url(sensor_config: dict[str, Any]) -> str | None:
                 )
 
             if not url:
-                url, name = await asyncio.to_thread(_get_search_url, sensor_config)
+                url, name = await _get_search_url(sensor_config)
 
             if url:
                 _LOGGER.debug("Daily/Fallback recipe: %s (URL: %s)", name, url)
             return url
 
         elif sensor_type == "random":
-            url, name = await asyncio.to_thread(_get_search_url, sensor_config, 100)
+            if reservoir is not None:
+                url, name = await _draw_from_reservoir(reservoir)
+            if not url:
+                url, name = await _get_search_url(sensor_config, PAGE_SIZE)
             if url:
                 _LOGGER.debug("Random recipe chosen: %s (URL: %s)", name, url)
             return url
@@ -250,23 +538,23 @@ async def _fetch_recipe_url(sensor_config: dict[str, Any]) -> str | None:
         elif sensor_type == "vegan":
             cfg = dict(sensor_config)
             cfg["search_query"] = "vegan"
-            url, name = await asyncio.to_thread(_get_search_url, cfg)
+            url, name = await _get_search_url(cfg)
             return url
 
         elif sensor_type == "vegetarian":
             cfg = dict(sensor_config)
             cfg["search_query"] = "vegetarisch"
-            url, name = await asyncio.to_thread(_get_search_url, cfg)
+            url, name = await _get_search_url(cfg)
             return url
 
         elif sensor_type == "baking":
             cfg = dict(sensor_config)
             cfg["search_query"] = "backen"
-            url, name = await asyncio.to_thread(_get_search_url, cfg)
+            url, name = await _get_search_url(cfg)
             return url
 
         elif sensor_type == "search":
-            url, name = await asyncio.to_thread(_get_search_url, sensor_config)
+            url, name = await _get_search_url(sensor_config)
             return url
 
         return None
@@ -298,33 +586,17 @@ def _parse_duration(duration_str):
         return ""
 
 
-def _find_recipe_in_json(data: Any) -> dict[str, Any] | None:
-    """Recursively search JSON-LD structure for a Recipe object."""
-    if isinstance(data, dict):
-        if data.get("@type") == "Recipe":
-            return data
-        if isinstance(data.get("@graph"), list):
-            for item in data["@graph"]:
-                found = _find_recipe_in_json(item)
-                if found:
-                    return found
-    elif isinstance(data, list):
-        for item in data:
-            found = _find_recipe_in_json(item)
-            if found:
-                return found
-    return None
-
-
-def fetch_recipe_comments_from_api(recipe_id: str, limit: int = 5) -> list[str]:
+async def fetch_recipe_comments_from_api(
+    client: ChefkochClient, recipe_id: str, limit: int = 5
+) -> list[str]:
     """Fetch top user comments for a recipe from Chefkoch API."""
-    url = f"https://api.chefkoch.de/v2/recipes/{recipe_id}/comments"
+    url = f"{CHEFKOCH_API_URL}/{recipe_id}/comments"
     headers = {"User-Agent": "Mozilla/5.0"}
     try:
-        resp = requests.get(
+        resp = await client.async_get(
             url, params={"limit": str(limit)}, headers=headers, timeout=5
         )
-        if resp.status_code == 200:
+        if resp.status == 200:
             data = resp.json()
             comments = []
             for item in data.get("results", []):
@@ -339,46 +611,86 @@ def fetch_recipe_comments_from_api(recipe_id: str, limit: int = 5) -> list[str]:
                     if text:
                         comments.append(f"{author}: {text}" if author else text)
             return comments
-    except (requests.RequestException, ValueError, KeyError) as err:
+    except (ChefkochRequestError, ValueError, KeyError) as err:
         _LOGGER.debug("Failed to fetch comments for recipe %s: %s", recipe_id, err)
     return []
 
 
-def fetch_recipe_attributes_from_api(recipe_id: str) -> dict[str, Any]:
+async def fetch_recipe_attributes_from_api(
+    client: ChefkochClient, recipe_id: str
+) -> Recipe:
     """Fetch recipe attributes directly from Chefkoch v2 API."""
-    api_url = f"https://api.chefkoch.de/v2/recipes/{recipe_id}"
+    api_url = f"{CHEFKOCH_API_URL}/{recipe_id}"
     headers = {
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
     }
-    response = requests.get(api_url, headers=headers, timeout=10)
-    response.raise_for_status()
-    data = response.json()
+    # Comments do not depend on the details, so both requests run concurrently.
+    # Comment errors are swallowed and only cancel themselves on detail errors.
+    comments_task = asyncio.create_task(
+        fetch_recipe_comments_from_api(client, recipe_id, limit=5)
+    )
+    try:
+        # Unchanged recipes are answered with 304 and keep their mapped attributes.
+        # A slow or failed answer is sent again before falling back to scraping.
+        response = await client.async_get(
+            api_url,
+            headers=headers,
+            timeout=10,
+            revalidate=True,
+            retries=DETAIL_RETRIES,
+            hedge=True,
+        )
+        if response.status != 200:
+            raise ChefkochRequestError(
+                f"Chefkoch API returned status {response.status} for {api_url}"
+            )
+        mapped = response.memo.get("attributes")
+        if mapped is None:
+            data = response.json()
 
-    if not data or not isinstance(data, dict) or not data.get("title"):
-        raise ValueError("API response is empty or missing required title field")
+            if not data or not isinstance(data, dict) or not data.get("title"):
+                raise ValueError(
+                    "API response is empty or missing required title field"
+                )
+            mapped = response.memo["attributes"] = _map_api_recipe(data, recipe_id)
+    except BaseException:
+        comments_task.cancel()
+        raise
 
+    # Slow comments are left out instead of delaying the recipe
+    try:
+        comments = await asyncio.wait_for(comments_task, COMMENTS_GRACE_PERIOD)
+    except TimeoutError:
+        _LOGGER.debug("Comments for recipe %s are late, leaving them out", recipe_id)
+        return replace(mapped, partial=True)
+    return replace(mapped, top_comments=tuple(comments))
+
+
+def _map_api_recipe(data: dict[str, Any], recipe_id: str) -> Recipe:
+    """Map a Chefkoch v2 API recipe document to a recipe."""
     title = data.get("title", "")
 
-    # Extract ingredients from ingredientGroups
+    # Extract ingredients from ingredientGroups, keeping their quantities
     ingredients = []
+    ingredient_items = []
     for group in data.get("ingredientGroups", []):
         header = group.get("header", "").strip()
         if header:
-            ingredients.append(f"--- {header} ---")
+            ingredients.append(f"{GROUP_HEADER_PREFIX}{header}{GROUP_HEADER_SUFFIX}")
         for ing in group.get("ingredients", []):
             amount = ing.get("amount")
-            unit = ing.get("unit", "").strip()
-            name = ing.get("name", "").strip()
-            usage_info = ing.get("usageInfo", "").strip().lstrip(",").strip()
-
-            amount_str = ""
-            if isinstance(amount, (int, float)) and amount > 0:
-                amount_str = f"{amount:g}"
-
-            name_with_usage = f"{name} ({usage_info})" if usage_info else name
-            parts = [p for p in [amount_str, unit, name_with_usage] if p]
-            if parts:
-                ingredients.append(" ".join(parts))
+            item = Ingredient(
+                name=ing.get("name", "").strip(),
+                amount=float(amount)
+                if isinstance(amount, (int, float)) and amount > 0
+                else None,
+                unit=ing.get("unit", "").strip(),
+                usage=ing.get("usageInfo", "").strip().lstrip(",").strip(),
+                group=header,
+            )
+            if text := item.text():
+                ingredients.append(text)
+                ingredient_items.append(item)
 
     # Image URL: use previewImageUrlTemplate if available, replacing <format> with crop-900x600
     image_url = ""
@@ -444,97 +756,91 @@ def fetch_recipe_attributes_from_api(recipe_id: str) -> dict[str, Any]:
     difficulty = diff_map.get(diff_raw, str(diff_raw) if diff_raw is not None else "")
 
     # Servings
-    servings = data.get("servings", "")
-    if servings:
-        servings = f"{servings} Port."
+    serving_count = data.get("servings")
+    servings = f"{serving_count} Port." if serving_count else ""
+    if not isinstance(serving_count, (int, float)) or serving_count <= 0:
+        serving_count = None
 
     tags = data.get("tags", [])
     keywords = ", ".join(tags) if isinstance(tags, list) else str(tags) if tags else ""
 
     breadcrumb_items = [
-        b.get("title")
+        b["title"]
         for b in data.get("categoryBreadcrumb", [])
         if isinstance(b, dict) and b.get("title")
     ]
 
-    comments = fetch_recipe_comments_from_api(recipe_id, limit=5)
-
-    attributes: dict[str, Any] = {
-        "title": title,
-        "subtitle": data.get("subtitle", ""),
-        "url": data.get("siteUrl") or f"{CHEFKOCH_BASE_URL}{recipe_id}/",
-        "image_url": image_url,
-        "calories": calories,
-        "protein": protein,
-        "fat": fat,
-        "carbohydrates": carbohydrates,
-        "cuisine": data.get("recipeCuisine", ""),
-        "video_url": "",
-        "video_id": str(data.get("recipeVideoId")) if data.get("recipeVideoId") else "",
-        "difficulty": difficulty,
-        "ingredients": ingredients,
-        "instructions": data.get("instructions", ""),
-        "category": "",
-        "category_breadcrumb": breadcrumb_items,
-        "servings": str(servings),
-        "author": author,
-        "author_notes": data.get("miscellaneousText", "").strip(),
-        "publisher": "Chefkoch",
-        "keywords": keywords,
-        "tags": tags if isinstance(tags, list) else [],
-        "saved_recipes_count": data.get("savedRecipesCount"),
-        "view_count": data.get("viewCount"),
-        "top_comments": comments,
-        "date_published": str(data.get("createdAt", "")),
-        "status": "success",
-        "totalTime": total_time,
-        "prepTime": prep_time,
-        "cookTime": cook_time,
-        "restTime": rest_time,
-        "rating": rating_val,
-        "rating_count": rating_count,
-        "number_ratings": rating_count,
-        "number_reviews": None,
-    }
-    return attributes
+    return Recipe(
+        title=title,
+        subtitle=data.get("subtitle", ""),
+        url=data.get("siteUrl") or f"{CHEFKOCH_BASE_URL}{recipe_id}/",
+        image_url=image_url,
+        calories=calories,
+        protein=protein,
+        fat=fat,
+        carbohydrates=carbohydrates,
+        cuisine=data.get("recipeCuisine", ""),
+        video_id=str(data.get("recipeVideoId")) if data.get("recipeVideoId") else "",
+        difficulty=difficulty,
+        ingredients=tuple(ingredients),
+        ingredient_items=tuple(ingredient_items),
+        instructions=data.get("instructions", ""),
+        category_breadcrumb=tuple(breadcrumb_items),
+        servings=servings,
+        serving_count=serving_count,
+        author=author,
+        author_notes=data.get("miscellaneousText", "").strip(),
+        publisher="Chefkoch",
+        keywords=keywords,
+        tags=tuple(tags) if isinstance(tags, list) else (),
+        saved_recipes_count=data.get("savedRecipesCount"),
+        view_count=data.get("viewCount"),
+        date_published=str(data.get("createdAt", "")),
+        total_time=total_time,
+        prep_time=prep_time,
+        cook_time=cook_time,
+        rest_time=rest_time,
+        rating=rating_val,
+        rating_count=rating_count,
+    )
 
 
-def extract_recipe_attributes_webscraping(recipe_url: str) -> dict[str, Any]:
+async def extract_recipe_attributes_webscraping(
+    client: ChefkochClient, recipe_url: str
+) -> Recipe:
     """Extract all attributes from a recipe URL using JSON-LD webscraping."""
     try:
         # Manual fetch to be more robust
         headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
         }
-        response = requests.get(recipe_url, headers=headers, timeout=10)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.text, "html.parser")
+        response = await client.async_get(recipe_url, headers=headers, timeout=10)
+        if response.status >= 400:
+            raise ChefkochRequestError(
+                f"Recipe page returned status {response.status} for {recipe_url}"
+            )
+        # Parsing the full page is CPU-heavy, keep it off the event loop
+        return await client.async_run_blocking(
+            _parse_recipe_page, response.body, recipe_url
+        )
+    except Exception as e:
+        _LOGGER.exception("Failed to parse recipe %s", recipe_url)
+        return Recipe.error("Error loading recipe", str(e), recipe_url)
 
+
+def _parse_recipe_page(body: bytes, recipe_url: str) -> Recipe:
+    """Extract all attributes from the JSON-LD of a recipe page."""
+    try:
         # Find JSON-LD
-        scripts = soup.find_all("script", type="application/ld+json")
-        raw = {}
-        all_json_data = []
-        for script in scripts:
-            try:
-                if not script.string:
-                    continue
-                data = json.loads(script.string)
-                all_json_data.append(data)
-                recipe = _find_recipe_in_json(data)
-                if recipe:
-                    raw = recipe
-                    break
-            except (json.JSONDecodeError, TypeError):
-                continue
+        raw, og_image = find_recipe_json_ld(body)
 
         if not raw:
             _LOGGER.error("No Recipe JSON-LD found in %s", recipe_url)
-            return {
-                "title": "Error: Missing recipe data",
-                "url": recipe_url,
-                "status": "error",
-                "error_message": "Could not find recipe data in page source.",
-            }
+            return Recipe.error(
+                "Error: Missing recipe data",
+                "Could not find recipe data in page source.",
+                recipe_url,
+            )
 
         def safe(key: str, default: Any = "") -> Any:
             val = raw.get(key)
@@ -595,10 +901,8 @@ def extract_recipe_attributes_webscraping(recipe_url: str) -> dict[str, Any]:
         elif isinstance(images, dict):
             image_url = images.get("url") or images.get("contentUrl", "")
 
-        if not image_url or not image_url.startswith("http"):
-            og_image = soup.find("meta", property="og:image")
-            if og_image and og_image.get("content"):
-                image_url = str(og_image["content"])
+        if (not image_url or not image_url.startswith("http")) and og_image:
+            image_url = og_image
 
         # Instructions: can be a string, a list of strings, a list of HowToStep objects, or HowToSection objects
         instructions_raw = safe("recipeInstructions", "")
@@ -633,69 +937,75 @@ def extract_recipe_attributes_webscraping(recipe_url: str) -> dict[str, Any]:
         kw = safe("keywords", "")
         tags_list = [k.strip() for k in kw.split(",") if k.strip()] if kw else []
 
-        attributes: dict[str, Any] = {
-            "title": name,
-            "subtitle": "",
-            "url": recipe_url,
-            "image_url": image_url,
-            "calories": calories,
-            "protein": protein,
-            "fat": fat,
-            "carbohydrates": carbohydrates,
-            "cuisine": safe("recipeCuisine", ""),
-            "video_url": safe("video", [{}])[0].get("contentUrl", "")
-            if isinstance(safe("video"), list) and safe("video")
-            else (
-                safe("video", {}).get("contentUrl", "")
-                if isinstance(safe("video"), dict)
-                else ""
-            ),
-            "video_id": "",
-            "difficulty": safe("difficulty", ""),
-            "ingredients": ingredients,
-            "instructions": instructions,
-            "category": safe("recipeCategory", ""),
-            "category_breadcrumb": [],
-            "servings": safe("recipeYield", ""),
-            "author": author,
-            "author_notes": "",
-            "publisher": safe("publisher", {}).get("name", "")
-            if isinstance(safe("publisher"), dict)
-            else "",
-            "keywords": kw,
-            "tags": tags_list,
-            "saved_recipes_count": None,
-            "view_count": None,
-            "top_comments": [],
-            "date_published": str(safe("datePublished", "")),
-            "status": "success",
-            "totalTime": _parse_duration(safe("totalTime")),
-            "prepTime": _parse_duration(safe("prepTime")),
-            "cookTime": _parse_duration(safe("cookTime")),
-            "restTime": "",
-            "rating": rating_value,
-            "rating_count": rating_count,
-            "number_ratings": rating_count,
-            "number_reviews": review_count,
-        }
-        return attributes
+        video = safe("video")
+        if isinstance(video, list) and video:
+            video_url = video[0].get("contentUrl", "")
+        elif isinstance(video, dict):
+            video_url = video.get("contentUrl", "")
+        else:
+            video_url = ""
+        publisher = safe("publisher")
+
+        return Recipe(
+            title=name,
+            url=recipe_url,
+            image_url=image_url,
+            calories=calories,
+            protein=protein,
+            fat=fat,
+            carbohydrates=carbohydrates,
+            cuisine=safe("recipeCuisine", ""),
+            video_url=video_url,
+            difficulty=safe("difficulty", ""),
+            ingredients=tuple(ingredients),
+            ingredient_items=parse_ingredients(ingredients),
+            instructions=instructions,
+            category=safe("recipeCategory", ""),
+            servings=safe("recipeYield", ""),
+            serving_count=parse_amount(safe("recipeYield")),
+            author=author,
+            publisher=publisher.get("name", "") if isinstance(publisher, dict) else "",
+            keywords=kw,
+            tags=tuple(tags_list),
+            date_published=str(safe("datePublished", "")),
+            total_time=_parse_duration(safe("totalTime")),
+            prep_time=_parse_duration(safe("prepTime")),
+            cook_time=_parse_duration(safe("cookTime")),
+            rating=rating_value,
+            rating_count=rating_count,
+            number_reviews=review_count,
+        )
 
     except Exception as e:
         _LOGGER.exception("Failed to parse recipe %s", recipe_url)
-        return {
-            "title": "Error loading recipe",
-            "url": recipe_url,
-            "status": "error",
-            "error_message": str(e),
-        }
+        return Recipe.error("Error loading recipe", str(e), recipe_url)
+
 
+async def extract_recipe_attributes(
+    client: ChefkochClient, recipe_url: str, store: RecipeStore | None = None
+) -> Recipe:
+    """Extract all attributes from a recipe URL using API first, with webscraping fallback.
 
-def extract_recipe_attributes(recipe_url: str) -> dict[str, Any]:
-    """Extract all attributes from a recipe URL using API first, with webscraping fallback."""
+    Fresh recipes are read from the store and newly fetched ones are added to it.
+    """
     recipe_id = _get_id_from_url(recipe_url)
+    if recipe_id and store is not None:
+        if (cached := store.get(recipe_id)) is not None:
+            _LOGGER.debug("Using stored recipe %s", recipe_id)
+            return cached
+        recipe = await extract_recipe_attributes(client, recipe_url)
+        # Recipes without their comments are not kept, so the comments are
+        # fetched again the next time the recipe is needed
+        if recipe.status == "success" and not recipe.partial:
+            store.put(recipe_id, recipe)
+        return recipe
+
     if recipe_id:
         try:
-            return fetch_recipe_attributes_from_api(recipe_id)
+            return await fetch_recipe_attributes_from_api(client, recipe_id)
+        except CircuitOpenError as err:
+            # Already logged when the circuit opened
+            _LOGGER.debug("%s, scraping %s instead", err, recipe_url)
         except Exception as err:  # noqa: BLE001
             _LOGGER.warning(
                 "Chefkoch API request failed or returned empty data for %s (%s). Falling back to less efficient webscraping.",
@@ -709,24 +1019,7 @@ def extract_recipe_attributes(recipe_url: str) -> dict[str, Any]:
             recipe_url,
         )
 
-    return extract_recipe_attributes_webscraping(recipe_url)
-
-
-def _scale_ingredient(ingredient: str, factor: float) -> str:
-    """Scale numeric quantities in an ingredient string by a factor."""
-    if factor == 1.0 or ingredient.startswith("---"):
-        return ingredient
-    import re
-
-    def replace_num(match):
-        num_str = match.group(0).replace(",", ".")
-        try:
-            val = float(num_str) * factor
-            return f"{val:g}".replace(".", ",")
-        except ValueError:
-            return match.group(0)
-
-    return re.sub(r"\b\d+(?:[\.,]\d+)?\b", replace_num, ingredient)
+    return await extract_recipe_attributes_webscraping(client, recipe_url)
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -738,6 +1031,53 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     )
     scan_interval = timedelta(hours=update_interval_hours)
 
+    # Search result pages are reused by all sensors and services until they
+    # expire; requests and blocking work are bounded by max_concurrency and
+    # the requests per second to each host by rate_limit
+    client_options = {
+        "ttl": entry.options.get("search_cache_ttl", DEFAULT_SEARCH_CACHE_TTL) * 60,
+        "ttl_cache_max_bytes": entry.options.get(
+            "search_cache_size", DEFAULT_SEARCH_CACHE_SIZE
+        )
+        * 1024,
+        "max_concurrency": entry.options.get(
+            "max_concurrency", DEFAULT_MAX_CONCURRENCY
+        ),
+        "rate_limit": entry.options.get("rate_limit", DEFAULT_RATE_LIMIT),
+    }
+    if entry.options.get("async_client", DEFAULT_ASYNC_CLIENT):
+        client = ChefkochClient(hass, use_async=True, **client_options)
+    else:
+        client = ChefkochClient(
+            hass, use_async=False, session=_create_session(entry), **client_options
+        )
+    store = RecipeStore(
+        hass,
+        entry.entry_id,
+        ttl=entry.options.get("recipe_cache_ttl", DEFAULT_RECIPE_CACHE_TTL) * 3600,
+        max_recipes=entry.options.get("recipe_cache_size", DEFAULT_RECIPE_CACHE_SIZE),
+    )
+    await store.async_load()
+    scheduler = SensorScheduler(
+        scan_interval,
+        entry.entry_id
+        if entry.options.get("stagger_refresh", DEFAULT_STAGGER_REFRESH)
+        else None,
+    )
+    hass.data[DOMAIN][entry.entry_id] = {
+        "client": client,
+        "store": store,
+        "scheduler": scheduler,
+        # Options the entry was set up with, to apply later changes in place
+        "options": copy.deepcopy(dict(entry.options)),
+        # Next recipe per sensor, fetched in the background and swapped in on
+        # the next refresh
+        "prefetched": {},
+        "prefetch_tasks": {},
+        # Search candidates per random sensor
+        "reservoirs": {},
+    }
+
     coordinator = DataUpdateCoordinator(
         hass,
         _LOGGER,
@@ -746,62 +1086,105 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         update_interval=scan_interval,
     )
 
-    # Pre-fill coordinator with cached data if available to avoid "unavailable" state on reload
+    # Sensors whose recipes are still stored come up from disk and are only
+    # fetched once they are due. Expired recipes are marked stale and fetched
+    # again in the background.
+    restored = store.restore_sensors(entry.options.get("sensors", []))
+    data: dict[str, Recipe] = {}
+    for sensor_id, (updated, recipe) in restored.items():
+        scheduler.mark_updated(sensor_id, updated)
+        data[sensor_id] = recipe
+
+    # On a reload the entities keep the recipes they showed, to avoid an
+    # "unavailable" state. Those no longer stored as fresh are marked stale
+    # until they are revalidated in the background.
     cached_data = hass.data.get(DOMAIN, {}).get(f"cache_{entry.entry_id}")
-    if cached_data:
-        coordinator.data = cached_data
-
-    await coordinator.async_config_entry_first_refresh()
+    for sensor_id, recipe in (cached_data or {}).items():
+        stored = data.get(sensor_id)
+        if stored is None or stored.url != recipe.url:
+            data[sensor_id] = replace(recipe, stale=True)
+
+    hass.data[DOMAIN][entry.entry_id]["coordinator"] = coordinator
+    if data:
+        # Entities come up right away, due sensors are refreshed in the background
+        coordinator.data = data
+        revalidate = True
+    else:
+        try:
+            await coordinator.async_config_entry_first_refresh()
+        except Exception:
+            hass.data[DOMAIN].pop(entry.entry_id, None)
+            client.close()
+            raise
+        revalidate = False
 
-    hass.data[DOMAIN][entry.entry_id] = {"coordinator": coordinator}
     # Update cache after successful refresh
     hass.data[DOMAIN][f"cache_{entry.entry_id}"] = coordinator.data
 
     async def handle_refresh_recipe(call):
-        """Handle the service call to refresh recipes."""
+        """Handle the service call to refresh recipes.
+
+        Sensors with a prefetched recipe show it right away. The others,
+        including the daily recipe, are refreshed in the background.
+        """
         _LOGGER.debug("Service chefkoch_ha.refresh_recipe called")
-        await coordinator.async_refresh()
+        entry_data = hass.data[DOMAIN][entry.entry_id]
+        ready: list[dict[str, Any]] = []
+        pending: list[dict[str, Any]] = []
+        for sensor_config in entry.options.get("sensors", []):
+            prefetched = entry_data["prefetched"].get(sensor_config["id"])
+            if prefetched and prefetched["settings"] == recipe_settings(sensor_config):
+                ready.append(sensor_config)
+            else:
+                pending.append(sensor_config)
+        if ready:
+            # Prefetched recipes are swapped in without any request
+            coordinator.async_set_updated_data(
+                await async_update_data(hass, entry, only=ready)
+            )
+        if pending:
+            entry.async_create_background_task(
+                hass,
+                _async_refresh_sensors(hass, entry, pending),
+                "chefkoch_ha refresh",
+            )
 
     async def handle_add_to_shopping_list(call):
         """Add ingredients of a recipe to the shopping list."""
         entity_id = call.data.get("entity_id")
         target_servings = call.data.get("servings")
-        state = hass.states.get(entity_id)
-        if not state:
-            _LOGGER.error("Entity %s not found", entity_id)
-            return
-
-        ingredients = state.attributes.get("ingredients", [])
-        if not ingredients:
+        # The recipe of a Chefkoch sensor has the ingredients even if they are
+        # left out of its compact state attributes
+        if (recipe := _find_recipe(hass, entity_id)) is not None:
+            items = recipe.ingredient_items
+            serving_count = recipe.serving_count
+        else:
+            state = hass.states.get(entity_id)
+            if not state:
+                _LOGGER.error("Entity %s not found", entity_id)
+                return
+            items = parse_ingredients(state.attributes.get("ingredients", []))
+            serving_count = parse_amount(state.attributes.get("servings"))
+
+        if not items:
             _LOGGER.warning("No ingredients found for entity %s", entity_id)
             return
 
         scale_factor = 1.0
-        if target_servings and isinstance(target_servings, (int, float)):
-            orig_servings_str = str(state.attributes.get("servings", ""))
-            import re
-
-            m = re.search(r"\d+", orig_servings_str)
-            if m:
-                try:
-                    orig_servings = int(m.group(0))
-                    if orig_servings > 0:
-                        scale_factor = float(target_servings) / float(orig_servings)
-                except ValueError:
-                    pass
-
-        for ingredient in ingredients:
-            item_name = (
-                _scale_ingredient(ingredient, scale_factor)
-                if scale_factor != 1.0
-                else ingredient
-            )
+        if (
+            isinstance(target_servings, (int, float))
+            and target_servings > 0
+            and serving_count
+        ):
+            scale_factor = float(target_servings) / serving_count
+
+        for item in items:
             await hass.services.async_call(
-                "shopping_list", "add_item", {"name": item_name}
+                "shopping_list", "add_item", {"name": item.text(scale_factor)}
             )
         _LOGGER.info(
             "Added %d ingredients to shopping list (scaled factor: %s)",
-            len(ingredients),
+            len(items),
             scale_factor,
         )
 
@@ -819,29 +1202,32 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
         meal_plan: list[dict[str, str]] = []
         sensor_cfg = {"search_query": query}
+        scoped_client = client.with_response_cache()
 
         for day_index in range(days):
             try:
-                url = await _fetch_recipe_url({"type": "search", **sensor_cfg})
+                url = await _fetch_recipe_url(
+                    scoped_client,
+                    {"type": "search", **sensor_cfg},
+                    entry.options.get("fallback_timeout", DEFAULT_FALLBACK_TIMEOUT),
+                )
                 if url:
-                    recipe_id = _get_id_from_url(url)
                     title = ""
-                    if recipe_id:
-                        try:
-                            attrs = await asyncio.to_thread(
-                                fetch_recipe_attributes_from_api, recipe_id
-                            )
-                            title = attrs.get("title", "")
-                        except (
-                            requests.RequestException,
-                            KeyError,
-                            ValueError,
-                        ) as fetch_err:
-                            _LOGGER.debug(
-                                "Failed to fetch recipe title for day %d: %s",
-                                day_index + 1,
-                                fetch_err,
-                            )
+                    try:
+                        recipe = await extract_recipe_attributes(
+                            scoped_client, url, store
+                        )
+                        title = recipe.title
+                    except (
+                        ChefkochRequestError,
+                        KeyError,
+                        ValueError,
+                    ) as fetch_err:
+                        _LOGGER.debug(
+                            "Failed to fetch recipe title for day %d: %s",
+                            day_index + 1,
+                            fetch_err,
+                        )
                     meal_plan.append(
                         {
                             "day": str(day_index + 1),
@@ -849,7 +1235,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
                             "title": title or url,
                         }
                     )
-            except (requests.RequestException, KeyError, ValueError) as err:
+            except (ChefkochRequestError, KeyError, ValueError) as err:
                 _LOGGER.warning(
                     "Could not fetch recipe for day %d: %s", day_index + 1, err
                 )
@@ -862,6 +1248,18 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             "Meal plan generated: %d entries for query '%s'", len(meal_plan), query
         )
 
+    async def handle_get_recipe(call) -> dict[str, Any]:
+        """Return all fields of the recipe a sensor shows."""
+        entity_id = call.data.get("entity_id")
+        recipe = _find_recipe(hass, entity_id)
+        if recipe is None:
+            _LOGGER.error("No Chefkoch recipe found for entity %s", entity_id)
+            return {}
+        return {
+            key: list(value) if isinstance(value, tuple) else value
+            for key, value in {"title": recipe.title, **recipe.as_attributes()}.items()
+        }
+
     hass.services.async_register(DOMAIN, "refresh_recipe", handle_refresh_recipe)
     hass.services.async_register(
         DOMAIN, "add_to_shopping_list", handle_add_to_shopping_list
@@ -869,16 +1267,167 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     hass.services.async_register(
         DOMAIN, "generate_meal_plan", handle_generate_meal_plan
     )
+    hass.services.async_register(
+        DOMAIN,
+        "get_recipe",
+        handle_get_recipe,
+        supports_response=SupportsResponse.ONLY,
+    )
 
     entry.async_on_unload(entry.add_update_listener(options_update_listener))
     await hass.config_entries.async_forward_entry_setups(entry, ["sensor"])
 
+    if revalidate:
+        entry.async_create_background_task(
+            hass, _async_revalidate(hass, entry), "chefkoch_ha revalidate"
+        )
+
     return True
 
 
+def _find_recipe(hass: HomeAssistant, entity_id: str | None) -> Recipe | None:
+    """Return the recipe a Chefkoch sensor shows, looked up by its entity ID."""
+    for entry_data in hass.data.get(DOMAIN, {}).values():
+        if not isinstance(entry_data, dict) or "entities" not in entry_data:
+            continue
+        for entity in entry_data["entities"].values():
+            if entity.entity_id == entity_id:
+                return (entry_data["coordinator"].data or {}).get(entity.sensor_id)
+    return None
+
+
+async def _async_refresh_sensors(
+    hass: HomeAssistant, entry: ConfigEntry, sensors: list[dict[str, Any]]
+) -> None:
+    """Refresh the given sensors, keeping the others as they are by then."""
+    coordinator: DataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id][
+        "coordinator"
+    ]
+    fetched = await async_update_data(hass, entry, only=sensors)
+    data = dict(coordinator.data or {})
+    for sensor_config in sensors:
+        if (recipe := fetched.get(sensor_config["id"])) is not None:
+            data[sensor_config["id"]] = recipe
+    coordinator.async_set_updated_data(data)
+    hass.data[DOMAIN][f"cache_{entry.entry_id}"] = coordinator.data
+
+
+async def _async_revalidate(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Refresh the data the entities came up with at setup.
+
+    Due sensors get a new recipe. The others keep their recipe, which is
+    fetched again if it is stale, unless the store has a fresh copy of it.
+    """
+    entry_data = hass.data[DOMAIN][entry.entry_id]
+    coordinator: DataUpdateCoordinator = entry_data["coordinator"]
+    await coordinator.async_refresh()
+
+    client: ChefkochClient = entry_data["client"]
+    client = client.with_response_cache()
+    store: RecipeStore = entry_data["store"]
+    semaphore = asyncio.Semaphore(
+        entry.options.get("max_concurrency", DEFAULT_MAX_CONCURRENCY)
+    )
+    fresh: dict[str, Recipe] = {}
+
+    async def revalidate_sensor(sensor_id: str, recipe_url: str) -> None:
+        async with semaphore:
+            try:
+                recipe = await extract_recipe_attributes(client, recipe_url, store)
+            except ChefkochRequestError as err:
+                _LOGGER.debug("Revalidating sensor %s failed: %s", sensor_id, err)
+                return
+        if recipe.status == "success":
+            fresh[sensor_id] = recipe
+
+    await asyncio.gather(
+        *(
+            revalidate_sensor(sensor_id, recipe.url)
+            for sensor_id, recipe in (coordinator.data or {}).items()
+            if recipe.stale and recipe.url
+        )
+    )
+    if fresh:
+        # Sensors refreshed in the meantime keep their new recipe
+        data = dict(coordinator.data or {})
+        for sensor_id, recipe in fresh.items():
+            if (current := data.get(sensor_id)) is not None and current.stale:
+                data[sensor_id] = recipe
+        coordinator.async_set_updated_data(data)
+    hass.data[DOMAIN][f"cache_{entry.entry_id}"] = coordinator.data
+
+
 async def options_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
-    """Handle options update."""
-    await hass.config_entries.async_reload(entry.entry_id)
+    """Handle options update.
+
+    Changes to the sensors and update intervals are applied in place, so only
+    added or changed sensors are fetched. Other options need a reload.
+    """
+    entry_data = hass.data.get(DOMAIN, {}).get(entry.entry_id)
+    new_options = copy.deepcopy(dict(entry.options))
+    if entry_data is None or "add_sensors" not in entry_data:
+        await hass.config_entries.async_reload(entry.entry_id)
+        return
+
+    old_options = entry_data["options"]
+    if _without_sensors(old_options) != _without_sensors(new_options):
+        await hass.config_entries.async_reload(entry.entry_id)
+        return
+    entry_data["options"] = new_options
+
+    coordinator = entry_data["coordinator"]
+    scheduler: SensorScheduler = entry_data["scheduler"]
+    scheduler.default_interval = timedelta(
+        hours=new_options.get("update_interval", DEFAULT_UPDATE_INTERVAL)
+    )
+    old_sensors = {s["id"]: s for s in old_options.get("sensors", [])}
+    new_sensors = {s["id"]: s for s in new_options.get("sensors", [])}
+
+    registry = er.async_get(hass)
+    store: RecipeStore = entry_data["store"]
+    data = dict(coordinator.data or {})
+    for sensor_id in old_sensors.keys() - new_sensors.keys():
+        _LOGGER.debug("Removing sensor %s", sensor_id)
+        entry_data["entities"].pop(sensor_id, None)
+        if (task := entry_data["prefetch_tasks"].pop(sensor_id, None)) is not None:
+            task.cancel()
+        entry_data["prefetched"].pop(sensor_id, None)
+        entry_data["reservoirs"].pop(sensor_id, None)
+        data.pop(sensor_id, None)
+        scheduler.forget(sensor_id)
+        store.set_sensor_recipe(old_sensors[sensor_id], None, time.time())
+        if entity_id := registry.async_get_entity_id(
+            "sensor", DOMAIN, f"chefkoch_{sensor_id}"
+        ):
+            registry.async_remove(entity_id)
+    coordinator.data = data
+    # A reload would bring removed sensors back from the snapshot otherwise
+    hass.data[DOMAIN][f"cache_{entry.entry_id}"] = data
+
+    added = []
+    for sensor_id, sensor_config in new_sensors.items():
+        old_config = old_sensors.get(sensor_id)
+        if old_config is None:
+            added.append(sensor_config)
+        elif old_config != sensor_config:
+            if entity := entry_data["entities"].get(sensor_id):
+                entity.update_config(sensor_config)
+            if recipe_settings(old_config) != recipe_settings(sensor_config):
+                scheduler.forget(sensor_id)
+    if added:
+        entry_data["add_sensors"](added)
+
+    # Fetches only the sensors that are due, i.e. the added and changed ones
+    await coordinator.async_refresh()
+
+
+def _without_sensors(options: dict[str, Any]) -> dict[str, Any]:
+    """Return the options that cannot be changed without a reload."""
+    return {
+        key: value
+        for key, value in options.items()
+        if key not in ("sensors", "update_interval")
+    }
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -886,5 +1435,7 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     unload_ok = await hass.config_entries.async_unload_platforms(entry, ["sensor"])
     if unload_ok and entry.entry_id in hass.data[DOMAIN]:
         # We keep the cache_ entry in hass.data[DOMAIN] to survive the reload flicker
-        hass.data[DOMAIN].pop(entry.entry_id)
+        entry_data = hass.data[DOMAIN].pop(entry.entry_id)
+        entry_data["client"].close()
+        await entry_data["store"].async_save()
     return unload_ok
@@ -0,0 +1,570 @@
+"""HTTP client for the Chefkoch API and website."""
+
+import asyncio
+import contextlib
+import copy
+import json
+import logging
+import random
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any
+
+import aiohttp
+import requests
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+
+from .breaker import CLOSED, CircuitBreaker, endpoint_of
+from .latency import LatencyHistogram
+from .ratelimit import RateLimiter, parse_retry_after
+
+_LOGGER = logging.getLogger(__name__)
+
+STREAM_CHUNK_SIZE = 8192
+# Number of responses kept for conditional revalidation (ETag/Last-Modified)
+VALIDATED_CACHE_SIZE = 200
+# Delay (seconds) before the first retry, doubled for every further retry
+RETRY_BACKOFF_BASE = 0.2
+# Longest delay (seconds) before a retry
+RETRY_BACKOFF_MAX = 5
+
+
+def _has_marker(body: bytearray, chunk_size: int, markers: tuple[bytes, ...]) -> bool:
+    """Return True if a marker ends within the most recently received chunk."""
+    for marker in markers:
+        start = max(0, len(body) - chunk_size - len(marker) + 1)
+        if body.find(marker, start) != -1:
+            return True
+    return False
+
+
+def _backoff_delay(attempt: int) -> float:
+    """Return the delay before a retry, exponential with full jitter."""
+    return random.uniform(0, min(RETRY_BACKOFF_MAX, RETRY_BACKOFF_BASE * 2**attempt))
+
+
+def _may_retry(response: "ChefkochResponse") -> bool:
+    """Return False if the server asks to wait longer than a retry may take."""
+    retry_after = parse_retry_after(response.headers.get("retry-after"))
+    return retry_after is None or retry_after <= RETRY_BACKOFF_MAX
+
+
+async def _async_hedged(
+    send: Callable[[], Awaitable["ChefkochResponse"]], delay: float
+) -> "ChefkochResponse":
+    """Send a request again if it takes longer than delay, first good one wins."""
+    tasks = {asyncio.ensure_future(send())}
+    try:
+        done, _ = await asyncio.wait(tasks, timeout=delay)
+        if not done:
+            _LOGGER.debug("No response after %.2f seconds, hedging request", delay)
+            tasks.add(asyncio.ensure_future(send()))
+        while True:
+            done, tasks = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+            good = [
+                task
+                for task in done
+                if task.exception() is None and task.result().status < 500
+            ]
+            if good:
+                return good[0].result()
+            if not tasks:
+                return done.pop().result()
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+class ChefkochRequestError(Exception):
+    """Raised when a request to Chefkoch could not be completed."""
+
+
+class CircuitOpenError(ChefkochRequestError):
+    """Raised instead of sending a request to an endpoint that keeps failing."""
+
+
+class ChefkochResponse:
+    """Transport-independent HTTP response."""
+
+    def __init__(
+        self,
+        url: str,
+        status: int,
+        headers: dict[str, str],
+        body: bytes,
+    ) -> None:
+        """Initialize the response."""
+        self.url = url
+        self.status = status
+        self.headers = {key.lower(): value for key, value in headers.items()}
+        self.body = body
+        # Results derived from the body, kept as long as the body is reused
+        self.memo: dict[str, Any] = {}
+
+    @property
+    def text(self) -> str:
+        """Return the decoded response body."""
+        return self.body.decode("utf-8", errors="replace")
+
+    def json(self) -> Any:
+        """Return the response body parsed as JSON."""
+        return json.loads(self.body)
+
+
+class _Flight:
+    """A request in flight that concurrent identical requests wait for."""
+
+    def __init__(self, task: "asyncio.Future[ChefkochResponse]") -> None:
+        self.task = task
+        self.waiters = 0
+
+    async def wait(self) -> ChefkochResponse:
+        """Wait for the response; the request is cancelled with its last waiter."""
+        self.waiters += 1
+        try:
+            return await asyncio.shield(self.task)
+        except asyncio.CancelledError:
+            if self.waiters == 1:
+                self.task.cancel()
+            raise
+        finally:
+            self.waiters -= 1
+
+
+class _TTLCache:
+    """Responses kept for a fixed time, bounded by the size of their bodies."""
+
+    def __init__(self, ttl: float, max_bytes: int) -> None:
+        self._ttl = ttl
+        self._max_bytes = max_bytes
+        self._bytes = 0
+        self._items: OrderedDict[tuple[str, tuple], tuple[float, ChefkochResponse]] = (
+            OrderedDict()
+        )
+
+    def get(self, key: tuple[str, tuple]) -> ChefkochResponse | None:
+        """Return a response unless it expired."""
+        item = self._items.get(key)
+        if item is None:
+            return None
+        if time.monotonic() >= item[0]:
+            self._pop(key)
+            return None
+        self._items.move_to_end(key)
+        return item[1]
+
+    def put(self, key: tuple[str, tuple], response: ChefkochResponse) -> None:
+        """Add a response and evict the least recently used ones."""
+        if self._ttl <= 0 or len(response.body) > self._max_bytes:
+            return
+        self._pop(key)
+        self._items[key] = (time.monotonic() + self._ttl, response)
+        self._bytes += len(response.body)
+        while self._bytes > self._max_bytes:
+            self._pop(next(iter(self._items)))
+
+    def _pop(self, key: tuple[str, tuple]) -> None:
+        if (item := self._items.pop(key, None)) is not None:
+            self._bytes -= len(item[1].body)
+
+
+class ChefkochClient:
+    """Issue the HTTP requests of one config entry.
+
+    In async mode requests run on the event loop using Home Assistant's shared
+    aiohttp session. Otherwise they are sent with a pooled requests session in
+    the executor.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        *,
+        use_async: bool,
+        session: requests.Session | None = None,
+        ttl: float = 0,
+        ttl_cache_max_bytes: int = 0,
+        max_concurrency: int = 0,
+        rate_limit: float = 0,
+    ) -> None:
+        """Initialize the client.
+
+        Responses requested with ttl_cache are kept for ttl seconds, up to
+        ttl_cache_max_bytes of response bodies.
+
+        With max_concurrency, at most that many requests are sent at once and
+        blocking work runs in a dedicated thread pool of that size instead of
+        Home Assistant's shared executor.
+
+        With rate_limit, requests per second to each host are limited and
+        slowed down further while the server throttles.
+        """
+        self._hass = hass
+        self._use_async = use_async
+        self._session = session
+        self._response_cache: dict[tuple[str, tuple], ChefkochResponse] | None = None
+        self._validated: OrderedDict[tuple[str, tuple], ChefkochResponse] = (
+            OrderedDict()
+        )
+        self._ttl_cache = _TTLCache(ttl, ttl_cache_max_bytes)
+        self._in_flight: dict[tuple, _Flight] = {}
+        self._breakers: dict[str, CircuitBreaker] = {}
+        self._latency: dict[str, LatencyHistogram] = {}
+        self._rate_limiter = RateLimiter(rate_limit) if rate_limit > 0 else None
+        self._semaphore: asyncio.Semaphore | None = None
+        self._executor: ThreadPoolExecutor | None = None
+        if max_concurrency > 0:
+            self._semaphore = asyncio.Semaphore(max_concurrency)
+            self._executor = ThreadPoolExecutor(
+                max_workers=max_concurrency, thread_name_prefix="chefkoch"
+            )
+
+    @property
+    def use_async(self) -> bool:
+        """Return True if requests run natively on the event loop."""
+        return self._use_async
+
+    def with_response_cache(self) -> "ChefkochClient":
+        """Return a client sharing this transport that reuses complete responses.
+
+        Used for the lifetime of one refresh or service call, so a recipe page
+        or API document that was already downloaded (e.g. by the Plus check)
+        is not requested again.
+        """
+        scoped = copy.copy(self)
+        scoped._response_cache = {}
+        return scoped
+
+    async def async_get(
+        self,
+        url: str,
+        *,
+        params: dict[str, str] | None = None,
+        headers: dict[str, str] | None = None,
+        timeout: float = 10,
+        stop_at: tuple[bytes, ...] = (),
+        revalidate: bool = False,
+        ttl_cache: bool = False,
+        retries: int = 0,
+        hedge: bool = False,
+    ) -> ChefkochResponse:
+        """Send a GET request and return the response regardless of status.
+
+        If stop_at markers are given, the body is streamed and reading stops
+        as soon as one of them has been received. Such partial responses are
+        never cached.
+
+        With revalidate, ETag/Last-Modified validators of the last response
+        are sent and a 304 answer returns the stored response again.
+
+        With ttl_cache, a complete response is reused for the configured TTL
+        by all callers of this client, keyed by URL and parameters.
+
+        Failed requests and 5xx answers are retried up to retries times with
+        jittered exponential backoff. With hedge, a request slower than the
+        p95 latency of its endpoint is sent a second time.
+        """
+        cache = None if stop_at else self._response_cache
+        cache_key = (url, tuple(sorted((params or {}).items())))
+        if cache is not None and (cached := cache.get(cache_key)) is not None:
+            _LOGGER.debug("Reusing response for %s", url)
+            return cached
+        if ttl_cache and (cached := self._ttl_cache.get(cache_key)) is not None:
+            _LOGGER.debug("Reusing cached response for %s %s", url, params)
+            return cached
+
+        # Identical requests in flight (e.g. two sensors with the same search)
+        # share a single download
+        flight_key = (
+            cache_key,
+            tuple(sorted((headers or {}).items())),
+            timeout,
+            stop_at,
+            revalidate,
+            retries,
+            hedge,
+        )
+        flight = self._in_flight.get(flight_key)
+        if flight is None:
+            flight = _Flight(
+                asyncio.ensure_future(
+                    self._async_fetch(
+                        cache_key,
+                        params,
+                        headers,
+                        timeout,
+                        stop_at,
+                        revalidate,
+                        retries,
+                        hedge,
+                    )
+                )
+            )
+            self._in_flight[flight_key] = flight
+            flight.task.add_done_callback(
+                lambda _: self._in_flight.pop(flight_key, None)
+            )
+        else:
+            _LOGGER.debug("Joining request in flight for %s", url)
+        response = await flight.wait()
+
+        if cache is not None and response.status == 200:
+            cache[cache_key] = response
+        if ttl_cache and not stop_at and response.status == 200:
+            self._ttl_cache.put(cache_key, response)
+        return response
+
+    async def _async_fetch(
+        self,
+        cache_key: tuple[str, tuple],
+        params: dict[str, str] | None,
+        headers: dict[str, str] | None,
+        timeout: float,
+        stop_at: tuple[bytes, ...],
+        revalidate: bool,
+        retries: int,
+        hedge: bool,
+    ) -> ChefkochResponse:
+        """Send the request, revalidating a stored response if requested."""
+        url = cache_key[0]
+        stored = self._validated.get(cache_key) if revalidate else None
+        if stored is not None:
+            headers = dict(headers or {})
+            if etag := stored.headers.get("etag"):
+                headers["If-None-Match"] = etag
+            if last_modified := stored.headers.get("last-modified"):
+                headers["If-Modified-Since"] = last_modified
+
+        # Endpoints that keep failing are skipped until their circuit closes,
+        # so callers fall back right away instead of waiting for the timeout
+        breaker = self._breaker(url)
+        if not breaker.allow():
+            if stored is not None:
+                _LOGGER.debug("Circuit for %s is open, reusing stored response", url)
+                return stored
+            raise CircuitOpenError(f"Circuit for {breaker.endpoint} is open")
+
+        attempt = 0
+        while True:
+            try:
+                response = await self._async_send(
+                    url,
+                    params,
+                    headers,
+                    timeout,
+                    stop_at,
+                    hedge=hedge and breaker.state == CLOSED,
+                )
+            except ChefkochRequestError as err:
+                if attempt >= retries or not breaker.allow():
+                    raise
+                _LOGGER.debug("%s, retrying", err)
+            else:
+                if (
+                    response.status < 500
+                    or attempt >= retries
+                    or not _may_retry(response)
+                    or not breaker.allow()
+                ):
+                    break
+                _LOGGER.debug("%s answered HTTP %s, retrying", url, response.status)
+            await asyncio.sleep(_backoff_delay(attempt))
+            attempt += 1
+
+        if revalidate:
+            response = self._store_validated(cache_key, stored, response)
+        return response
+
+    async def _async_send(
+        self,
+        url: str,
+        params: dict[str, str] | None,
+        headers: dict[str, str] | None,
+        timeout: float,
+        stop_at: tuple[bytes, ...],
+        *,
+        hedge: bool,
+    ) -> ChefkochResponse:
+        """Send the request with a timeout adapted to the latency of the endpoint.
+
+        With hedge, the request is sent a second time once it takes longer
+        than the p95 latency, and the first good response wins.
+        """
+        histogram = self._histogram(url, stop_at)
+        send = partial(
+            self._async_send_once,
+            url,
+            params,
+            headers,
+            histogram.timeout(timeout),
+            stop_at,
+        )
+        if hedge and (delay := histogram.hedge_delay()) is not None:
+            return await _async_hedged(send, delay)
+        return await send()
+
+    async def _async_send_once(
+        self,
+        url: str,
+        params: dict[str, str] | None,
+        headers: dict[str, str] | None,
+        timeout: float,
+        stop_at: tuple[bytes, ...],
+    ) -> ChefkochResponse:
+        """Send the request once and track the health of the endpoint."""
+        breaker = self._breaker(url)
+        histogram = self._histogram(url, stop_at)
+        try:
+            await self.async_throttle(url)
+            async with self._semaphore or contextlib.nullcontext():
+                started = time.monotonic()
+                if self._use_async:
+                    response = await self._async_get_aiohttp(
+                        url, params, headers, timeout, stop_at
+                    )
+                else:
+                    response = await self.async_run_blocking(
+                        self._get_blocking, url, params, headers, timeout, stop_at
+                    )
+        except (aiohttp.ClientError, TimeoutError, requests.RequestException) as err:
+            if isinstance(err, (TimeoutError, requests.Timeout)):
+                # Counted as taking the whole timeout, so a slower endpoint
+                # raises its adaptive timeout again
+                histogram.record(timeout)
+            breaker.record_failure()
+            raise ChefkochRequestError(f"Request to {url} failed: {err}") from err
+        except asyncio.CancelledError:
+            breaker.release()
+            raise
+
+        if response.status >= 500:
+            breaker.record_failure()
+        else:
+            histogram.record(time.monotonic() - started)
+            breaker.record_success()
+        if self._rate_limiter is not None:
+            self._rate_limiter.observe(url, response.status, response.headers)
+        return response
+
+    def _store_validated(
+        self,
+        cache_key: tuple[str, tuple],
+        stored: ChefkochResponse | None,
+        response: ChefkochResponse,
+    ) -> ChefkochResponse:
+        """Remember validated responses and resolve 304 answers."""
+        if response.status == 304 and stored is not None:
+            _LOGGER.debug("%s not modified, reusing stored response", response.url)
+            self._validated.move_to_end(cache_key)
+            return stored
+        if response.status == 200 and (
+            "etag" in response.headers or "last-modified" in response.headers
+        ):
+            self._validated[cache_key] = response
+            self._validated.move_to_end(cache_key)
+            while len(self._validated) > VALIDATED_CACHE_SIZE:
+                self._validated.popitem(last=False)
+        return response
+
+    def _breaker(self, url: str) -> CircuitBreaker:
+        endpoint = endpoint_of(url)
+        if (breaker := self._breakers.get(endpoint)) is None:
+            breaker = self._breakers[endpoint] = CircuitBreaker(endpoint)
+        return breaker
+
+    def _histogram(self, url: str, stop_at: tuple[bytes, ...]) -> LatencyHistogram:
+        # Reads that stop early are much faster than full ones and would cut
+        # the adaptive timeout of the full reads short, so they are kept apart
+        endpoint = f"{endpoint_of(url)} (partial)" if stop_at else endpoint_of(url)
+        if (histogram := self._latency.get(endpoint)) is None:
+            histogram = self._latency[endpoint] = LatencyHistogram()
+        return histogram
+
+    def latency_diagnostics(self) -> dict[str, Any]:
+        """Return the latency histogram of every endpoint requested so far."""
+        return {
+            endpoint: histogram.as_dict()
+            for endpoint, histogram in self._latency.items()
+        }
+
+    def circuit_diagnostics(self) -> dict[str, Any]:
+        """Return the state of the circuit of every endpoint requested so far."""
+        return {
+            endpoint: breaker.as_dict() for endpoint, breaker in self._breakers.items()
+        }
+
+    async def async_throttle(self, url: str) -> None:
+        """Wait until the rate limit allows a request to the host of url."""
+        if self._rate_limiter is not None:
+            await self._rate_limiter.acquire(url)
+
+    async def async_run_blocking(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Run blocking or CPU-heavy work off the event loop."""
+        if self._executor is not None:
+            return await asyncio.get_running_loop().run_in_executor(
+                self._executor, func, *args
+            )
+        return await self._hass.async_add_executor_job(func, *args)
+
+    async def _async_get_aiohttp(
+        self,
+        url: str,
+        params: dict[str, str] | None,
+        headers: dict[str, str] | None,
+        timeout: float,
+        stop_at: tuple[bytes, ...],
+    ) -> ChefkochResponse:
+        session = async_get_clientsession(self._hass)
+        async with session.get(
+            url,
+            params=params,
+            headers=headers,
+            timeout=aiohttp.ClientTimeout(total=timeout),
+        ) as resp:
+            if stop_at:
+                body = bytearray()
+                async for chunk in resp.content.iter_chunked(STREAM_CHUNK_SIZE):
+                    body += chunk
+                    if _has_marker(body, len(chunk), stop_at):
+                        break
+            else:
+                body = bytearray(await resp.read())
+            return ChefkochResponse(
+                str(resp.url), resp.status, dict(resp.headers), bytes(body)
+            )
+
+    def _get_blocking(
+        self,
+        url: str,
+        params: dict[str, str] | None,
+        headers: dict[str, str] | None,
+        timeout: float,
+        stop_at: tuple[bytes, ...],
+    ) -> ChefkochResponse:
+        resp = (self._session or requests).get(
+            url, params=params, headers=headers, timeout=timeout, stream=bool(stop_at)
+        )
+        if not stop_at:
+            return ChefkochResponse(
+                url, resp.status_code, dict(resp.headers), resp.content
+            )
+        body = bytearray()
+        try:
+            for chunk in resp.iter_content(STREAM_CHUNK_SIZE):
+                body += chunk
+                if _has_marker(body, len(chunk), stop_at):
+                    break
+        finally:
+            resp.close()
+        return ChefkochResponse(url, resp.status_code, dict(resp.headers), bytes(body))
+
+    def close(self) -> None:
+        """Release the pooled connections and the worker threads."""
+        if self._session is not None:
+            self._session.close()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,113 @@
+"""Circuit breakers for the upstream endpoints of Chefkoch."""
+
+import logging
+import time
+from collections import deque
+from typing import Any
+from urllib.parse import urlsplit
+
+_LOGGER = logging.getLogger(__name__)
+
+# Consecutive failures that open a circuit
+FAILURE_THRESHOLD = 5
+# Seconds an open circuit rejects requests before a trial request is let through
+RESET_TIMEOUT = 60
+# Number of state transitions kept per circuit for diagnostics
+TRANSITION_HISTORY = 20
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+def endpoint_of(url: str) -> str:
+    """Return the endpoint of a URL, e.g. api.chefkoch.de/v2/recipes/{id}.
+
+    Recipe IDs are replaced and slugs dropped, so all requests to the same
+    kind of resource share one circuit.
+    """
+    parts = urlsplit(url)
+    segments = [
+        "{id}" if segment.isdigit() else segment
+        for segment in parts.path.split("/")
+        if segment and "." not in segment
+    ]
+    return "/".join([parts.netloc, *segments])
+
+
+class CircuitBreaker:
+    """Stop sending requests to an endpoint that keeps failing.
+
+    After FAILURE_THRESHOLD consecutive failures the circuit opens and
+    requests are rejected right away. Once RESET_TIMEOUT has passed, a single
+    trial request is let through (half-open): it closes the circuit again if
+    it succeeds and reopens it otherwise.
+    """
+
+    def __init__(
+        self,
+        endpoint: str,
+        failure_threshold: int = FAILURE_THRESHOLD,
+        reset_timeout: float = RESET_TIMEOUT,
+    ) -> None:
+        """Initialize a closed circuit."""
+        self.endpoint = endpoint
+        self.state = CLOSED
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_running = False
+        self._transitions: deque[dict[str, Any]] = deque(maxlen=TRANSITION_HISTORY)
+
+    def allow(self) -> bool:
+        """Return True if a request may be sent."""
+        if self.state == OPEN:
+            if time.monotonic() - self._opened_at < self._reset_timeout:
+                return False
+            self._transition(HALF_OPEN)
+        if self.state == HALF_OPEN:
+            if self._trial_running:
+                return False
+            self._trial_running = True
+        return True
+
+    def record_success(self) -> None:
+        """Record a request the endpoint answered properly."""
+        self._failures = 0
+        self._trial_running = False
+        if self.state != CLOSED:
+            self._transition(CLOSED)
+
+    def record_failure(self) -> None:
+        """Record a failed request (network error, timeout or server error)."""
+        self._failures += 1
+        self._trial_running = False
+        if self.state == HALF_OPEN or self._failures >= self._failure_threshold:
+            self._opened_at = time.monotonic()
+            if self.state != OPEN:
+                self._transition(OPEN)
+
+    def release(self) -> None:
+        """Forget a trial request that was cancelled before it completed."""
+        self._trial_running = False
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the state of the circuit for diagnostics."""
+        return {
+            "state": self.state,
+            "consecutive_failures": self._failures,
+            "transitions": list(self._transitions),
+        }
+
+    def _transition(self, state: str) -> None:
+        if state == OPEN:
+            _LOGGER.warning(
+                "Requests to %s keep failing, skipping it for %s seconds",
+                self.endpoint,
+                self._reset_timeout,
+            )
+        elif state == CLOSED:
+            _LOGGER.info("Requests to %s succeed again", self.endpoint)
+        self._transitions.append({"time": time.time(), "from": self.state, "to": state})
+        self.state = state
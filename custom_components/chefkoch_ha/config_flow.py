@@ -8,7 +8,24 @@ from get_chefkoch import Search  # type: ignore[import-untyped]
 from homeassistant import config_entries
 from homeassistant.core import callback
 
-from .const import DEFAULT_SENSORS, DEFAULT_UPDATE_INTERVAL, DOMAIN
+from .const import (
+    DEFAULT_ASYNC_CLIENT,
+    DEFAULT_COMPACT_ATTRIBUTES,
+    DEFAULT_FALLBACK_TIMEOUT,
+    DEFAULT_MAX_CONCURRENCY,
+    DEFAULT_POOL_CONNECTIONS,
+    DEFAULT_POOL_MAXSIZE,
+    DEFAULT_RATE_LIMIT,
+    DEFAULT_RECIPE_CACHE_SIZE,
+    DEFAULT_RECIPE_CACHE_TTL,
+    DEFAULT_RECORD_RECIPE_DETAILS,
+    DEFAULT_SEARCH_CACHE_SIZE,
+    DEFAULT_SEARCH_CACHE_TTL,
+    DEFAULT_SENSORS,
+    DEFAULT_STAGGER_REFRESH,
+    DEFAULT_UPDATE_INTERVAL,
+    DOMAIN,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -176,6 +193,9 @@ class ChefkochOptionsFlowHandler(config_entries.OptionsFlow):
         self.data = dict(config_entry.options)
         self.search_query = ""
         self.suggestions: list[str] = []
+        # Sensor whose update interval is asked next, and the intervals so far
+        self.interval_index = 0
+        self.intervals: dict[str, int] = {}
 
     def _process_user_input(self, user_input):
         """Process user input to handle special values for storage."""
@@ -183,7 +203,7 @@ class ChefkochOptionsFlowHandler(config_entries.OptionsFlow):
         return processed_input
 
     async def async_step_init(self, user_input=None):
-        menu_options = ["update_interval", "add_sensor"]
+        menu_options = ["update_interval", "sensor_intervals", "advanced", "add_sensor"]
         custom_sensors = [s for s in self.current_sensors if s.get("type") == "search"]
         if custom_sensors:
             menu_options.extend(["edit_sensor", "remove_sensor"])
@@ -209,6 +229,126 @@ class ChefkochOptionsFlowHandler(config_entries.OptionsFlow):
             ),
         )
 
+    async def async_step_sensor_intervals(self, user_input=None):
+        """Handle the update interval of each sensor in turn (0 uses the default).
+
+        Sensor names need not be unique, so each sensor gets its own form.
+        """
+        if user_input is None:
+            self.interval_index = 0
+            self.intervals = {}
+        else:
+            sensor = self.current_sensors[self.interval_index]
+            self.intervals[sensor["id"]] = user_input["update_interval"]
+            self.interval_index += 1
+
+        if self.interval_index >= len(self.current_sensors):
+            self.data["sensors"] = [
+                {**sensor, "update_interval": self.intervals.get(sensor["id"], 0)}
+                for sensor in self.current_sensors
+            ]
+            return self.async_create_entry(title="", data=self.data)
+
+        sensor = self.current_sensors[self.interval_index]
+        return self.async_show_form(
+            step_id="sensor_intervals",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(
+                        "update_interval", default=sensor.get("update_interval", 0)
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0, max=168))
+                }
+            ),
+            description_placeholders={
+                "sensor_name": sensor.get("name", sensor["id"]),
+                "position": str(self.interval_index + 1),
+                "count": str(len(self.current_sensors)),
+            },
+        )
+
+    async def async_step_advanced(self, user_input=None):
+        """Handle advanced performance settings."""
+        if user_input is not None:
+            self.data.update(user_input)
+            return self.async_create_entry(title="", data=self.data)
+
+        options = self.config_entry.options
+        return self.async_show_form(
+            step_id="advanced",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(
+                        "async_client",
+                        default=options.get("async_client", DEFAULT_ASYNC_CLIENT),
+                    ): bool,
+                    vol.Required(
+                        "pool_connections",
+                        default=options.get(
+                            "pool_connections", DEFAULT_POOL_CONNECTIONS
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1, max=20)),
+                    vol.Required(
+                        "pool_maxsize",
+                        default=options.get("pool_maxsize", DEFAULT_POOL_MAXSIZE),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1, max=100)),
+                    vol.Required(
+                        "stagger_refresh",
+                        default=options.get("stagger_refresh", DEFAULT_STAGGER_REFRESH),
+                    ): bool,
+                    vol.Required(
+                        "max_concurrency",
+                        default=options.get("max_concurrency", DEFAULT_MAX_CONCURRENCY),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1, max=32)),
+                    vol.Required(
+                        "rate_limit",
+                        default=options.get("rate_limit", DEFAULT_RATE_LIMIT),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1, max=50)),
+                    vol.Required(
+                        "fallback_timeout",
+                        default=options.get(
+                            "fallback_timeout", DEFAULT_FALLBACK_TIMEOUT
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1, max=120)),
+                    vol.Required(
+                        "recipe_cache_ttl",
+                        default=options.get(
+                            "recipe_cache_ttl", DEFAULT_RECIPE_CACHE_TTL
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1, max=720)),
+                    vol.Required(
+                        "recipe_cache_size",
+                        default=options.get(
+                            "recipe_cache_size", DEFAULT_RECIPE_CACHE_SIZE
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=10, max=5000)),
+                    vol.Required(
+                        "search_cache_ttl",
+                        default=options.get(
+                            "search_cache_ttl", DEFAULT_SEARCH_CACHE_TTL
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0, max=1440)),
+                    vol.Required(
+                        "search_cache_size",
+                        default=options.get(
+                            "search_cache_size", DEFAULT_SEARCH_CACHE_SIZE
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=64, max=65536)),
+                    vol.Required(
+                        "compact_attributes",
+                        default=options.get(
+                            "compact_attributes", DEFAULT_COMPACT_ATTRIBUTES
+                        ),
+                    ): bool,
+                    vol.Required(
+                        "record_recipe_details",
+                        default=options.get(
+                            "record_recipe_details", DEFAULT_RECORD_RECIPE_DETAILS
+                        ),
+                    ): bool,
+                }
+            ),
+        )
+
     async def async_step_add_sensor(self, user_input=None):
         """Step 1: Ask for search keyword to get suggestions or skip."""
         if user_input is not None:
@@ -292,8 +432,11 @@ class ChefkochOptionsFlowHandler(config_entries.OptionsFlow):
 
         if user_input is not None:
             processed_input = self._process_user_input(user_input)
-            sensor_to_edit.update(processed_input)
-            self.data["sensors"] = self.current_sensors
+            # Build new configs instead of changing the ones of the entry in place
+            self.data["sensors"] = [
+                {**s, **processed_input} if s is sensor_to_edit else s
+                for s in self.current_sensors
+            ]
             return self.async_create_entry(title="", data=self.data)
 
         # Prepare the data to be displayed in the form, mapping stored values back to form options
@@ -11,3 +11,51 @@ DEFAULT_SENSORS = [
 ]
 
 DEFAULT_UPDATE_INTERVAL = 24  # in hours
+
+# Connection pooling: number of per-host pools and keep-alive connections per host
+DEFAULT_POOL_CONNECTIONS = 4
+DEFAULT_POOL_MAXSIZE = 10
+
+# Run requests natively on the event loop instead of in executor threads
+DEFAULT_ASYNC_CLIENT = True
+
+# Overall deadline (seconds) for the get_chefkoch Search() fallback incl. Plus checks
+DEFAULT_FALLBACK_TIMEOUT = 15
+
+# Persistent recipe cache: lifetime of a cached recipe (hours) and maximum recipes kept
+DEFAULT_RECIPE_CACHE_TTL = 24
+DEFAULT_RECIPE_CACHE_SIZE = 500
+
+# Search result cache: lifetime (minutes) and memory cap (KB) of cached API search pages
+DEFAULT_SEARCH_CACHE_TTL = 60
+DEFAULT_SEARCH_CACHE_SIZE = 2048
+
+# Maximum sensors fetched and requests sent at once; also the size of the worker pool
+DEFAULT_MAX_CONCURRENCY = 4
+
+# Maximum requests per second to each Chefkoch host (lowered automatically on 429/503)
+DEFAULT_RATE_LIMIT = 5
+
+# Spread sensor refreshes over the update interval instead of refreshing them together
+DEFAULT_STAGGER_REFRESH = False
+
+# Keep ingredients, instructions and comments out of the sensor state attributes
+DEFAULT_COMPACT_ATTRIBUTES = False
+
+# Record the bulky attributes below in the recorder database as well
+DEFAULT_RECORD_RECIPE_DETAILS = False
+
+# Large text and list attributes not written to the recorder database by default
+UNRECORDED_ATTRIBUTES = frozenset(
+    {
+        "ingredients",
+        "instructions",
+        "top_comments",
+        "author_notes",
+        "image_url",
+        "video_url",
+        "category_breadcrumb",
+        "tags",
+        "keywords",
+    }
+)
@@ -15,9 +15,16 @@ async def async_get_config_entry_diagnostics(
     hass: HomeAssistant, entry: ConfigEntry
 ) -> dict[str, Any]:
     """Return diagnostics for a config entry."""
-    coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+    entry_data = hass.data[DOMAIN][entry.entry_id]
+    coordinator = entry_data["coordinator"]
+    client = entry_data.get("client")
 
     return {
         "entry": async_redact_data(entry.as_dict(), TO_REDACT),
-        "coordinator_data": coordinator.data,
+        "coordinator_data": {
+            sensor_id: recipe.as_dict()
+            for sensor_id, recipe in (coordinator.data or {}).items()
+        },
+        "circuit_breakers": client.circuit_diagnostics() if client else {},
+        "latency": client.latency_diagnostics() if client else {},
     }
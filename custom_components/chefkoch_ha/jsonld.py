@@ -0,0 +1,111 @@
+"""Extraction of recipe JSON-LD from Chefkoch recipe pages."""
+
+import html
+import json
+import re
+from typing import Any
+
+from bs4 import BeautifulSoup
+
+JSON_LD_TYPE = b"application/ld+json"
+
+# One pass over the raw page: every <script> element and every <meta> tag
+_TAG_RE = re.compile(
+    rb"<script\b(?P<script>[^>]*)>(?P<payload>.*?)</script\s*>|<meta\b(?P<meta>[^>]*)>",
+    re.IGNORECASE | re.DOTALL,
+)
+_ATTR_RE = re.compile(rb"""([\w:-]+)\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s"'>]+))""")
+
+
+def _attributes(raw: bytes) -> dict[bytes, bytes]:
+    """Parse the attributes of a tag into a dict with lowercased names."""
+    return {
+        match.group(1).lower(): match.group(2) or match.group(3) or match.group(4)
+        for match in _ATTR_RE.finditer(raw)
+    }
+
+
+def find_recipe_in_json(data: Any) -> dict[str, Any] | None:
+    """Recursively search JSON-LD structure for a Recipe object."""
+    if isinstance(data, dict):
+        if data.get("@type") == "Recipe":
+            return data
+        if isinstance(data.get("@graph"), list):
+            for item in data["@graph"]:
+                found = find_recipe_in_json(item)
+                if found:
+                    return found
+    elif isinstance(data, list):
+        for item in data:
+            found = find_recipe_in_json(item)
+            if found:
+                return found
+    return None
+
+
+def scan_json_ld(body: bytes) -> tuple[list[bytes], str | None]:
+    """Return the JSON-LD payloads mentioning a Recipe and the og:image URL.
+
+    The raw page is scanned once without building a DOM.
+    """
+    payloads: list[bytes] = []
+    og_content: bytes | None = None
+    og_found = False
+    for match in _TAG_RE.finditer(body):
+        if match.group("meta") is not None:
+            if not og_found and b"og:image" in match.group("meta"):
+                attrs = _attributes(match.group("meta"))
+                if attrs.get(b"property") == b"og:image":
+                    og_found = True
+                    og_content = attrs.get(b"content")
+            continue
+        payload = match.group("payload")
+        if (
+            b"Recipe" in payload
+            and JSON_LD_TYPE in match.group("script")
+            and _attributes(match.group("script")).get(b"type") == JSON_LD_TYPE
+        ):
+            payloads.append(payload)
+
+    og_image = None
+    if og_content:
+        og_image = html.unescape(og_content.decode("utf-8", "replace"))
+    return payloads, og_image
+
+
+def find_recipe_json_ld(body: bytes) -> tuple[dict[str, Any] | None, str | None]:
+    """Return the Recipe JSON-LD object and og:image URL of a recipe page."""
+    payloads, og_image = scan_json_ld(body)
+    for payload in payloads:
+        try:
+            recipe = find_recipe_in_json(json.loads(payload))
+        except ValueError:
+            continue
+        if recipe:
+            return recipe, og_image
+
+    if JSON_LD_TYPE in body and b"Recipe" in body:
+        # Markup the scanner could not make sense of, use the full DOM parser
+        return find_recipe_json_ld_soup(body)
+    return None, og_image
+
+
+def find_recipe_json_ld_soup(body: bytes) -> tuple[dict[str, Any] | None, str | None]:
+    """Return the Recipe JSON-LD object and og:image URL using BeautifulSoup."""
+    soup = BeautifulSoup(body, "html.parser")
+
+    og_image = None
+    og_tag = soup.find("meta", property="og:image")
+    if og_tag and og_tag.get("content"):
+        og_image = str(og_tag["content"])
+
+    for script in soup.find_all("script", type="application/ld+json"):
+        try:
+            if not script.string:
+                continue
+            recipe = find_recipe_in_json(json.loads(script.string))
+            if recipe:
+                return recipe, og_image
+        except (json.JSONDecodeError, TypeError):
+            continue
+    return None, og_image
@@ -0,0 +1,75 @@
+"""Rolling latency histograms for the upstream endpoints of Chefkoch."""
+
+import bisect
+from collections import deque
+from typing import Any
+
+# Upper bounds (seconds) of the histogram buckets, slower requests overflow
+BUCKETS = (0.05, 0.1, 0.2, 0.3, 0.5, 0.75, 1, 1.5, 2, 3, 5, 7.5, 10)
+# Number of most recent requests the histogram covers
+WINDOW = 200
+# Requests needed before timeouts and hedging adapt to the latency
+MIN_SAMPLES = 20
+# Adaptive timeouts allow this multiple of the p99 latency, but at least MIN_TIMEOUT
+TIMEOUT_FACTOR = 3
+MIN_TIMEOUT = 1.0
+
+
+class LatencyHistogram:
+    """Latency of the most recent requests to one endpoint."""
+
+    def __init__(self) -> None:
+        """Initialize an empty histogram."""
+        self._samples: deque[float] = deque(maxlen=WINDOW)
+        self._counts = [0] * (len(BUCKETS) + 1)
+
+    def __len__(self) -> int:
+        """Return the number of requests in the window."""
+        return len(self._samples)
+
+    def record(self, seconds: float) -> None:
+        """Add the latency of a request, dropping the oldest one."""
+        if len(self._samples) == self._samples.maxlen:
+            self._counts[self._bucket(self._samples[0])] -= 1
+        self._samples.append(seconds)
+        self._counts[self._bucket(seconds)] += 1
+
+    def percentile(self, q: float) -> float | None:
+        """Return the upper bound of the bucket holding the q-th percentile."""
+        if not self._samples:
+            return None
+        rank = q * len(self._samples)
+        seen = 0
+        for bound, count in zip(BUCKETS, self._counts, strict=False):
+            seen += count
+            if seen >= rank:
+                return bound
+        return max(self._samples)
+
+    def timeout(self, ceiling: float) -> float:
+        """Return the timeout for a request, at most the caller's ceiling."""
+        p99 = self.percentile(0.99)
+        if len(self._samples) < MIN_SAMPLES or p99 is None:
+            return ceiling
+        return min(ceiling, max(MIN_TIMEOUT, p99 * TIMEOUT_FACTOR))
+
+    def hedge_delay(self) -> float | None:
+        """Return the p95 latency after which a request is sent again."""
+        if len(self._samples) < MIN_SAMPLES:
+            return None
+        return self.percentile(0.95)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the histogram and its percentiles for diagnostics."""
+        labels = [f"<={bound}s" for bound in BUCKETS] + [f">{BUCKETS[-1]}s"]
+        return {
+            "samples": len(self._samples),
+            "p50": self.percentile(0.5),
+            "p95": self.percentile(0.95),
+            "p99": self.percentile(0.99),
+            "buckets": dict(zip(labels, self._counts, strict=True)),
+        }
+
+    @staticmethod
+    def _bucket(seconds: float) -> int:
+        return bisect.bisect_left(BUCKETS, seconds)
@@ -0,0 +1,242 @@
+"""Recipe model shared by the API and website extractors."""
+
+import math
+import unicodedata
+from dataclasses import dataclass, fields
+from typing import Any
+
+# Field names that differ from the state attribute names
+ATTRIBUTE_NAMES = {
+    "total_time": "totalTime",
+    "prep_time": "prepTime",
+    "cook_time": "cookTime",
+    "rest_time": "restTime",
+}
+# Bulky fields left out of compact state attributes, see Recipe.as_attributes
+HEAVY_FIELDS = ("ingredients", "instructions", "top_comments")
+# Structured fields kept next to their display strings, never state attributes
+STRUCTURED_FIELDS = ("ingredient_items", "serving_count")
+# Display strings of the ingredient list mark group headers like this
+GROUP_HEADER_PREFIX = "--- "
+GROUP_HEADER_SUFFIX = " ---"
+
+
+def parse_amount(value: Any) -> float | None:
+    """Return the number a quantity starts with, e.g. 4 for "4 Port.".
+
+    Only needed for values the website gives as text (recipeYield and
+    recipeIngredient of the JSON-LD); the API has numbers. Decimal commas,
+    fractions like 1/2 and vulgar fractions like ½ are understood.
+    """
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, (list, tuple)):
+        return parse_amount(value[0]) if value else None
+    if not isinstance(value, str) or not value.split():
+        return None
+    token = value.split()[0].replace(",", ".")
+    try:
+        return float(token)
+    except ValueError:
+        pass
+    numerator, slash, denominator = token.partition("/")
+    if slash:
+        try:
+            return float(numerator) / float(denominator)
+        except (ValueError, ZeroDivisionError):
+            return None
+    if len(token) == 1:
+        return unicodedata.numeric(token, None)
+    return None
+
+
+def format_amount(amount: float) -> str:
+    """Return a scaled amount with a decimal comma, e.g. 0,33 or 400.
+
+    Two decimals are kept, or two significant digits for smaller amounts so
+    they do not show as 0.
+    """
+    digits = max(2, 1 - math.floor(math.log10(amount)))
+    text = f"{amount:.{digits}f}".rstrip("0").rstrip(".")
+    return text.replace(".", ",")
+
+
+@dataclass(frozen=True, slots=True)
+class Ingredient:
+    """An ingredient with its quantity, so it can be scaled by arithmetic.
+
+    Ingredients taken from the website only have their text, so everything
+    after a leading amount ends up in the name and the unit stays empty.
+    """
+
+    name: str
+    amount: float | None = None
+    unit: str = ""
+    usage: str = ""
+    group: str = ""
+
+    @classmethod
+    def parse(cls, text: str, group: str = "") -> "Ingredient":
+        """Return an ingredient from its display string, e.g. "400 g Mehl"."""
+        first, _, rest = text.strip().partition(" ")
+        amount = parse_amount(first)
+        if amount is None or not rest.strip():
+            return cls(name=text.strip(), group=group)
+        return cls(name=rest.strip(), amount=amount, group=group)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "Ingredient":
+        """Return an ingredient from its stored form."""
+        return cls(**{key: data[key] for key in _INGREDIENT_FIELDS if key in data})
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return all fields, to store the ingredient."""
+        return {name: getattr(self, name) for name in _INGREDIENT_FIELDS}
+
+    def text(self, factor: float = 1.0) -> str:
+        """Return the display string, with the amount multiplied by factor.
+
+        Amounts are shown as the API gives them, scaled ones as on the website.
+        """
+        amount = ""
+        if self.amount and factor == 1:
+            amount = f"{self.amount:g}"
+        elif self.amount:
+            amount = format_amount(self.amount * factor)
+        name = f"{self.name} ({self.usage})" if self.usage else self.name
+        return " ".join(part for part in (amount, self.unit, name) if part)
+
+
+@dataclass(frozen=True, slots=True)
+class Recipe:
+    """A recipe, or the error that occurred while fetching one.
+
+    Instances are immutable, so the coordinator data, the reload cache and the
+    recipe store share them instead of copying. List values are tuples for
+    the same reason. Values taken from the JSON-LD of a recipe page are kept
+    as they are, hence the Any annotations.
+    """
+
+    title: str = ""
+    subtitle: str = ""
+    url: str = ""
+    image_url: str = ""
+    calories: Any = ""
+    protein: Any = ""
+    fat: Any = ""
+    carbohydrates: Any = ""
+    cuisine: Any = ""
+    video_url: str = ""
+    video_id: str = ""
+    difficulty: Any = ""
+    ingredients: tuple[str, ...] = ()
+    ingredient_items: tuple[Ingredient, ...] = ()
+    instructions: str = ""
+    category: Any = ""
+    category_breadcrumb: tuple[str, ...] = ()
+    servings: Any = ""
+    serving_count: float | None = None
+    author: str = ""
+    author_notes: str = ""
+    publisher: str = ""
+    keywords: Any = ""
+    tags: tuple[str, ...] = ()
+    saved_recipes_count: int | None = None
+    view_count: int | None = None
+    top_comments: tuple[str, ...] = ()
+    date_published: str = ""
+    total_time: str = ""
+    prep_time: str = ""
+    cook_time: str = ""
+    rest_time: str = ""
+    rating: Any = None
+    rating_count: Any = None
+    number_reviews: Any = None
+    status: str = "success"
+    error_message: str = ""
+    # True while the recipe comes from before a restart and is not revalidated
+    stale: bool = False
+    # True if the comments were left out because they came too late
+    partial: bool = False
+
+    @classmethod
+    def error(
+        cls, title: str, message: str, url: str = "", status: str = "error"
+    ) -> "Recipe":
+        """Return the placeholder shown when no recipe could be fetched."""
+        return cls(title=title, url=url, status=status, error_message=message)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "Recipe":
+        """Return a recipe from its stored form (or former state attributes).
+
+        Recipes stored before the structured fields existed get them parsed
+        from their display strings.
+        """
+        stored_names = {value: key for key, value in ATTRIBUTE_NAMES.items()}
+        values: dict[str, Any] = {}
+        for key, value in data.items():
+            key = stored_names.get(key, key)
+            if key not in _FIELDS:
+                continue
+            values[key] = tuple(value) if isinstance(value, list) else value
+        if "ingredient_items" in values:
+            values["ingredient_items"] = tuple(
+                Ingredient.from_dict(item) for item in values["ingredient_items"]
+            )
+        else:
+            values["ingredient_items"] = parse_ingredients(
+                values.get("ingredients", ())
+            )
+        if "serving_count" not in values:
+            values["serving_count"] = parse_amount(values.get("servings"))
+        return cls(**values)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return all fields, to store the recipe or show it in diagnostics."""
+        values = {name: getattr(self, name) for name in _FIELDS}
+        values["ingredient_items"] = [item.as_dict() for item in self.ingredient_items]
+        return values
+
+    def as_attributes(self, compact: bool = False) -> dict[str, Any]:
+        """Return the state attributes of a sensor showing this recipe.
+
+        Compact attributes leave out the HEAVY_FIELDS, which are available
+        through the get_recipe service instead.
+        """
+        attributes: dict[str, Any] = {}
+        for name in _COMPACT_FIELDS if compact else _ATTRIBUTE_FIELDS:
+            value = getattr(self, name)
+            if value is None or value == "" or value == ():
+                continue
+            attributes[ATTRIBUTE_NAMES.get(name, name)] = value
+        if self.rating_count is not None:
+            attributes["number_ratings"] = self.rating_count
+        if self.stale:
+            attributes["stale"] = True
+        return attributes
+
+
+def parse_ingredients(lines: Any) -> tuple[Ingredient, ...]:
+    """Return the ingredients of display strings, following group headers."""
+    items = []
+    group = ""
+    for line in lines:
+        line = str(line).strip()
+        if line.startswith(GROUP_HEADER_PREFIX) and line.endswith(GROUP_HEADER_SUFFIX):
+            group = line[len(GROUP_HEADER_PREFIX) : -len(GROUP_HEADER_SUFFIX)]
+        elif line:
+            items.append(Ingredient.parse(line, group))
+    return tuple(items)
+
+
+_INGREDIENT_FIELDS = tuple(field.name for field in fields(Ingredient))
+_FIELDS = tuple(field.name for field in fields(Recipe))
+_ATTRIBUTE_FIELDS = tuple(
+    name
+    for name in _FIELDS
+    if name not in ("title", "status", "stale", "partial", *STRUCTURED_FIELDS)
+)
+_COMPACT_FIELDS = tuple(name for name in _ATTRIBUTE_FIELDS if name not in HEAVY_FIELDS)
@@ -0,0 +1,119 @@
+"""Per-host rate limiting for requests to Chefkoch."""
+
+import asyncio
+import logging
+import time
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit
+
+_LOGGER = logging.getLogger(__name__)
+
+# Statuses that signal throttling by the server
+THROTTLE_STATUSES = (429, 503)
+# Lowest rate (requests per second) the limiter backs off to
+MIN_RATE = 0.1
+# Longest Retry-After (seconds) that is honoured
+MAX_RETRY_AFTER = 300
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Return the seconds to wait from a Retry-After header."""
+    if not value:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=UTC)
+        seconds = (retry_at - datetime.now(UTC)).total_seconds()
+    return min(max(seconds, 0), MAX_RETRY_AFTER)
+
+
+class TokenBucket:
+    """Token bucket whose rate adapts to throttling by the server.
+
+    The rate is halved whenever the server throttles and grows back in small
+    steps with every successful request (AIMD), so it settles just below the
+    rate the server accepts.
+    """
+
+    def __init__(self, rate: float, burst: int) -> None:
+        """Initialize the bucket."""
+        self.max_rate = rate
+        self.rate = rate
+        self._capacity = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a request may be sent."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._paused_until:
+                    await asyncio.sleep(self._paused_until - now)
+                    continue
+                self._tokens = min(
+                    self._capacity, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+    def throttled(self, retry_after: float | None) -> None:
+        """Slow down after the server throttled a request."""
+        self.rate = max(self.rate / 2, MIN_RATE)
+        self._tokens = 0
+        self._updated = time.monotonic()
+        pause = retry_after if retry_after is not None else 1 / self.rate
+        self._paused_until = max(self._paused_until, self._updated + pause)
+
+    def succeeded(self) -> None:
+        """Speed up again after a request that was not throttled."""
+        self.rate = min(self.max_rate, self.rate + self.max_rate / 20)
+
+
+class RateLimiter:
+    """One token bucket per upstream host."""
+
+    def __init__(self, rate: float) -> None:
+        """Initialize the limiter with the maximum rate per host."""
+        self._rate = rate
+        self._buckets: dict[str, TokenBucket] = {}
+
+    def _bucket(self, url: str) -> TokenBucket:
+        host = urlsplit(url).netloc
+        if (bucket := self._buckets.get(host)) is None:
+            bucket = self._buckets[host] = TokenBucket(
+                self._rate, max(1, round(self._rate))
+            )
+        return bucket
+
+    async def acquire(self, url: str) -> None:
+        """Wait until a request to the host of url may be sent."""
+        await self._bucket(url).acquire()
+
+    def observe(self, url: str, status: int, headers: dict[str, str]) -> None:
+        """Adapt the rate of the host of url to a response."""
+        bucket = self._bucket(url)
+        if status in THROTTLE_STATUSES:
+            retry_after = parse_retry_after(headers.get("retry-after"))
+            bucket.throttled(retry_after)
+            _LOGGER.warning(
+                "Chefkoch throttled a request to %s (HTTP %s), slowing down to "
+                "%.2f requests per second",
+                urlsplit(url).netloc,
+                status,
+                bucket.rate,
+            )
+        else:
+            bucket.succeeded()
@@ -0,0 +1,59 @@
+"""Reservoir of search candidates for random recipe sensors."""
+
+import random
+import time
+from typing import Any
+
+# Search results requested per refill
+PAGE_SIZE = 100
+# A reservoir is refilled once fewer candidates are left or it is older (seconds)
+MIN_CANDIDATES = 5
+MAX_AGE = 7 * 24 * 3600
+
+
+class RecipeReservoir:
+    """Non-Plus candidates of one search page, drawn without replacement.
+
+    Every refill requests the following result page, so a sensor walks through
+    the whole result list instead of the first few results.
+    """
+
+    def __init__(self, settings: dict[str, Any]) -> None:
+        """Initialize an empty reservoir for a sensor's search settings."""
+        self.settings = settings
+        self.offset = 0
+        self._candidates: list[tuple[str, str]] = []
+        self._filled = 0.0
+
+    def __len__(self) -> int:
+        """Return the number of candidates left."""
+        return len(self._candidates)
+
+    def needs_refill(self) -> bool:
+        """Return True if the reservoir runs low or expired."""
+        return (
+            len(self._candidates) < MIN_CANDIDATES
+            or time.time() - self._filled > MAX_AGE
+        )
+
+    def fill(
+        self, candidates: list[tuple[str, str]], page_size: int, total: int | None
+    ) -> None:
+        """Add the candidates of a new result page and advance the offset."""
+        now = time.time()
+        if now - self._filled > MAX_AGE:
+            self._candidates = []
+        new = [c for c in candidates if c not in self._candidates]
+        random.shuffle(new)
+        # Leftovers are drawn first
+        self._candidates = new + self._candidates
+        self._filled = now
+        self.offset += page_size
+        if not total or self.offset >= total:
+            self.offset = 0
+
+    def draw(self) -> tuple[str, str] | None:
+        """Remove and return a random candidate."""
+        if not self._candidates:
+            return None
+        return self._candidates.pop()
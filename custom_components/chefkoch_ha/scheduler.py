@@ -0,0 +1,84 @@
+"""Per-sensor refresh scheduling for Chefkoch."""
+
+import hashlib
+import math
+import random
+from datetime import timedelta
+from typing import Any
+
+# Shortest delay between two scheduled refreshes
+MIN_REFRESH_DELAY = timedelta(minutes=1)
+# Largest random delay added to a staggered refresh, as a fraction of the interval
+JITTER_FRACTION = 0.05
+
+
+class SensorScheduler:
+    """Track when each sensor last got a new recipe and which sensors are due.
+
+    Every sensor refreshes on its own interval (the "update_interval" of its
+    config, in hours) and falls back to the interval of the config entry.
+
+    With a stagger seed, refreshes are not due a full interval after the last
+    one but at a fixed offset within each interval, derived from the seed and
+    the sensor ID, plus a little jitter. Sensors (and Home Assistant instances
+    with different seeds) then spread their requests over the interval.
+    """
+
+    def __init__(
+        self, default_interval: timedelta, stagger_seed: str | None = None
+    ) -> None:
+        """Initialize the scheduler."""
+        self.default_interval = default_interval
+        self._stagger_seed = stagger_seed
+        self._last_update: dict[str, float] = {}
+
+    def interval(self, sensor_config: dict[str, Any]) -> timedelta:
+        """Return the refresh interval of a sensor."""
+        if hours := sensor_config.get("update_interval"):
+            return timedelta(hours=hours)
+        return self.default_interval
+
+    def mark_updated(self, sensor_id: str, timestamp: float) -> None:
+        """Record that a sensor was refreshed."""
+        self._last_update[sensor_id] = timestamp
+
+    def forget(self, sensor_id: str) -> None:
+        """Make a sensor due on the next refresh."""
+        self._last_update.pop(sensor_id, None)
+
+    def due(self, sensors: list[dict[str, Any]], now: float) -> list[dict[str, Any]]:
+        """Return the sensors that need a new recipe."""
+        return [
+            sensor_config
+            for sensor_config in sensors
+            if self._next_update(sensor_config) <= now
+        ]
+
+    def next_refresh(self, sensors: list[dict[str, Any]], now: float) -> timedelta:
+        """Return the time until the next sensor is due."""
+        if not sensors:
+            return self.default_interval
+        delay = min(self._next_update(s) for s in sensors) - now
+        return max(timedelta(seconds=delay), MIN_REFRESH_DELAY)
+
+    def _next_update(self, sensor_config: dict[str, Any]) -> float:
+        last_update = self._last_update.get(sensor_config["id"])
+        if last_update is None:
+            return 0
+        interval = self.interval(sensor_config).total_seconds()
+        if self._stagger_seed is None:
+            return last_update + interval
+        return self._next_slot(sensor_config["id"], last_update, interval)
+
+    def _next_slot(self, sensor_id: str, last_update: float, interval: float) -> float:
+        """Return the first staggered slot of a sensor after its last update."""
+        seed = f"{self._stagger_seed}:{sensor_id}"
+        digest = hashlib.sha256(seed.encode()).digest()
+        offset = int.from_bytes(digest[:8]) / 2**64 * interval
+        slot = math.floor((last_update - offset) / interval) + 1
+        if slot * interval + offset - last_update < interval / 2:
+            # Too close to the last update (e.g. a new or forced refresh)
+            slot += 1
+        # The jitter is fixed per slot, so the due time does not move between calls
+        jitter = random.Random(f"{seed}:{slot}").uniform(0, JITTER_FRACTION)
+        return slot * interval + offset + jitter * interval
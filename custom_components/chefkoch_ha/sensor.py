@@ -9,30 +9,78 @@ from homeassistant.helpers.update_coordinator import (
     DataUpdateCoordinator,
 )
 
-from .const import DOMAIN
+from .const import (
+    DEFAULT_COMPACT_ATTRIBUTES,
+    DEFAULT_RECORD_RECIPE_DETAILS,
+    DOMAIN,
+    UNRECORDED_ATTRIBUTES,
+)
+from .models import Recipe
 
 _LOGGER = logging.getLogger(__name__)
 
 
 async def async_setup_entry(hass, entry, async_add_entities):
     """Set up the Chefkoch sensor platform."""
-    coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+    entry_data = hass.data[DOMAIN][entry.entry_id]
+    coordinator = entry_data["coordinator"]
+    entities: dict[str, ChefkochSensor] = {}
+    compact = entry.options.get("compact_attributes", DEFAULT_COMPACT_ATTRIBUTES)
+    sensor_class = (
+        RecordedChefkochSensor
+        if entry.options.get("record_recipe_details", DEFAULT_RECORD_RECIPE_DETAILS)
+        else ChefkochSensor
+    )
+
+    def add_sensors(sensor_configs):
+        """Add entities for sensors configured after setup."""
+        new_entities = [
+            sensor_class(coordinator, sensor_config, compact=compact)
+            for sensor_config in sensor_configs
+        ]
+        entities.update((entity.sensor_id, entity) for entity in new_entities)
+        async_add_entities(new_entities)
+
+    # Used by the options listener to apply sensor changes without a reload
+    entry_data["entities"] = entities
+    entry_data["add_sensors"] = add_sensors
 
     sensors = entry.options.get("sensors", [])
     if not sensors:
         _LOGGER.warning("No sensors configured for Chefkoch integration.")
         return
 
-    entities = [ChefkochSensor(coordinator, sensor_config) for sensor_config in sensors]
-    async_add_entities(entities)
+    add_sensors(sensors)
 
 
 class ChefkochSensor(CoordinatorEntity, SensorEntity):
     """Representation of a Chefkoch sensor."""
 
-    def __init__(self, coordinator: DataUpdateCoordinator, sensor_config: dict):
-        """Initialize the sensor."""
+    # Written to the recorder on every new recipe, but hardly useful in history
+    _unrecorded_attributes = UNRECORDED_ATTRIBUTES
+
+    def __init__(
+        self,
+        coordinator: DataUpdateCoordinator,
+        sensor_config: dict,
+        compact: bool = False,
+    ):
+        """Initialize the sensor.
+
+        With compact, the bulky recipe fields are left out of the state
+        attributes and only available through the get_recipe service.
+        """
         super().__init__(coordinator)
+        self._compact = compact
+        self.update_config(sensor_config)
+        self._attr_icon = "mdi:chef-hat"
+        self._attr_unique_id = f"chefkoch_{sensor_config['id']}"
+        # Attributes of the recipe shown last, built once per recipe
+        self._recipe: Recipe | None = None
+        self._attributes: dict = {}
+
+    def update_config(self, sensor_config: dict):
+        """Apply a new sensor config."""
         self.sensor_config = sensor_config
 
         name = sensor_config["name"]
@@ -42,9 +90,6 @@ class ChefkochSensor(CoordinatorEntity, SensorEntity):
         else:
             self._attr_name = name
 
-        self._attr_icon = "mdi:chef-hat"
-        self._attr_unique_id = f"chefkoch_{sensor_config['id']}"
-
     @property
     def device_info(self) -> DeviceInfo:
         """Return device information."""
@@ -64,20 +109,22 @@ class ChefkochSensor(CoordinatorEntity, SensorEntity):
     @property
     def native_value(self):
         """Return the state of the sensor."""
-        data = self.coordinator.data.get(self.sensor_id, {})
-        return data.get("title", "unknown")
+        recipe = self.coordinator.data.get(self.sensor_id)
+        return recipe.title if recipe is not None else "unknown"
 
     @property
     def extra_state_attributes(self):
         """Return the state attributes."""
-        data = self.coordinator.data.get(self.sensor_id, {})
+        recipe = self.coordinator.data.get(self.sensor_id)
+        if recipe is None:
+            return {}
+        if recipe is not self._recipe:
+            self._recipe = recipe
+            self._attributes = recipe.as_attributes(self._compact)
+        return self._attributes
+
 
-        attributes = {
-            key: value
-            for key, value in data.items()
-            if value is not None and value != "" and value != []
-        }
-        attributes.pop("title", None)
-        attributes.pop("status", None)
+class RecordedChefkochSensor(ChefkochSensor):
+    """Chefkoch sensor that records all of its attributes."""
 
-        return attributes
+    _unrecorded_attributes = frozenset()
@@ -0,0 +1,136 @@
+"""Persistent recipe cache for Chefkoch."""
+
+import time
+from collections import OrderedDict
+from dataclasses import replace
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+from .models import Recipe
+
+STORAGE_VERSION = 1
+# Seconds to collect changes before they are written to disk
+SAVE_DELAY = 30
+
+
+def recipe_settings(sensor_config: dict[str, Any]) -> dict[str, Any]:
+    """Return the settings of a sensor config that decide which recipe it shows."""
+    return {
+        key: value
+        for key, value in sensor_config.items()
+        if key not in ("name", "update_interval")
+    }
+
+
+class RecipeStore:
+    """Recipes keyed by recipe ID, persisted across restarts.
+
+    Recipes expire after the TTL and the least recently used ones are evicted
+    once the size cap is reached. Expired recipes are only kept to restore
+    sensors with until they are fetched again. The recipe each sensor showed
+    last is kept as well, so sensors can come up again without any request.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, entry_id: str, *, ttl: float, max_recipes: int
+    ) -> None:
+        """Initialize the store."""
+        self._store: Store = Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}")
+        self._ttl = ttl
+        self._max_recipes = max_recipes
+        self._recipes: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        self._sensors: dict[str, dict[str, Any]] = {}
+
+    async def async_load(self) -> None:
+        """Load the recipes from disk.
+
+        Expired recipes are loaded as well, so sensors can show them until
+        they are fetched again, but get() does not return them.
+        """
+        data = await self._store.async_load() or {}
+        for recipe_id, item in data.get("recipes", {}).items():
+            self._recipes[recipe_id] = {
+                "fetched": item["fetched"],
+                "recipe": Recipe.from_dict(item["attributes"]),
+            }
+        self._evict()
+        self._sensors = data.get("sensors", {})
+
+    async def async_save(self) -> None:
+        """Write the store to disk now."""
+        await self._store.async_save(self._data_to_save())
+
+    def get(self, recipe_id: str) -> Recipe | None:
+        """Return a recipe if it is cached and fresh."""
+        item = self._recipes.get(recipe_id)
+        if item is None:
+            return None
+        if time.time() - item["fetched"] >= self._ttl:
+            return None
+        self._recipes.move_to_end(recipe_id)
+        return item["recipe"]
+
+    def put(self, recipe_id: str, recipe: Recipe) -> None:
+        """Cache a recipe."""
+        self._recipes[recipe_id] = {"fetched": time.time(), "recipe": recipe}
+        self._recipes.move_to_end(recipe_id)
+        self._evict()
+        self._schedule_save()
+
+    def set_sensor_recipe(
+        self, sensor_config: dict[str, Any], recipe_id: str | None, updated: float
+    ) -> None:
+        """Remember the recipe a sensor shows."""
+        if recipe_id is None:
+            self._sensors.pop(sensor_config["id"], None)
+        else:
+            self._sensors[sensor_config["id"]] = {
+                "config": sensor_config,
+                "recipe_id": recipe_id,
+                "updated": updated,
+            }
+        self._schedule_save()
+
+    def restore_sensors(
+        self, sensors: list[dict[str, Any]]
+    ) -> dict[str, tuple[float, Recipe]]:
+        """Return the last update time and recipe of the sensors that can be restored.
+
+        A sensor cannot be restored if its search settings changed or its
+        recipe is no longer cached. Expired recipes are returned marked stale.
+        """
+        restored: dict[str, tuple[float, Recipe]] = {}
+        now = time.time()
+        for sensor_config in sensors:
+            item = self._sensors.get(sensor_config["id"])
+            if item is None or recipe_settings(item["config"]) != recipe_settings(
+                sensor_config
+            ):
+                continue
+            if (cached := self._recipes.get(item["recipe_id"])) is None:
+                continue
+            recipe = cached["recipe"]
+            if now - cached["fetched"] >= self._ttl:
+                recipe = replace(recipe, stale=True)
+            restored[sensor_config["id"]] = (item["updated"], recipe)
+        return restored
+
+    def _evict(self) -> None:
+        while len(self._recipes) > self._max_recipes:
+            self._recipes.popitem(last=False)
+
+    def _schedule_save(self) -> None:
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    def _data_to_save(self) -> dict[str, Any]:
+        recipes = {
+            recipe_id: {
+                "fetched": item["fetched"],
+                "attributes": item["recipe"].as_dict(),
+            }
+            for recipe_id, item in self._recipes.items()
+        }
+        return {"recipes": recipes, "sensors": self._sensors}
@@ -0,0 +1,92 @@
+"""Benchmark the JSON-LD extraction of recipe pages.
+
+Compares the byte scanner used by the integration with the previous
+BeautifulSoup based extraction and checks that both return the same result.
+
+Usage:
+    python scripts/benchmark_json_ld.py [recorded_page.html ...]
+
+Pass recipe pages saved from chefkoch.de (e.g. with "curl -o"). Without
+arguments a synthetic page of realistic size is used.
+"""
+
+import importlib.util
+import json
+import os
+import sys
+import timeit
+from functools import partial
+
+MODULE_FILE = os.path.join("custom_components", "chefkoch_ha", "jsonld.py")
+ROUNDS = 20
+
+
+def load_jsonld_module():
+    """Load jsonld.py without importing Home Assistant."""
+    spec = importlib.util.spec_from_file_location("chefkoch_jsonld", MODULE_FILE)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def synthetic_page() -> bytes:
+    """Build a page resembling a Chefkoch recipe page (~400 KB)."""
+    recipe = {
+        "@context": "https://schema.org",
+        "@type": "Recipe",
+        "name": "Spaghetti Carbonara von Benchmark",
+        "image": ["https://img.chefkoch-cdn.de/rezepte/1/bilder/2/crop-960x720/x.jpg"],
+        "recipeIngredient": [f"{i} g Zutat {i}" for i in range(1, 25)],
+        "recipeInstructions": [
+            {"@type": "HowToStep", "text": "Lorem ipsum dolor sit amet. " * 20}
+            for _ in range(10)
+        ],
+        "aggregateRating": {"ratingValue": 4.7, "ratingCount": 1234},
+    }
+    breadcrumb = {"@context": "https://schema.org", "@type": "BreadcrumbList"}
+    state = {"props": {"items": [{"id": i, "text": "x" * 200} for i in range(800)]}}
+    head = "".join(f'<meta name="meta-{i}" content="value {i}">' for i in range(60)) + (
+        '<meta property="og:image" content="https://img.chefkoch-cdn.de/og.jpg">'
+        f'<script type="application/ld+json">{json.dumps(breadcrumb)}</script>'
+        f'<script type="application/ld+json">{json.dumps(recipe)}</script>'
+        f"<script>window.__STATE__ = {json.dumps(state)};</script>"
+    )
+    body = "".join(
+        f'<div class="ds-box"><a href="/rezepte/{i}/">Rezept {i}</a>'
+        f"<span>{'Text ' * 20}</span></div>"
+        for i in range(1500)
+    )
+    return f"<html><head>{head}</head><body>{body}</body></html>".encode()
+
+
+def main() -> None:
+    """Run the benchmark."""
+    jsonld = load_jsonld_module()
+    pages = {"synthetic": synthetic_page()}
+    for path in sys.argv[1:]:
+        with open(path, "rb") as file:
+            pages[os.path.basename(path)] = file.read()
+
+    for name, body in pages.items():
+        fast = jsonld.find_recipe_json_ld(body)
+        soup = jsonld.find_recipe_json_ld_soup(body)
+        if fast != soup:
+            print(f"{name}: results differ!")
+            continue
+
+        fast_time = timeit.timeit(
+            partial(jsonld.find_recipe_json_ld, body), number=ROUNDS
+        )
+        soup_time = timeit.timeit(
+            partial(jsonld.find_recipe_json_ld_soup, body), number=ROUNDS
+        )
+        print(
+            f"{name} ({len(body) / 1024:.0f} KB): "
+            f"BeautifulSoup {soup_time / ROUNDS * 1000:.2f} ms, "
+            f"byte scanner {fast_time / ROUNDS * 1000:.2f} ms "
+            f"({soup_time / fast_time:.0f}x faster)"
+        )
+
+
+if __name__ == "__main__":
+    main()
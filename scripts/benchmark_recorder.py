@@ -0,0 +1,110 @@
+"""Benchmark the size of the sensor attributes written to the recorder.
+
+Serializes the state attributes of a typical recipe like the recorder does
+(compact JSON) and compares all attributes with the ones that are recorded
+by default, with and without compact attributes.
+
+Usage:
+    python scripts/benchmark_recorder.py [state_writes_per_day]
+
+State writes per day default to 24 (a random sensor updating hourly).
+"""
+
+import importlib.util
+import json
+import os
+import sys
+
+PACKAGE_DIR = os.path.join("custom_components", "chefkoch_ha")
+
+
+def load_module(name: str):
+    """Load a module of the integration without importing Home Assistant."""
+    spec = importlib.util.spec_from_file_location(
+        f"chefkoch_{name}", os.path.join(PACKAGE_DIR, f"{name}.py")
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def typical_recipe(models):
+    """Build a recipe of typical size (ingredients, steps and comments)."""
+    return models.Recipe(
+        title="Spaghetti Carbonara",
+        subtitle="Der Klassiker aus Rom, ganz ohne Sahne",
+        url="https://www.chefkoch.de/rezepte/1234567890/Spaghetti-Carbonara.html",
+        image_url=(
+            "https://img.chefkoch-cdn.de/rezepte/1234567890/bilder/1234567/"
+            "crop-900x600/spaghetti-carbonara.jpg"
+        ),
+        calories="582 kcal",
+        protein="27.67 g",
+        fat="24.2 g",
+        carbohydrates="62.1 g",
+        cuisine="Italien",
+        difficulty="normal",
+        ingredients=tuple(
+            f"{amount} {unit} Zutat mit etwas längerem Namen {i} (gewürfelt)"
+            for i, (amount, unit) in enumerate([("200", "g"), ("1", "EL")] * 7)
+        ),
+        instructions="\n".join(
+            f"Schritt {i}: " + "Die Zutaten vorbereiten und gut verrühren. " * 6
+            for i in range(1, 9)
+        ),
+        category_breadcrumb=("Rezepte", "Menüart", "Hauptspeise", "Nudeln"),
+        servings="4 Port.",
+        author="ChefMaster",
+        author_notes="Schmeckt auch mit Guanciale statt Pancetta. " * 3,
+        publisher="Chefkoch",
+        keywords="Pasta, Italien, Hauptspeise, Schnell, Einfach, Eier, Käse",
+        tags=("Pasta", "Italien", "Hauptspeise", "Schnell", "Einfach", "Eier"),
+        saved_recipes_count=116412,
+        view_count=3965603,
+        top_comments=tuple(
+            f"Nutzer{i}: " + "Sehr lecker, gelingt immer und geht schnell. " * 4
+            for i in range(5)
+        ),
+        date_published="2005-03-01T12:00:00.000+01:00",
+        total_time="0:30:00",
+        prep_time="0:15:00",
+        cook_time="0:15:00",
+        rating=4.7,
+        rating_count=2345,
+    )
+
+
+def recorded_size(attributes: dict, unrecorded: frozenset) -> int:
+    """Return the bytes of the attributes the recorder stores."""
+    recorded = {k: v for k, v in attributes.items() if k not in unrecorded}
+    return len(json.dumps(recorded, separators=(",", ":"), ensure_ascii=False))
+
+
+def main() -> None:
+    """Run the benchmark."""
+    writes_per_day = int(sys.argv[1]) if len(sys.argv) > 1 else 24
+    models = load_module("models")
+    const = load_module("const")
+    recipe = typical_recipe(models)
+
+    full = recipe.as_attributes()
+    compact = recipe.as_attributes(compact=True)
+    baseline = recorded_size(full, frozenset())
+    results = {
+        "all attributes recorded": baseline,
+        "default (unrecorded attributes)": recorded_size(
+            full, const.UNRECORDED_ATTRIBUTES
+        ),
+        "compact_attributes, all recorded": recorded_size(compact, frozenset()),
+    }
+
+    for name, size in results.items():
+        print(
+            f"{name}: {size} bytes per state write, "
+            f"{size * writes_per_day * 365 / 1024 / 1024:.1f} MB per sensor and year "
+            f"({100 - size / baseline * 100:.0f}% smaller)"
+        )
+
+
+if __name__ == "__main__":
+    main()
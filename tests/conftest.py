@@ -1,3 +1,13 @@
 """Pytest configuration and global mocks."""
 
+import sys
+
+import pytest
+
 from . import mock_ha  # noqa: F401
+
+
+@pytest.fixture(autouse=True)
+def clear_storage():
+    """Start every test with empty persistent storage."""
+    sys.modules["homeassistant.helpers.storage"].Store.saved.clear()
@@ -1,5 +1,6 @@
 import sys
 import types
+from typing import ClassVar
 from unittest.mock import MagicMock
 
 
@@ -57,6 +58,7 @@ def setup_mocks():
                     "step_id": step_id,
                     "data_schema": data_schema,
                     "errors": errors,
+                    "description_placeholders": description_placeholders,
                     "last_step": last_step,
                 }
             )
@@ -94,6 +96,9 @@ def setup_mocks():
     ha_core = types.ModuleType("homeassistant.core")
     ha_core.HomeAssistant = MagicMock
     ha_core.callback = lambda x: x
+    ha_core.SupportsResponse = types.SimpleNamespace(
+        NONE="none", OPTIONAL="optional", ONLY="only"
+    )
     sys.modules["homeassistant.core"] = ha_core
     ha.core = ha_core
 
@@ -132,6 +137,9 @@ def setup_mocks():
             if self.update_method:
                 self.data = await self.update_method()
 
+        def async_set_updated_data(self, data):
+            self.data = data
+
     # Mock other helpers
     ha_helpers = MagicMock()
     sys.modules["homeassistant.helpers"] = ha_helpers
@@ -147,6 +155,36 @@ def setup_mocks():
     sys.modules["homeassistant.helpers.device_registry"] = ha_helpers_dr
     ha_helpers.device_registry = ha_helpers_dr
 
+    ha_helpers_er = MagicMock()
+    sys.modules["homeassistant.helpers.entity_registry"] = ha_helpers_er
+    ha_helpers.entity_registry = ha_helpers_er
+
+    ha_helpers_aiohttp = MagicMock()
+    sys.modules["homeassistant.helpers.aiohttp_client"] = ha_helpers_aiohttp
+    ha_helpers.aiohttp_client = ha_helpers_aiohttp
+
+    class MockStore:
+        """In-memory Store; data written under a key is kept for the test session."""
+
+        saved: ClassVar[dict] = {}
+
+        def __init__(self, hass, version, key):
+            self.key = key
+
+        async def async_load(self):
+            return MockStore.saved.get(self.key)
+
+        async def async_save(self, data):
+            MockStore.saved[self.key] = data
+
+        def async_delay_save(self, data_func, delay=0):
+            MockStore.saved[self.key] = data_func()
+
+    ha_helpers_storage = MagicMock()
+    ha_helpers_storage.Store = MockStore
+    sys.modules["homeassistant.helpers.storage"] = ha_helpers_storage
+    ha_helpers.storage = ha_helpers_storage
+
     ha_helpers_cv = MagicMock()
     sys.modules["homeassistant.helpers.config_validation"] = ha_helpers_cv
     ha_helpers.config_validation = ha_helpers_cv
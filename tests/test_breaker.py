@@ -0,0 +1,116 @@
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+import requests
+
+from custom_components.chefkoch_ha.api import (
+    ChefkochClient,
+    ChefkochRequestError,
+    CircuitOpenError,
+)
+from custom_components.chefkoch_ha.breaker import (
+    CLOSED,
+    FAILURE_THRESHOLD,
+    HALF_OPEN,
+    OPEN,
+    CircuitBreaker,
+    endpoint_of,
+)
+
+from . import mock_ha  # noqa: F401
+
+
+def test_endpoint_of():
+    """Test requests for the same kind of resource share an endpoint."""
+    assert endpoint_of("https://api.chefkoch.de/v2/recipes") == (
+        "api.chefkoch.de/v2/recipes"
+    )
+    assert endpoint_of("https://api.chefkoch.de/v2/recipes/123/comments") == (
+        "api.chefkoch.de/v2/recipes/{id}/comments"
+    )
+    assert endpoint_of("https://www.chefkoch.de/rezepte/123/pasta.html") == (
+        "www.chefkoch.de/rezepte/{id}"
+    )
+
+
+def test_circuit_breaker_states():
+    """Test the circuit opens, lets a single trial through and closes again."""
+    breaker = CircuitBreaker("api", failure_threshold=2, reset_timeout=60)
+    with patch(
+        "custom_components.chefkoch_ha.breaker.time.monotonic", return_value=0
+    ) as monotonic:
+        breaker.record_failure()
+        assert breaker.allow()
+        breaker.record_failure()
+        assert breaker.state == OPEN
+        assert not breaker.allow()
+
+        monotonic.return_value = 61
+        assert breaker.allow()
+        assert breaker.state == HALF_OPEN
+        # Only one trial request at a time
+        assert not breaker.allow()
+        breaker.record_failure()
+        assert breaker.state == OPEN
+        assert not breaker.allow()
+
+        monotonic.return_value = 122
+        assert breaker.allow()
+        breaker.record_success()
+        assert breaker.state == CLOSED
+
+    transitions = [(t["from"], t["to"]) for t in breaker.as_dict()["transitions"]]
+    assert transitions == [
+        (CLOSED, OPEN),
+        (OPEN, HALF_OPEN),
+        (HALF_OPEN, OPEN),
+        (OPEN, HALF_OPEN),
+        (HALF_OPEN, CLOSED),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_client_skips_failing_endpoint():
+    """Test an open circuit fails fast and only for the failing endpoint."""
+    hass = MagicMock()
+    hass.async_add_executor_job = AsyncMock(side_effect=lambda func, *args: func(*args))
+    client = ChefkochClient(hass, use_async=False)
+    url = "https://api.chefkoch.de/v2/recipes/123"
+
+    with patch(
+        "requests.get", side_effect=requests.ConnectionError("down")
+    ) as mock_get:
+        for _ in range(FAILURE_THRESHOLD):
+            with pytest.raises(ChefkochRequestError, match="down"):
+                await client.async_get(url)
+        with pytest.raises(CircuitOpenError):
+            await client.async_get("https://api.chefkoch.de/v2/recipes/456")
+    assert mock_get.call_count == FAILURE_THRESHOLD
+
+    circuits = client.circuit_diagnostics()
+    assert circuits["api.chefkoch.de/v2/recipes/{id}"]["state"] == OPEN
+
+    ok = MagicMock(status_code=200, headers={}, content=b"{}")
+    with patch("requests.get", return_value=ok):
+        response = await client.async_get("https://api.chefkoch.de/v2/recipes")
+    assert response.status == 200
+
+
+@pytest.mark.asyncio
+async def test_open_circuit_serves_stored_response():
+    """Test a revalidated request returns the stored response while open."""
+    hass = MagicMock()
+    hass.async_add_executor_job = AsyncMock(side_effect=lambda func, *args: func(*args))
+    client = ChefkochClient(hass, use_async=False)
+    url = "https://api.chefkoch.de/v2/recipes/123"
+    ok = MagicMock(status_code=200, headers={"ETag": '"v1"'}, content=b'{"a": 1}')
+
+    with patch("requests.get", return_value=ok):
+        await client.async_get(url, revalidate=True)
+    for _ in range(FAILURE_THRESHOLD):
+        client._breaker(url).record_failure()
+
+    with patch("requests.get") as mock_get:
+        response = await client.async_get(url, revalidate=True)
+    mock_get.assert_not_called()
+    assert response.json() == {"a": 1}
@@ -113,3 +113,64 @@ async def test_options_flow_remove_sensor(mock_hass):
     result = await flow.async_step_remove_sensor({"sensors_to_remove": ["1"]})
     assert result["type"] == "create_entry"
     assert len(result["data"]["sensors"]) == 0
+
+
+@pytest.mark.asyncio
+async def test_options_flow_advanced(mock_hass):
+    """Test options flow advanced performance settings."""
+    entry = MagicMock()
+    entry.options = {"sensors": [], "update_interval": 12}
+    flow = ChefkochOptionsFlowHandler(entry)
+    flow.hass = mock_hass
+    flow.config_entry = entry
+
+    result = await flow.async_step_advanced()
+    assert result["type"] == "form"
+    assert result["step_id"] == "advanced"
+
+    result = await flow.async_step_advanced(
+        {"async_client": False, "pool_connections": 2, "pool_maxsize": 20}
+    )
+    assert result["type"] == "create_entry"
+    assert result["data"]["async_client"] is False
+    assert result["data"]["pool_connections"] == 2
+    assert result["data"]["pool_maxsize"] == 20
+    assert result["data"]["update_interval"] == 12
+
+
+@pytest.mark.asyncio
+async def test_options_flow_sensor_intervals(mock_hass):
+    """Test options flow sets an update interval per sensor."""
+    entry = MagicMock()
+    entry.options = {
+        "sensors": [
+            {"id": "random", "type": "random", "name": "Random"},
+            {"id": "pasta", "type": "search", "name": "Pasta"},
+            {"id": "pasta_2", "type": "search", "name": "Pasta"},
+            {"id": "daily", "type": "daily", "name": "Daily", "update_interval": 24},
+        ],
+        "update_interval": 12,
+    }
+    flow = ChefkochOptionsFlowHandler(entry)
+    flow.hass = mock_hass
+
+    result = await flow.async_step_sensor_intervals()
+    assert result["type"] == "form"
+    assert result["step_id"] == "sensor_intervals"
+    assert result["description_placeholders"]["sensor_name"] == "Random"
+
+    result = await flow.async_step_sensor_intervals({"update_interval": 1})
+    assert result["type"] == "form"
+    assert result["description_placeholders"]["sensor_name"] == "Pasta"
+
+    result = await flow.async_step_sensor_intervals({"update_interval": 2})
+    assert result["description_placeholders"]["sensor_name"] == "Pasta"
+
+    result = await flow.async_step_sensor_intervals({"update_interval": 3})
+    assert result["description_placeholders"]["sensor_name"] == "Daily"
+
+    result = await flow.async_step_sensor_intervals({"update_interval": 24})
+    assert result["type"] == "create_entry"
+    # Sensors with the same name get their own interval
+    assert [s["update_interval"] for s in result["data"]["sensors"]] == [1, 2, 3, 24]
+    assert result["data"]["update_interval"] == 12
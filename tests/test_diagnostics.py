@@ -4,6 +4,7 @@ import pytest
 
 from custom_components.chefkoch_ha.const import DOMAIN
 from custom_components.chefkoch_ha.diagnostics import async_get_config_entry_diagnostics
+from custom_components.chefkoch_ha.models import Recipe
 
 from . import mock_ha  # noqa: F401
 
@@ -17,11 +18,25 @@ async def test_async_get_config_entry_diagnostics():
     mock_entry.as_dict.return_value = {"options": {}}
 
     coordinator = MagicMock()
-    coordinator.data = {"test": "data"}
+    coordinator.data = {"test": Recipe(title="Data")}
 
-    mock_hass.data = {DOMAIN: {"test_entry_id": {"coordinator": coordinator}}}
+    client = MagicMock()
+    client.circuit_diagnostics.return_value = {
+        "api.chefkoch.de/v2/recipes": {"state": "open"}
+    }
+    client.latency_diagnostics.return_value = {
+        "api.chefkoch.de/v2/recipes": {"samples": 1, "p95": 0.2}
+    }
+
+    mock_hass.data = {
+        DOMAIN: {"test_entry_id": {"coordinator": coordinator, "client": client}}
+    }
 
     diagnostics = await async_get_config_entry_diagnostics(mock_hass, mock_entry)
 
-    assert diagnostics["coordinator_data"] == {"test": "data"}
+    assert diagnostics["coordinator_data"]["test"]["title"] == "Data"
+    assert diagnostics["circuit_breakers"] == {
+        "api.chefkoch.de/v2/recipes": {"state": "open"}
+    }
+    assert diagnostics["latency"]["api.chefkoch.de/v2/recipes"]["p95"] == 0.2
     assert "entry" in diagnostics
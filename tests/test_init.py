@@ -1,8 +1,16 @@
+import asyncio
+import itertools
+import json
+import threading
+import time
+from datetime import timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from custom_components.chefkoch_ha import (
+    CHEFKOCH_API_URL,
+    _create_session,
     _fetch_recipe_url,
     async_setup_entry,
     async_unload_entry,
@@ -10,11 +18,26 @@ from custom_components.chefkoch_ha import (
     extract_recipe_attributes,
     options_update_listener,
 )
+from custom_components.chefkoch_ha.api import ChefkochClient, ChefkochRequestError
 from custom_components.chefkoch_ha.const import DOMAIN
+from custom_components.chefkoch_ha.models import Ingredient, Recipe
+from custom_components.chefkoch_ha.reservoir import RecipeReservoir
+from custom_components.chefkoch_ha.scheduler import SensorScheduler
+from custom_components.chefkoch_ha.store import RecipeStore
 
 from . import mock_ha  # noqa: F401
 
 
+def _mock_response(status_code=200, text="", json_data=None):
+    """Return a mocked requests response."""
+    resp = MagicMock()
+    resp.status_code = status_code
+    resp.headers = {}
+    resp.content = (json.dumps(json_data) if json_data is not None else text).encode()
+    resp.iter_content.side_effect = lambda chunk_size=1: iter([resp.content])
+    return resp
+
+
 @pytest.fixture
 def mock_hass():
     hass = MagicMock()
@@ -23,10 +46,16 @@ def mock_hass():
     hass.config_entries.async_forward_entry_setups = AsyncMock(return_value=True)
     hass.config_entries.async_unload_platforms = AsyncMock(return_value=True)
     hass.config_entries.async_reload = AsyncMock()
-    hass.async_add_executor_job = AsyncMock()
+    hass.async_add_executor_job = AsyncMock(side_effect=lambda func, *args: func(*args))
     return hass
 
 
+@pytest.fixture
+def client(mock_hass):
+    """Return a client sending requests through requests.get in the executor."""
+    return ChefkochClient(mock_hass, use_async=False)
+
+
 @pytest.fixture
 def mock_config_entry():
     entry = MagicMock()
@@ -36,9 +65,28 @@ def mock_config_entry():
         "update_interval": 12,
     }
     entry.add_update_listener = MagicMock()
+    entry.async_create_background_task = MagicMock(side_effect=_discard_task)
     return entry
 
 
+def _discard_task(hass, coro, name):
+    """Drop a background task (e.g. a prefetch) instead of running it."""
+    coro.close()
+    return MagicMock()
+
+
+def _keep_revalidation(background):
+    """Return a side effect collecting the revalidation, dropping other tasks."""
+
+    def create_task(hass, coro, name):
+        if name != "chefkoch_ha revalidate":
+            return _discard_task(hass, coro, name)
+        background.append(coro)
+        return MagicMock()
+
+    return create_task
+
+
 @pytest.mark.asyncio
 async def test_setup_and_unload_entry(mock_hass, mock_config_entry):
     """Test setting up and unloading the integration."""
@@ -47,7 +95,7 @@ async def test_setup_and_unload_entry(mock_hass, mock_config_entry):
     ) as mock_coordinator_cls:
         mock_coordinator = MagicMock()
         mock_coordinator.async_config_entry_first_refresh = AsyncMock()
-        mock_coordinator.data = {"test_sensor": {"title": "Cached"}}
+        mock_coordinator.data = {"test_sensor": Recipe(title="Cached")}
         mock_coordinator_cls.return_value = mock_coordinator
 
         # Setup
@@ -58,13 +106,47 @@ async def test_setup_and_unload_entry(mock_hass, mock_config_entry):
         # Verify cache interaction
         assert mock_hass.data[DOMAIN]["cache_test_entry_id"] == mock_coordinator.data
 
-        # Unload
-        assert await async_unload_entry(mock_hass, mock_config_entry) is True
+        client = mock_hass.data[DOMAIN]["test_entry_id"]["client"]
+        assert client.use_async is True
+        with patch.object(client, "close") as mock_close:
+            # Unload
+            assert await async_unload_entry(mock_hass, mock_config_entry) is True
+        mock_close.assert_called_once()
         # Entry ID should be popped, but cache should stay
         assert "test_entry_id" not in mock_hass.data[DOMAIN]
         assert "cache_test_entry_id" in mock_hass.data[DOMAIN]
 
 
+def test_create_session_pool_options(mock_config_entry):
+    """Test the shared session mounts a pooled adapter sized from the options."""
+    mock_config_entry.options = {"pool_connections": 3, "pool_maxsize": 25}
+    session = _create_session(mock_config_entry)
+
+    adapter = session.get_adapter("https://api.chefkoch.de/v2/recipes")
+    assert adapter is session.get_adapter("https://www.chefkoch.de/rezepte/")
+    assert adapter._pool_connections == 3
+    assert adapter._pool_maxsize == 25
+    session.close()
+
+
+async def test_extract_recipe_attributes_uses_session(mock_hass):
+    """Test that detail and comment requests go through the shared session."""
+    session = MagicMock()
+    session.get.return_value = _mock_response(
+        json_data={"title": "Pooled", "results": []}
+    )
+    client = ChefkochClient(mock_hass, use_async=False, session=session)
+
+    with patch("requests.get") as mock_get:
+        attributes = await extract_recipe_attributes(
+            client, "https://www.chefkoch.de/rezepte/123456/pooled.html"
+        )
+
+    assert attributes.title == "Pooled"
+    assert session.get.call_count == 2
+    mock_get.assert_not_called()
+
+
 @pytest.mark.asyncio
 async def test_options_update_listener(mock_hass, mock_config_entry):
     """Test that options update triggers a reload."""
@@ -72,7 +154,7 @@ async def test_options_update_listener(mock_hass, mock_config_entry):
     mock_hass.config_entries.async_reload.assert_called_once_with("test_entry_id")
 
 
-def test_extract_recipe_attributes():
+async def test_extract_recipe_attributes(client):
     """Test extracting attributes from a mock recipe HTML."""
     html_content = """
     <html>
@@ -90,23 +172,20 @@ def test_extract_recipe_attributes():
     </script>
     </html>
     """
-    mock_response = MagicMock()
-    mock_response.status_code = 200
-    mock_response.text = html_content
-    mock_response.raise_for_status = MagicMock()
+    mock_response = _mock_response(text=html_content)
 
     with patch("requests.get", return_value=mock_response):
-        attributes = extract_recipe_attributes("http://test")
+        attributes = await extract_recipe_attributes(client, "http://test")
 
-    assert attributes["title"] == "Test Recipe"
-    assert attributes["status"] == "success"
-    assert "Step 1" in attributes["instructions"]
-    assert "Section" in attributes["instructions"]
-    assert attributes["calories"] == "500 kcal"
-    assert attributes["protein"] == "20 g"
+    assert attributes.title == "Test Recipe"
+    assert attributes.status == "success"
+    assert "Step 1" in attributes.instructions
+    assert "Section" in attributes.instructions
+    assert attributes.calories == "500 kcal"
+    assert attributes.protein == "20 g"
 
 
-def test_extract_recipe_attributes_graph():
+async def test_extract_recipe_attributes_graph(client):
     """Test extracting attributes when JSON-LD is wrapped in @graph."""
     html_content = """
     <html>
@@ -130,22 +209,19 @@ def test_extract_recipe_attributes_graph():
     </script>
     </html>
     """
-    mock_response = MagicMock()
-    mock_response.status_code = 200
-    mock_response.text = html_content
-    mock_response.raise_for_status = MagicMock()
+    mock_response = _mock_response(text=html_content)
 
     with patch("requests.get", return_value=mock_response):
-        attributes = extract_recipe_attributes("http://test")
+        attributes = await extract_recipe_attributes(client, "http://test")
 
-    assert attributes["title"] == "Graph Recipe"
-    assert attributes["author"] == "AuthorName"
-    assert attributes["status"] == "success"
-    assert "Mix ingredients" in attributes["instructions"]
-    assert attributes["image_url"] == "https://img.chefkoch-cdn.de/test.jpg"
+    assert attributes.title == "Graph Recipe"
+    assert attributes.author == "AuthorName"
+    assert attributes.status == "success"
+    assert "Mix ingredients" in attributes.instructions
+    assert attributes.image_url == "https://img.chefkoch-cdn.de/test.jpg"
 
 
-def test_extract_recipe_attributes_api():
+async def test_extract_recipe_attributes_api(client):
     """Test extracting attributes via API using realistic live API JSON format."""
     api_json = {
         "title": "API Spaghetti Carbonara",
@@ -196,40 +272,41 @@ def test_extract_recipe_attributes_api():
         "owner": {"displayName": "ChefMaster", "username": "chef_master_99"},
         "siteUrl": "https://www.chefkoch.de/rezepte/123456/carbonara.html",
     }
-    mock_response = MagicMock()
-    mock_response.status_code = 200
-    mock_response.json.return_value = api_json
-    mock_response.raise_for_status = MagicMock()
+    mock_response = _mock_response(json_data=api_json)
 
     with patch("requests.get", return_value=mock_response):
-        attributes = extract_recipe_attributes(
-            "https://www.chefkoch.de/rezepte/123456/carbonara.html"
+        attributes = await extract_recipe_attributes(
+            client, "https://www.chefkoch.de/rezepte/123456/carbonara.html"
         )
 
-    assert attributes["title"] == "API Spaghetti Carbonara"
-    assert attributes["subtitle"] == "Klassiker aus Italien"
-    assert attributes["saved_recipes_count"] == 116412
-    assert attributes["view_count"] == 3965603
-    assert attributes["author_notes"] == "Super lecker mit etwas Knoblauch!"
-    assert attributes["video_id"] == "597"
-    assert "Pasta" in attributes["tags"]
-    assert "Kochen" in attributes["category_breadcrumb"]
-    assert attributes["status"] == "success"
-    assert attributes["author"] == "ChefMaster"
-    assert attributes["cuisine"] == "Italien"
-    assert attributes["difficulty"] == "einfach"
-    assert attributes["calories"] == "582 kcal"
-    assert attributes["protein"] == "27.67 g"
+    assert attributes.title == "API Spaghetti Carbonara"
+    assert attributes.subtitle == "Klassiker aus Italien"
+    assert attributes.saved_recipes_count == 116412
+    assert attributes.view_count == 3965603
+    assert attributes.author_notes == "Super lecker mit etwas Knoblauch!"
+    assert attributes.video_id == "597"
+    assert "Pasta" in attributes.tags
+    assert "Kochen" in attributes.category_breadcrumb
+    assert attributes.status == "success"
+    assert attributes.author == "ChefMaster"
+    assert attributes.cuisine == "Italien"
+    assert attributes.difficulty == "einfach"
+    assert attributes.calories == "582 kcal"
+    assert attributes.protein == "27.67 g"
     assert (
-        attributes["image_url"]
+        attributes.image_url
         == "https://img.chefkoch-cdn.de/rezepte/123456/bilder/99999/crop-900x600/carbonara.jpg"
     )
-    assert "400 g Spaghetti (oder Tortellini)" in attributes["ingredients"]
-    assert "150 g Pancetta (roher)" in attributes["ingredients"]
-    assert "--- Hauptzutaten ---" in attributes["ingredients"]
+    assert "400 g Spaghetti (oder Tortellini)" in attributes.ingredients
+    assert "150 g Pancetta (roher)" in attributes.ingredients
+    assert "--- Hauptzutaten ---" in attributes.ingredients
+    assert attributes.ingredient_items[1] == Ingredient(
+        name="Pancetta", amount=150, unit="g", usage="roher", group="Hauptzutaten"
+    )
+    assert attributes.serving_count == 4
 
 
-def test_fetch_recipe_comments_from_api():
+async def test_fetch_recipe_comments_from_api(client):
     """Test fetching recipe comments from API."""
     from custom_components.chefkoch_ha import fetch_recipe_comments_from_api
 
@@ -247,19 +324,17 @@ def test_fetch_recipe_comments_from_api():
             },
         ]
     }
-    mock_resp = MagicMock()
-    mock_resp.status_code = 200
-    mock_resp.json.return_value = comments_json
+    mock_resp = _mock_response(json_data=comments_json)
 
     with patch("requests.get", return_value=mock_resp):
-        comments = fetch_recipe_comments_from_api("123456", limit=2)
+        comments = await fetch_recipe_comments_from_api(client, "123456", limit=2)
 
     assert len(comments) == 2
     assert comments[0] == "Anna: Tolle Soße!"
     assert comments[1] == "Ben: Sehr lecker."
 
 
-def test_fetch_recipe_url_api_filters():
+async def test_fetch_recipe_url_api_filters(client):
     """Test fetching recipe URL with API search filters (prep_times, ratings, sort)."""
     sensor_config = {
         "type": "search",
@@ -279,28 +354,22 @@ def test_fetch_recipe_url_api_filters():
             }
         ]
     }
-    mock_resp = MagicMock()
-    mock_resp.status_code = 200
-    mock_resp.json.return_value = api_response
+    mock_resp = _mock_response(json_data=api_response)
 
     with patch("requests.get", return_value=mock_resp) as mock_get:
-        import asyncio
-
-        from custom_components.chefkoch_ha import _fetch_recipe_url
-
-        url = asyncio.run(_fetch_recipe_url(sensor_config))
+        url = await _fetch_recipe_url(client, sensor_config)
 
     assert url == "https://www.chefkoch.de/rezepte/555555/"
     mock_get.assert_called_once()
     _, kwargs = mock_get.call_args
     params = kwargs.get("params", {})
-    assert params.get("query") == "Pasta"
+    assert params.get("query") == "pasta"
     assert params.get("maxTime") == "30"
     assert params.get("minimumRating") == "4.0"
     assert params.get("orderBy") == "rating"
 
 
-def test_extract_recipe_attributes_api_fallback_to_webscraping(caplog):
+async def test_extract_recipe_attributes_api_fallback_to_webscraping(client, caplog):
     """Test fallback to webscraping with warning log when API fails."""
     html_content = """
     <html>
@@ -315,35 +384,29 @@ def test_extract_recipe_attributes_api_fallback_to_webscraping(caplog):
     """
 
     def mock_get(url, **kwargs):
-        resp = MagicMock()
         if "api.chefkoch.de" in url:
-            resp.status_code = 500
-            resp.raise_for_status.side_effect = Exception("API Server Error 500")
-        else:
-            resp.status_code = 200
-            resp.text = html_content
-            resp.raise_for_status = MagicMock()
-        return resp
+            return _mock_response(status_code=500)
+        return _mock_response(text=html_content)
 
     with patch("requests.get", side_effect=mock_get):
-        attributes = extract_recipe_attributes(
-            "https://www.chefkoch.de/rezepte/123456/fallback.html"
+        attributes = await extract_recipe_attributes(
+            client, "https://www.chefkoch.de/rezepte/123456/fallback.html"
         )
 
-    assert attributes["title"] == "Fallback Recipe"
-    assert attributes["status"] == "success"
+    assert attributes.title == "Fallback Recipe"
+    assert attributes.status == "success"
     assert "Falling back to less efficient webscraping" in caplog.text
 
 
-def test_extract_recipe_attributes_error():
+async def test_extract_recipe_attributes_error(client):
     """Test extracting attributes when fetch fails."""
     with patch("requests.get", side_effect=Exception("Failed")):
-        attributes = extract_recipe_attributes("http://test")
-    assert attributes["status"] == "error"
+        attributes = await extract_recipe_attributes(client, "http://test")
+    assert attributes.status == "error"
 
 
 @pytest.mark.asyncio
-async def test_fetch_recipe_url_daily():
+async def test_fetch_recipe_url_daily(client):
     """Test fetching daily URL."""
     mock_recipe = MagicMock()
     mock_recipe._url = "https://www.chefkoch.de/rezepte/123456/test.html"
@@ -352,21 +415,19 @@ async def test_fetch_recipe_url_daily():
     mock_searcher = MagicMock()
     mock_searcher.recipeOfTheDay.return_value = mock_recipe
 
-    mock_response = MagicMock()
-    mock_response.status_code = 200
-    mock_response.text = "application/ld+json"
+    mock_response = _mock_response(text="application/ld+json")
 
     with (
         patch("custom_components.chefkoch_ha.Search", return_value=mock_searcher),
         patch("requests.get", return_value=mock_response),
     ):
-        url = await _fetch_recipe_url({"type": "daily"})
+        url = await _fetch_recipe_url(client, {"type": "daily"})
 
     assert url == "https://www.chefkoch.de/rezepte/123456/"
 
 
 @pytest.mark.asyncio
-async def test_fetch_recipe_url_random():
+async def test_fetch_recipe_url_random(client):
     """Test fetching random recipe URL."""
     mock_recipe = MagicMock()
     mock_recipe._url = "https://www.chefkoch.de/rezepte/789/test.html"
@@ -375,22 +436,20 @@ async def test_fetch_recipe_url_random():
     mock_searcher = MagicMock()
     mock_searcher.recipes.return_value = [mock_recipe]
 
-    mock_response = MagicMock()
-    mock_response.status_code = 200
-    mock_response.text = "application/ld+json"
+    mock_response = _mock_response(text="application/ld+json")
 
     with (
         patch("custom_components.chefkoch_ha.Search", return_value=mock_searcher),
         patch("requests.get", return_value=mock_response),
         patch("random.sample", return_value=[mock_recipe]),
     ):
-        url = await _fetch_recipe_url({"type": "random"})
+        url = await _fetch_recipe_url(client, {"type": "random"})
 
     assert url == "https://www.chefkoch.de/rezepte/789/"
 
 
 @pytest.mark.asyncio
-async def test_fetch_recipe_url_plus_skip():
+async def test_fetch_recipe_url_plus_skip(client):
     """Test skipping Plus recipes."""
     recipe_plus = MagicMock()
     recipe_plus._url = "https://www.chefkoch.de/rezepte/1/plus.html"
@@ -407,47 +466,48 @@ async def test_fetch_recipe_url_plus_skip():
     mock_searcher.recipes.return_value = [recipe_plus, recipe_ok]
 
     def mock_get(url, **kwargs):
-        resp = MagicMock()
-        resp.status_code = 200
         if "/1/" in url:
-            resp.text = "No JSON-LD here"
-        else:
-            resp.text = "application/ld+json"
-        return resp
+            return _mock_response(text="No JSON-LD here")
+        return _mock_response(text="application/ld+json")
 
     with (
         patch("custom_components.chefkoch_ha.Search", return_value=mock_searcher),
         patch("requests.get", side_effect=mock_get),
         patch("random.sample", return_value=[recipe_plus, recipe_ok]),
     ):
-        url = await _fetch_recipe_url({"type": "search", "search_query": "test"})
+        url = await _fetch_recipe_url(
+            client, {"type": "search", "search_query": "test"}
+        )
 
     assert url == "https://www.chefkoch.de/rezepte/2/"
 
 
 @pytest.mark.asyncio
-async def test_async_update_data(mock_hass, mock_config_entry):
+async def test_async_update_data(mock_hass, mock_config_entry, client):
     """Test updating data for all sensors."""
-    mock_hass.async_add_executor_job = AsyncMock(
-        return_value={"title": "Data", "status": "success"}
-    )
-    with patch(
-        "custom_components.chefkoch_ha._fetch_recipe_url",
-        return_value=("http://recipe", "Name"),
+    store = RecipeStore(mock_hass, "test_entry_id", ttl=3600, max_recipes=10)
+    mock_hass.data = {
+        DOMAIN: {
+            "test_entry_id": {
+                "client": client,
+                "store": store,
+                "scheduler": SensorScheduler(timedelta(hours=12)),
+            }
+        }
+    }
+    with (
+        patch(
+            "custom_components.chefkoch_ha._fetch_recipe_url",
+            return_value="http://recipe",
+        ),
+        patch(
+            "custom_components.chefkoch_ha.extract_recipe_attributes",
+            return_value=Recipe(title="Data"),
+        ),
     ):
         data = await async_update_data(mock_hass, mock_config_entry)
     assert "test_sensor" in data
-    assert data["test_sensor"] == {"title": "Data", "status": "success"}
-
-
-def test_scale_ingredient():
-    """Test scaling numeric quantities in ingredient string."""
-    from custom_components.chefkoch_ha import _scale_ingredient
-
-    assert _scale_ingredient("400 g Spaghetti", 0.5) == "200 g Spaghetti"
-    assert _scale_ingredient("150 g Pancetta", 2.0) == "300 g Pancetta"
-    assert _scale_ingredient("--- Hauptzutaten ---", 2.0) == "--- Hauptzutaten ---"
-    assert _scale_ingredient("Salz und Pfeffer", 2.0) == "Salz und Pfeffer"
+    assert data["test_sensor"] == Recipe(title="Data")
 
 
 @pytest.mark.asyncio
@@ -457,13 +517,20 @@ async def test_add_to_shopping_list_scaled(mock_hass, mock_config_entry):
 
     mock_state = MagicMock()
     mock_state.attributes = {
-        "ingredients": ["400 g Spaghetti", "150 g Pancetta"],
+        "ingredients": ["--- Nudeln ---", "400 g Spaghetti", "150 g Pancetta"],
         "servings": "4 Port.",
     }
     mock_hass.states.get.return_value = mock_state
     mock_hass.services.async_call = AsyncMock()
 
-    await async_setup_entry(mock_hass, mock_config_entry)
+    with (
+        patch(
+            "custom_components.chefkoch_ha._fetch_recipe_url",
+            AsyncMock(return_value=None),
+        ),
+        patch("custom_components.chefkoch_ha.extract_recipe_attributes"),
+    ):
+        await async_setup_entry(mock_hass, mock_config_entry)
 
     # Find the registered add_to_shopping_list handler
     handler = None
@@ -487,6 +554,61 @@ async def test_add_to_shopping_list_scaled(mock_hass, mock_config_entry):
     )
 
 
+@pytest.mark.asyncio
+async def test_get_recipe_returns_fields_left_out_of_compact_state(
+    mock_hass, mock_config_entry
+):
+    """Test get_recipe and add_to_shopping_list read the recipe, not the state."""
+    recipe = Recipe(
+        title="Carbonara",
+        ingredients=("400 g Spaghetti",),
+        ingredient_items=(Ingredient("Spaghetti", amount=400, unit="g"),),
+        instructions="Kochen.",
+        servings="4 Port.",
+        serving_count=4,
+    )
+    mock_hass.services.async_call = AsyncMock()
+    with (
+        patch(
+            "custom_components.chefkoch_ha._fetch_recipe_url",
+            AsyncMock(return_value="https://www.chefkoch.de/rezepte/123/"),
+        ),
+        patch(
+            "custom_components.chefkoch_ha.extract_recipe_attributes",
+            AsyncMock(return_value=recipe),
+        ),
+    ):
+        await async_setup_entry(mock_hass, mock_config_entry)
+    entity = MagicMock(entity_id="sensor.chefkoch_test", sensor_id="test_sensor")
+    mock_hass.data[DOMAIN]["test_entry_id"]["entities"] = {"test_sensor": entity}
+    handlers = {
+        call.args[1]: call.args[2]
+        for call in mock_hass.services.async_register.call_args_list
+    }
+    register_call = next(
+        call
+        for call in mock_hass.services.async_register.call_args_list
+        if call.args[1] == "get_recipe"
+    )
+    assert register_call.kwargs["supports_response"] == "only"
+
+    response = await handlers["get_recipe"](
+        MagicMock(data={"entity_id": "sensor.chefkoch_test"})
+    )
+    assert response["title"] == "Carbonara"
+    assert response["ingredients"] == ["400 g Spaghetti"]
+    assert response["instructions"] == "Kochen."
+    assert await handlers["get_recipe"](MagicMock(data={"entity_id": "sensor.x"})) == {}
+
+    await handlers["add_to_shopping_list"](
+        MagicMock(data={"entity_id": "sensor.chefkoch_test", "servings": 2})
+    )
+    mock_hass.states.get.assert_not_called()
+    mock_hass.services.async_call.assert_called_once_with(
+        "shopping_list", "add_item", {"name": "200 g Spaghetti"}
+    )
+
+
 @pytest.mark.asyncio
 async def test_generate_meal_plan(mock_hass, mock_config_entry):
     """Test generate_meal_plan service fires event with meal plan entries."""
@@ -503,21 +625,23 @@ async def test_generate_meal_plan(mock_hass, mock_config_entry):
             }
         ]
     }
-    recipe_attrs = {
-        "title": "Pasta Primavera",
-        "status": "success",
-        "subtitle": "",
-        "url": "https://www.chefkoch.de/rezepte/111111/",
-        "ingredients": [],
-        "instructions": "",
-        "servings": "4",
-        "top_comments": [],
-    }
+    recipe_attrs = Recipe(
+        title="Pasta Primavera",
+        url="https://www.chefkoch.de/rezepte/111111/",
+        servings="4",
+    )
     mock_api_resp = MagicMock()
     mock_api_resp.status_code = 200
     mock_api_resp.json.side_effect = [api_response, recipe_attrs]
 
-    await async_setup_entry(mock_hass, mock_config_entry)
+    with (
+        patch(
+            "custom_components.chefkoch_ha._fetch_recipe_url",
+            AsyncMock(return_value=None),
+        ),
+        patch("custom_components.chefkoch_ha.extract_recipe_attributes"),
+    ):
+        await async_setup_entry(mock_hass, mock_config_entry)
 
     # Find the registered generate_meal_plan handler
     handler = None
@@ -551,3 +675,981 @@ async def test_generate_meal_plan(mock_hass, mock_config_entry):
     assert len(event_data["meal_plan"]) == 2
     assert event_data["meal_plan"][0]["day"] == "1"
     assert event_data["meal_plan"][0]["title"] == "Pasta Primavera"
+
+
+class _FakeAiohttpResponse:
+    """Minimal stand-in for an aiohttp response context manager."""
+
+    def __init__(self, url, json_data):
+        self.url = url
+        self.status = 200
+        self.headers = {"Content-Type": "application/json"}
+        self._body = json.dumps(json_data).encode()
+
+    async def read(self):
+        return self._body
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        return None
+
+
+@pytest.mark.asyncio
+async def test_async_client_runs_on_event_loop(mock_hass):
+    """Test that the async client fetches details and comments without the executor."""
+    payloads = {
+        "https://api.chefkoch.de/v2/recipes/123456": {"title": "Async Recipe"},
+        "https://api.chefkoch.de/v2/recipes/123456/comments": {
+            "results": [{"text": "Lecker", "owner": {"displayName": "Anna"}}]
+        },
+    }
+    session = MagicMock()
+    session.get.side_effect = lambda url, **kwargs: _FakeAiohttpResponse(
+        url, payloads[url]
+    )
+    client = ChefkochClient(mock_hass, use_async=True)
+
+    with patch(
+        "custom_components.chefkoch_ha.api.async_get_clientsession",
+        return_value=session,
+    ):
+        attributes = await extract_recipe_attributes(
+            client, "https://www.chefkoch.de/rezepte/123456/async.html"
+        )
+
+    assert attributes.title == "Async Recipe"
+    assert attributes.top_comments == ("Anna: Lecker",)
+    assert session.get.call_count == 2
+    mock_hass.async_add_executor_job.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_fetch_recipe_details_and_comments_concurrently(client):
+    """Test that the detail and comment requests are in flight at the same time."""
+    from custom_components.chefkoch_ha import fetch_recipe_attributes_from_api
+    from custom_components.chefkoch_ha.api import ChefkochResponse
+
+    in_flight = 0
+    max_in_flight = 0
+
+    async def fake_get(url, **kwargs):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        if url.endswith("/comments"):
+            raise ChefkochRequestError("comments timed out")
+        return ChefkochResponse(url, 200, {}, b'{"title": "Concurrent"}')
+
+    with patch.object(client, "async_get", side_effect=fake_get):
+        attributes = await fetch_recipe_attributes_from_api(client, "123456")
+
+    assert max_in_flight == 2
+    assert attributes.title == "Concurrent"
+    assert attributes.top_comments == ()
+
+
+@pytest.mark.asyncio
+async def test_fetch_recipe_details_not_delayed_by_hanging_comments(client):
+    """Test hanging comments are cancelled shortly after the details arrive."""
+    from custom_components.chefkoch_ha import fetch_recipe_attributes_from_api
+    from custom_components.chefkoch_ha.api import ChefkochResponse
+
+    comments_cancelled = asyncio.Event()
+
+    async def fake_get(url, **kwargs):
+        if url.endswith("/comments"):
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                comments_cancelled.set()
+                raise
+        await asyncio.sleep(0.05)
+        return ChefkochResponse(url, 200, {}, b'{"title": "Quick"}')
+
+    start = time.monotonic()
+    with (
+        patch.object(client, "async_get", side_effect=fake_get),
+        patch("custom_components.chefkoch_ha.COMMENTS_GRACE_PERIOD", 0.05),
+    ):
+        attributes = await fetch_recipe_attributes_from_api(client, "123456")
+
+    assert time.monotonic() - start < 1
+    assert attributes.title == "Quick"
+    assert attributes.top_comments == ()
+    assert attributes.partial is True
+    assert comments_cancelled.is_set()
+
+    # The recipe is not stored without its comments, so they are fetched again
+    store = RecipeStore(MagicMock(), "test_entry_id", ttl=3600, max_recipes=10)
+    with (
+        patch.object(client, "async_get", side_effect=fake_get),
+        patch("custom_components.chefkoch_ha.COMMENTS_GRACE_PERIOD", 0.05),
+    ):
+        recipe = await extract_recipe_attributes(
+            client, "https://www.chefkoch.de/rezepte/123456/", store
+        )
+    assert recipe.title == "Quick"
+    assert store.get("123456") is None
+
+
+@pytest.mark.asyncio
+async def test_fetch_recipe_details_failure_cancels_comments(client):
+    """Test that a failing detail request does not leave the comment request running."""
+    from custom_components.chefkoch_ha import fetch_recipe_attributes_from_api
+    from custom_components.chefkoch_ha.api import ChefkochResponse
+
+    comments_cancelled = asyncio.Event()
+
+    async def fake_get(url, **kwargs):
+        if url.endswith("/comments"):
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                comments_cancelled.set()
+                raise
+        await asyncio.sleep(0.01)
+        return ChefkochResponse(url, 500, {}, b"")
+
+    with (
+        patch.object(client, "async_get", side_effect=fake_get),
+        pytest.raises(ChefkochRequestError),
+    ):
+        await fetch_recipe_attributes_from_api(client, "123456")
+
+    await asyncio.sleep(0)
+    assert comments_cancelled.is_set()
+
+
+@pytest.mark.asyncio
+async def test_probe_recipe_pages_first_success_cancels_rest(client):
+    """Test that probing returns the first valid page and cancels slower probes."""
+    from custom_components.chefkoch_ha import _probe_recipe_pages
+
+    cancelled: list[str] = []
+
+    async def fake_is_valid(client, url):
+        if url.endswith("/fast/"):
+            return True
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(url)
+            raise
+        return True
+
+    urls = ["https://x/slow1/", "https://x/fast/", "https://x/slow2/"]
+    with patch(
+        "custom_components.chefkoch_ha._is_valid_recipe_page", side_effect=fake_is_valid
+    ):
+        url = await _probe_recipe_pages(client, urls)
+        await asyncio.sleep(0)
+
+    assert url == "https://x/fast/"
+    assert sorted(cancelled) == ["https://x/slow1/", "https://x/slow2/"]
+
+
+@pytest.mark.asyncio
+async def test_fetch_recipe_url_fallback_deadline(client):
+    """Test that slow Plus checks are bounded by the fallback deadline."""
+    mock_recipe = MagicMock()
+    mock_recipe._url = "https://www.chefkoch.de/rezepte/424242/slow.html"
+    mock_recipe._id = "424242"
+    mock_searcher = MagicMock()
+    mock_searcher.recipes.return_value = [mock_recipe]
+
+    async def slow_probe(client, url):
+        await asyncio.sleep(10)
+        return True
+
+    with (
+        patch("custom_components.chefkoch_ha.Search", return_value=mock_searcher),
+        patch("requests.get", return_value=_mock_response(status_code=500)),
+        patch(
+            "custom_components.chefkoch_ha._is_valid_recipe_page",
+            side_effect=slow_probe,
+        ),
+    ):
+        url = await asyncio.wait_for(
+            _fetch_recipe_url(
+                client, {"type": "search", "search_query": "x"}, fallback_timeout=0.05
+            ),
+            timeout=1,
+        )
+
+    # No candidate could be verified in time, the first search result is used
+    assert url == "https://www.chefkoch.de/rezepte/424242/"
+
+
+@pytest.mark.asyncio
+async def test_plus_check_uses_api_flag(client):
+    """Test that the Plus check uses the API isPlus flag instead of the HTML page."""
+    from custom_components.chefkoch_ha import _is_valid_recipe_page
+
+    plus = _mock_response(json_data={"title": "Plus Recipe", "isPlus": True})
+    with patch("requests.get", return_value=plus) as mock_get:
+        assert not await _is_valid_recipe_page(
+            client, "https://www.chefkoch.de/rezepte/123456/"
+        )
+
+    mock_get.assert_called_once()
+    assert mock_get.call_args[0][0] == "https://api.chefkoch.de/v2/recipes/123456"
+
+
+@pytest.mark.asyncio
+async def test_plus_check_streams_page_until_marker(client):
+    """Test that the HTML fallback stops reading once the JSON-LD marker is found."""
+    from custom_components.chefkoch_ha import _is_valid_recipe_page
+
+    consumed: list[bytes] = []
+
+    def chunks(chunk_size=1):
+        for chunk in (
+            b"<html><head><title>Rezept</title>",
+            b'<script type="application/l',
+            b'd+json">{"@type": "Recipe"}</script>',
+            b"x" * 100000,
+            b"</head><body>...</body></html>",
+        ):
+            consumed.append(chunk)
+            yield chunk
+
+    def mock_get(url, **kwargs):
+        if "api.chefkoch.de" in url:
+            return _mock_response(status_code=503)
+        resp = _mock_response()
+        resp.iter_content.side_effect = chunks
+        assert kwargs["stream"] is True
+        return resp
+
+    with patch("requests.get", side_effect=mock_get):
+        assert await _is_valid_recipe_page(
+            client, "https://www.chefkoch.de/rezepte/123456/"
+        )
+
+    # The marker spans two chunks; nothing after it was read
+    assert len(consumed) == 3
+
+
+@pytest.mark.asyncio
+async def test_response_cache_reuses_plus_check_download(client):
+    """Test that the detail JSON fetched by the Plus check is not downloaded again."""
+    from custom_components.chefkoch_ha import _is_valid_recipe_page
+
+    def mock_get(url, **kwargs):
+        if url.endswith("/comments"):
+            return _mock_response(json_data={"results": []})
+        return _mock_response(json_data={"title": "Reused", "isPlus": False})
+
+    scoped = client.with_response_cache()
+    url = "https://www.chefkoch.de/rezepte/123456/"
+    with patch("requests.get", side_effect=mock_get) as mock_get_call:
+        assert await _is_valid_recipe_page(scoped, url)
+        attributes = await extract_recipe_attributes(scoped, url)
+
+    assert attributes.title == "Reused"
+    requested = [call[0][0] for call in mock_get_call.call_args_list]
+    assert requested.count("https://api.chefkoch.de/v2/recipes/123456") == 1
+
+    # The shared client itself keeps no responses between refreshes
+    with patch("requests.get", side_effect=mock_get) as mock_get_call:
+        await client.async_get("https://api.chefkoch.de/v2/recipes/123456")
+    mock_get_call.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_response_cache_skips_partial_reads(client):
+    """Test that streamed partial responses are never served from the cache."""
+    scoped = client.with_response_cache()
+    with patch(
+        "requests.get", return_value=_mock_response(text="application/ld+json")
+    ) as mock_get:
+        await scoped.async_get("https://x/", stop_at=(b"</head>",))
+        await scoped.async_get("https://x/")
+        await scoped.async_get("https://x/")
+
+    assert mock_get.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_recipe_details_revalidated_with_etag(client):
+    """Test that unchanged recipe details are revalidated and not mapped again."""
+    from custom_components.chefkoch_ha import (
+        _map_api_recipe,
+        fetch_recipe_attributes_from_api,
+    )
+
+    detail_headers: list[dict] = []
+
+    def mock_get(url, **kwargs):
+        if url.endswith("/comments"):
+            return _mock_response(json_data={"results": []})
+        detail_headers.append(kwargs["headers"])
+        if kwargs["headers"].get("If-None-Match") == '"v1"':
+            resp = _mock_response(status_code=304)
+        else:
+            resp = _mock_response(json_data={"title": "Cached Recipe"})
+        resp.headers = {
+            "ETag": '"v1"',
+            "Last-Modified": "Mon, 12 Oct 2026 08:00:00 GMT",
+        }
+        return resp
+
+    with (
+        patch("requests.get", side_effect=mock_get),
+        patch(
+            "custom_components.chefkoch_ha._map_api_recipe",
+            wraps=_map_api_recipe,
+        ) as mock_map,
+    ):
+        first = await fetch_recipe_attributes_from_api(client, "123456")
+        second = await fetch_recipe_attributes_from_api(client, "123456")
+
+    assert first == second
+    assert second.title == "Cached Recipe"
+    assert "If-None-Match" not in detail_headers[0]
+    assert detail_headers[1]["If-None-Match"] == '"v1"'
+    assert detail_headers[1]["If-Modified-Since"] == "Mon, 12 Oct 2026 08:00:00 GMT"
+    mock_map.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_recipe_store_serves_fresh_recipes(mock_hass, mock_config_entry, client):
+    """Test recipes are read through the store and restored after a restart."""
+    store = RecipeStore(mock_hass, "test_entry_id", ttl=3600, max_recipes=10)
+    await store.async_load()
+    mock_hass.data = {
+        DOMAIN: {
+            "test_entry_id": {
+                "client": client,
+                "store": store,
+                "scheduler": SensorScheduler(timedelta(hours=12)),
+            }
+        }
+    }
+    url = "https://www.chefkoch.de/rezepte/123456/stored.html"
+
+    with (
+        patch("custom_components.chefkoch_ha._fetch_recipe_url", return_value=url),
+        patch("requests.get") as mock_get,
+    ):
+        mock_get.return_value = _mock_response(
+            json_data={"title": "Stored", "results": []}
+        )
+        data = await async_update_data(mock_hass, mock_config_entry)
+        assert data["test_sensor"].title == "Stored"
+        calls = mock_get.call_count
+
+        # The same recipe again is served from the store
+        await async_update_data(
+            mock_hass, mock_config_entry, only=mock_config_entry.options["sensors"]
+        )
+        assert mock_get.call_count == calls
+
+    # After a restart the sensor comes up from disk without any request
+    restarted = RecipeStore(mock_hass, "test_entry_id", ttl=3600, max_recipes=10)
+    await restarted.async_load()
+    sensors = mock_config_entry.options["sensors"]
+    restored = restarted.restore_sensors(sensors)
+    assert restored["test_sensor"][1] == data["test_sensor"]
+    renamed = [{**sensors[0], "name": "Renamed", "update_interval": 1}]
+    assert "test_sensor" in restarted.restore_sensors(renamed)
+    changed = [{**sensors[0], "search_query": "Suppe"}]
+    assert restarted.restore_sensors(changed) == {}
+
+
+@pytest.mark.asyncio
+async def test_recipe_store_ttl_and_lru_eviction(mock_hass):
+    """Test expired recipes are dropped and the least recently used are evicted."""
+    store = RecipeStore(mock_hass, "test_entry_id", ttl=100, max_recipes=2)
+    with patch("custom_components.chefkoch_ha.store.time.time", return_value=1000):
+        store.put("1", Recipe(title="One"))
+        store.put("2", Recipe(title="Two"))
+        assert store.get("1") == Recipe(title="One")
+        store.put("3", Recipe(title="Three"))
+
+        assert store.get("2") is None
+        assert store.get("1") == Recipe(title="One")
+    with patch("custom_components.chefkoch_ha.store.time.time", return_value=1100):
+        assert store.get("3") is None
+
+
+@pytest.mark.asyncio
+async def test_setup_restores_sensors_without_refresh(mock_hass, mock_config_entry):
+    """Test a restart with fresh stored recipes does not fetch sensors not due."""
+    store = RecipeStore(mock_hass, "test_entry_id", ttl=3600, max_recipes=10)
+    store.put("123456", Recipe(title="Stored"))
+    store.set_sensor_recipe(
+        mock_config_entry.options["sensors"][0], "123456", time.time()
+    )
+
+    with patch("custom_components.chefkoch_ha._fetch_recipe_url") as mock_fetch:
+        assert await async_setup_entry(mock_hass, mock_config_entry) is True
+
+    mock_fetch.assert_not_called()
+    coordinator = mock_hass.data[DOMAIN]["test_entry_id"]["coordinator"]
+    assert coordinator.data["test_sensor"].title == "Stored"
+    # The next refresh is scheduled when the sensor is due
+    assert timedelta(hours=11) < coordinator.update_interval <= timedelta(hours=12)
+
+
+@pytest.mark.asyncio
+async def test_setup_restores_expired_recipes_as_stale(mock_hass, mock_config_entry):
+    """Test a restart shows expired stored recipes and refetches them afterwards."""
+    recipe_url = "https://www.chefkoch.de/rezepte/123456/"
+    sensor = {**mock_config_entry.options["sensors"][0], "update_interval": 48}
+    mock_config_entry.options = {
+        **mock_config_entry.options,
+        "sensors": [sensor],
+        "recipe_cache_ttl": 1,
+    }
+    store = RecipeStore(mock_hass, "test_entry_id", ttl=3600, max_recipes=10)
+    two_hours_ago = time.time() - 7200
+    with patch(
+        "custom_components.chefkoch_ha.store.time.time", return_value=two_hours_ago
+    ):
+        store.put("123456", Recipe(title="Stored", url=recipe_url))
+    store.set_sensor_recipe(sensor, "123456", two_hours_ago)
+    background: list = []
+    mock_config_entry.async_create_background_task = MagicMock(
+        side_effect=_keep_revalidation(background)
+    )
+
+    with (
+        patch("custom_components.chefkoch_ha._fetch_recipe_url") as mock_fetch,
+        patch(
+            "custom_components.chefkoch_ha.fetch_recipe_attributes_from_api",
+            AsyncMock(side_effect=ChefkochRequestError("unreachable")),
+        ) as mock_api,
+        patch(
+            "custom_components.chefkoch_ha.extract_recipe_attributes_webscraping",
+            AsyncMock(side_effect=ChefkochRequestError("unreachable")),
+        ),
+    ):
+        assert await async_setup_entry(mock_hass, mock_config_entry) is True
+        mock_api.assert_not_called()
+        coordinator = mock_hass.data[DOMAIN]["test_entry_id"]["coordinator"]
+        assert coordinator.data["test_sensor"].title == "Stored"
+        assert coordinator.data["test_sensor"].stale is True
+
+        # Refetching fails, so the stored recipe is kept
+        (revalidate,) = background
+        await revalidate
+
+    mock_fetch.assert_not_called()
+    mock_api.assert_awaited_once()
+    assert coordinator.data["test_sensor"].title == "Stored"
+    assert coordinator.data["test_sensor"].stale is True
+
+
+@pytest.mark.asyncio
+async def test_setup_serves_stale_data_and_revalidates_in_background(
+    mock_hass, mock_config_entry
+):
+    """Test entities come up from the previous data and are revalidated afterwards."""
+    recipe_url = "https://www.chefkoch.de/rezepte/123456/"
+    mock_hass.data = {
+        DOMAIN: {
+            "cache_test_entry_id": {
+                "test_sensor": Recipe(title="Cached", url=recipe_url)
+            }
+        }
+    }
+    background: list = []
+    mock_config_entry.async_create_background_task = MagicMock(
+        side_effect=_keep_revalidation(background)
+    )
+    fresh = Recipe(title="Fresh", url=recipe_url)
+
+    with (
+        patch(
+            "custom_components.chefkoch_ha.extract_recipe_attributes",
+            AsyncMock(return_value=fresh),
+        ) as mock_extract,
+        patch(
+            "custom_components.chefkoch_ha._fetch_recipe_url",
+            AsyncMock(return_value=recipe_url),
+        ),
+    ):
+        assert await async_setup_entry(mock_hass, mock_config_entry) is True
+        mock_extract.assert_not_called()
+        coordinator = mock_hass.data[DOMAIN]["test_entry_id"]["coordinator"]
+        assert coordinator.data["test_sensor"].stale is True
+        mock_hass.config_entries.async_forward_entry_setups.assert_awaited_once()
+
+        (revalidate,) = background
+        await revalidate
+
+    assert mock_extract.await_args_list[-1].args[1] == recipe_url
+    assert coordinator.data["test_sensor"] == fresh
+    assert mock_hass.data[DOMAIN]["cache_test_entry_id"]["test_sensor"] == fresh
+
+
+@pytest.mark.asyncio
+async def test_revalidation_skips_fresh_stored_recipes(mock_hass, mock_config_entry):
+    """Test a restart makes no request for a stored recipe that is still fresh."""
+    recipe_url = "https://www.chefkoch.de/rezepte/123456/"
+    store = RecipeStore(mock_hass, "test_entry_id", ttl=3600, max_recipes=10)
+    store.put("123456", Recipe(title="Stored", url=recipe_url))
+    store.set_sensor_recipe(
+        mock_config_entry.options["sensors"][0], "123456", time.time()
+    )
+    background: list = []
+    mock_config_entry.async_create_background_task = MagicMock(
+        side_effect=_keep_revalidation(background)
+    )
+
+    with (
+        patch(
+            "custom_components.chefkoch_ha.api.async_get_clientsession"
+        ) as mock_session,
+        patch("requests.get") as mock_get,
+    ):
+        assert await async_setup_entry(mock_hass, mock_config_entry) is True
+        coordinator = mock_hass.data[DOMAIN]["test_entry_id"]["coordinator"]
+        assert coordinator.data["test_sensor"].stale is False
+        (revalidate,) = background
+        await revalidate
+
+    mock_session.return_value.get.assert_not_called()
+    mock_get.assert_not_called()
+    assert coordinator.data["test_sensor"].title == "Stored"
+
+
+def test_scheduler_fetches_only_due_sensors():
+    """Test each sensor is refreshed on its own interval."""
+    scheduler = SensorScheduler(timedelta(hours=24))
+    hourly = {"id": "random", "type": "random", "update_interval": 1}
+    daily = {"id": "daily", "type": "daily"}
+    sensors = [hourly, daily]
+
+    assert scheduler.due(sensors, 0) == sensors
+    scheduler.mark_updated("random", 0)
+    scheduler.mark_updated("daily", 0)
+    assert scheduler.due(sensors, 1800) == []
+    assert scheduler.next_refresh(sensors, 1800) == timedelta(minutes=30)
+
+    assert scheduler.due(sensors, 3600) == [hourly]
+    scheduler.mark_updated("random", 3600)
+    assert scheduler.due(sensors, 86400) == sensors
+    assert scheduler.next_refresh(sensors, 86400) == timedelta(minutes=1)
+
+
+def test_scheduler_staggers_sensors_over_interval():
+    """Test staggered sensors are due at fixed, spread out offsets."""
+    interval = 3600
+    scheduler = SensorScheduler(timedelta(seconds=interval), stagger_seed="entry")
+    sensors = [{"id": str(i), "type": "random"} for i in range(20)]
+    for sensor in sensors:
+        scheduler.mark_updated(sensor["id"], 0)
+
+    due_times = [scheduler._next_update(sensor) for sensor in sensors]
+    # Deterministic, at least half an interval apart from the last update
+    assert due_times == [scheduler._next_update(sensor) for sensor in sensors]
+    assert all(interval / 2 <= due < 2 * interval for due in due_times)
+    # Spread over the interval instead of all at once
+    phases = sorted(due % interval for due in due_times)
+    assert max(b - a for a, b in itertools.pairwise(phases)) < interval / 2
+    assert phases[-1] - phases[0] > interval / 2
+
+    # Each refresh moves a sensor to its slot in the following interval
+    scheduler.mark_updated("0", due_times[0])
+    assert scheduler._next_update(sensors[0]) - due_times[0] == pytest.approx(
+        interval, abs=interval * 0.05
+    )
+
+    other = SensorScheduler(timedelta(seconds=interval), stagger_seed="other")
+    other.mark_updated("0", 0)
+    assert other._next_update(sensors[0]) != due_times[0]
+
+
+async def test_search_results_cached_by_normalized_params(mock_hass):
+    """Test equivalent searches share one cached result page until it expires."""
+    client = ChefkochClient(
+        mock_hass, use_async=False, ttl=60, ttl_cache_max_bytes=1024 * 1024
+    )
+    api_response = {
+        "results": [
+            {"recipe": {"id": "111111", "title": "A", "isPlus": False}},
+            {"recipe": {"id": "222222", "title": "B", "isPlus": True}},
+        ]
+    }
+    mock_resp = _mock_response(json_data=api_response)
+
+    with (
+        patch("requests.get", return_value=mock_resp) as mock_get,
+        patch("custom_components.chefkoch_ha.api.time.monotonic", return_value=0),
+    ):
+        urls = [
+            await _fetch_recipe_url(client, {"type": "search", "search_query": q})
+            for q in ("Vegan", " vegan ")
+        ]
+        # A sensor of the built-in vegan type uses the same search
+        urls.append(await _fetch_recipe_url(client, {"type": "vegan"}))
+        assert mock_get.call_count == 1
+        assert urls == ["https://www.chefkoch.de/rezepte/111111/"] * 3
+
+        await _fetch_recipe_url(client, {"type": "search", "search_query": "Suppe"})
+        assert mock_get.call_count == 2
+
+    with (
+        patch("requests.get", return_value=mock_resp) as mock_get,
+        patch("custom_components.chefkoch_ha.api.time.monotonic", return_value=61),
+    ):
+        await _fetch_recipe_url(client, {"type": "vegan"})
+    mock_get.assert_called_once()
+
+
+async def test_random_sensor_draws_from_reservoir(client):
+    """Test random recipes are drawn without replacement, paging on refill."""
+
+    def search_page(first_id):
+        return _mock_response(
+            json_data={
+                "count": 107,
+                "results": [
+                    {"recipe": {"id": str(rid), "title": str(rid), "isPlus": False}}
+                    for rid in range(first_id, first_id + 7)
+                ],
+            }
+        )
+
+    sensor_config = {"id": "random_sensor", "type": "random"}
+    reservoir = RecipeReservoir({"type": "random"})
+    with patch(
+        "requests.get", side_effect=[search_page(100000), search_page(200000)]
+    ) as mock_get:
+        urls = [
+            await _fetch_recipe_url(client, sensor_config, reservoir=reservoir)
+            for _ in range(3)
+        ]
+        # Three draws from the first page, then one search per refill
+        assert mock_get.call_count == 1
+        assert len(set(urls)) == 3
+        assert all("/10000" in url for url in urls)
+
+        urls.append(await _fetch_recipe_url(client, sensor_config, reservoir=reservoir))
+        assert mock_get.call_count == 2
+        assert mock_get.call_args.kwargs["params"]["offset"] == "100"
+
+    assert len(set(urls)) == 4
+    # Leftovers of the first page are drawn before the new page
+    assert "/10000" in urls[3]
+    assert len(reservoir) == 10
+    # The result list is exhausted, the next refill starts over
+    assert reservoir.offset == 0
+
+
+async def test_search_cache_memory_cap(mock_hass):
+    """Test the least recently used search pages are evicted above the cap."""
+    client = ChefkochClient(mock_hass, use_async=False, ttl=60, ttl_cache_max_bytes=20)
+
+    with patch("requests.get") as mock_get:
+        mock_get.side_effect = lambda url, **kwargs: _mock_response(
+            text=kwargs["params"]["query"] * 10
+        )
+        for query in ("a", "b", "a", "c", "a", "b"):
+            await client.async_get(
+                CHEFKOCH_API_URL, params={"query": query}, ttl_cache=True
+            )
+
+    # "b" was evicted by "c", "a" stayed cached as the most recently used
+    requested = [call.kwargs["params"]["query"] for call in mock_get.call_args_list]
+    assert requested == ["a", "b", "c", "b"]
+
+
+async def test_concurrent_identical_requests_share_one_download(client):
+    """Test concurrent identical searches and detail fetches are coalesced."""
+    search_response = {
+        "results": [{"recipe": {"id": "111111", "title": "A", "isPlus": False}}]
+    }
+    url = "https://www.chefkoch.de/rezepte/111111/"
+
+    def fake_get(request_url, **kwargs):
+        if request_url == CHEFKOCH_API_URL:
+            return _mock_response(json_data=search_response)
+        return _mock_response(json_data={"title": "A", "results": []})
+
+    with patch("requests.get", side_effect=fake_get) as mock_get:
+        urls = await asyncio.gather(
+            _fetch_recipe_url(client, {"type": "vegan"}),
+            _fetch_recipe_url(client, {"type": "search", "search_query": "Vegan"}),
+        )
+        assert urls == [url, url]
+        assert mock_get.call_count == 1
+
+        scoped = client.with_response_cache()
+        first, second = await asyncio.gather(
+            extract_recipe_attributes(client, url),
+            extract_recipe_attributes(scoped, url),
+        )
+    assert first.title == second.title == "A"
+    # One search, one detail and one comments request
+    assert mock_get.call_count == 3
+
+
+async def test_coalesced_request_cancelled_with_last_waiter(client):
+    """Test a shared request keeps running until all of its waiters are gone."""
+    started = asyncio.Event()
+    release = asyncio.Event()
+    fetches = []
+
+    async def slow_fetch(*args):
+        fetches.append(args)
+        started.set()
+        await release.wait()
+        return MagicMock()
+
+    with patch.object(client, "_async_fetch", side_effect=slow_fetch):
+        first = asyncio.ensure_future(client.async_get(CHEFKOCH_API_URL))
+        second = asyncio.ensure_future(client.async_get(CHEFKOCH_API_URL))
+        await started.wait()
+        (flight,) = client._in_flight.values()
+
+        first.cancel()
+        await asyncio.sleep(0)
+        assert not flight.task.cancelled()
+
+        second.cancel()
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        assert flight.task.cancelled()
+
+    await asyncio.sleep(0)
+    assert len(fetches) == 1
+    assert not client._in_flight
+
+
+@pytest.mark.asyncio
+async def test_options_update_applies_sensor_changes_in_place(
+    mock_hass, mock_config_entry
+):
+    """Test only added and changed sensors are fetched on an options update."""
+    mock_config_entry.options = {
+        "sensors": [
+            {"id": "keep", "type": "search", "name": "Keep", "search_query": "a"},
+            {"id": "edit", "type": "search", "name": "Edit", "search_query": "b"},
+            {"id": "drop", "type": "search", "name": "Drop", "search_query": "c"},
+        ],
+        "update_interval": 12,
+    }
+    with patch(
+        "custom_components.chefkoch_ha._fetch_recipe_url", return_value=None
+    ) as mock_fetch:
+        await async_setup_entry(mock_hass, mock_config_entry)
+        entry_data = mock_hass.data[DOMAIN]["test_entry_id"]
+        entity = MagicMock()
+        entry_data["entities"] = {"edit": entity}
+        entry_data["add_sensors"] = MagicMock()
+        registry = MagicMock()
+        registry.async_get_entity_id.return_value = "sensor.chefkoch_drop"
+        prefetch_task = MagicMock()
+        entry_data["prefetch_tasks"]["drop"] = prefetch_task
+        entry_data["prefetched"]["drop"] = {"settings": {}, "url": "", "recipe": None}
+        store = entry_data["store"]
+        store.set_sensor_recipe(
+            mock_config_entry.options["sensors"][2], "123456", time.time()
+        )
+        mock_fetch.reset_mock()
+
+        mock_config_entry.options = {
+            "sensors": [
+                {"id": "keep", "type": "search", "name": "Keep", "search_query": "a"},
+                {"id": "edit", "type": "search", "name": "Edit", "search_query": "x"},
+                {"id": "new", "type": "search", "name": "New", "search_query": "d"},
+            ],
+            "update_interval": 12,
+        }
+        with patch("custom_components.chefkoch_ha.er.async_get", return_value=registry):
+            await options_update_listener(mock_hass, mock_config_entry)
+
+    mock_hass.config_entries.async_reload.assert_not_called()
+    fetched = sorted(call.args[1]["id"] for call in mock_fetch.call_args_list)
+    assert fetched == ["edit", "new"]
+    entity.update_config.assert_called_once()
+    entry_data["add_sensors"].assert_called_once_with(
+        [{"id": "new", "type": "search", "name": "New", "search_query": "d"}]
+    )
+    registry.async_remove.assert_called_once_with("sensor.chefkoch_drop")
+    # Nothing of the removed sensor is left to be fetched or restored
+    prefetch_task.cancel.assert_called_once()
+    assert "drop" not in entry_data["prefetch_tasks"]
+    assert "drop" not in entry_data["prefetched"]
+    assert "drop" not in store._sensors
+    assert "drop" not in mock_hass.data[DOMAIN]["cache_test_entry_id"]
+    assert "drop" not in entry_data["coordinator"].data
+
+    # Other options still reload the entry
+    mock_config_entry.options = {**mock_config_entry.options, "async_client": False}
+    await options_update_listener(mock_hass, mock_config_entry)
+    mock_hass.config_entries.async_reload.assert_called_once_with("test_entry_id")
+
+
+@pytest.mark.asyncio
+async def test_max_concurrency_bounds_requests_and_uses_own_pool(mock_hass):
+    """Test requests are bounded and blocking work runs in the client's pool."""
+    client = ChefkochClient(mock_hass, use_async=False, max_concurrency=2)
+    active = 0
+    peak = 0
+    threads = set()
+
+    def slow_get(url, **kwargs):
+        nonlocal active, peak
+        threads.add(threading.current_thread().name)
+        active += 1
+        peak = max(peak, active)
+        time.sleep(0.02)
+        active -= 1
+        return _mock_response(text=url)
+
+    with patch("requests.get", side_effect=slow_get):
+        await asyncio.gather(
+            *(client.async_get(f"{CHEFKOCH_API_URL}/{i}") for i in range(6))
+        )
+
+    assert peak == 2
+    assert all(name.startswith("chefkoch") for name in threads)
+    mock_hass.async_add_executor_job.assert_not_called()
+
+    client.close()
+    with pytest.raises(RuntimeError):
+        await client.async_run_blocking(time.time)
+
+
+@pytest.mark.asyncio
+async def test_async_update_data_bounds_sensor_concurrency(
+    mock_hass, mock_config_entry, client
+):
+    """Test only max_concurrency sensors are fetched at once."""
+    mock_config_entry.options = {
+        "sensors": [{"id": str(i), "type": "search", "name": str(i)} for i in range(5)],
+        "max_concurrency": 2,
+    }
+    store = RecipeStore(mock_hass, "test_entry_id", ttl=3600, max_recipes=10)
+    mock_hass.data = {
+        DOMAIN: {
+            "test_entry_id": {
+                "client": client,
+                "store": store,
+                "scheduler": SensorScheduler(timedelta(hours=12)),
+            }
+        }
+    }
+    active = 0
+    peak = 0
+
+    async def slow_fetch(*args):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+
+    with patch("custom_components.chefkoch_ha._fetch_recipe_url", new=slow_fetch):
+        data = await async_update_data(mock_hass, mock_config_entry)
+
+    assert len(data) == 5
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_refresh_recipe_swaps_in_prefetched_recipe(mock_hass, mock_config_entry):
+    """Test the refresh service uses the recipe prefetched in the background."""
+    background = []
+
+    def run_task(hass, coro, name):
+        task = asyncio.ensure_future(coro)
+        background.append(task)
+        return task
+
+    mock_config_entry.async_create_background_task.side_effect = run_task
+    urls = iter(f"https://www.chefkoch.de/rezepte/{i}00000/" for i in range(1, 9))
+
+    async def fetch_url(*args):
+        return next(urls)
+
+    async def extract(client, url, store=None):
+        return Recipe(title=url)
+
+    with (
+        patch("custom_components.chefkoch_ha._fetch_recipe_url", new=fetch_url),
+        patch("custom_components.chefkoch_ha.extract_recipe_attributes", new=extract),
+    ):
+        await async_setup_entry(mock_hass, mock_config_entry)
+        coordinator = mock_hass.data[DOMAIN]["test_entry_id"]["coordinator"]
+        assert coordinator.data["test_sensor"].title.endswith("/100000/")
+        await asyncio.gather(*background)
+
+        handler = next(
+            call.args[2]
+            for call in mock_hass.services.async_register.call_args_list
+            if call.args[1] == "refresh_recipe"
+        )
+        await handler(MagicMock())
+        # The prefetched recipe was swapped in and the buffer is refilled
+        assert coordinator.data["test_sensor"].title.endswith("/200000/")
+        await asyncio.gather(*background)
+
+    prefetched = mock_hass.data[DOMAIN]["test_entry_id"]["prefetched"]
+    assert prefetched["test_sensor"]["url"].endswith("/300000/")
+
+
+@pytest.mark.asyncio
+async def test_refresh_recipe_does_not_wait_for_sensors_without_prefetch(
+    mock_hass, mock_config_entry
+):
+    """Test the refresh service leaves sensors without a prefetch to the background."""
+    mock_config_entry.options["sensors"].append(
+        {"id": "daily", "type": "daily", "name": "Daily"}
+    )
+    mock_hass.data = {
+        DOMAIN: {
+            "cache_test_entry_id": {
+                "test_sensor": Recipe(title="Old search"),
+                "daily": Recipe(title="Old daily"),
+            }
+        }
+    }
+    background: list = []
+    mock_config_entry.async_create_background_task = MagicMock(
+        side_effect=lambda hass, coro, name: (
+            background.append((name, coro)) or MagicMock()
+        )
+    )
+    fetch_url = AsyncMock(return_value="https://www.chefkoch.de/rezepte/123456/")
+
+    with (
+        patch("custom_components.chefkoch_ha._fetch_recipe_url", new=fetch_url),
+        patch(
+            "custom_components.chefkoch_ha.extract_recipe_attributes",
+            AsyncMock(return_value=Recipe(title="New")),
+        ),
+    ):
+        await async_setup_entry(mock_hass, mock_config_entry)
+        for _, coro in background:
+            coro.close()
+        background.clear()
+        coordinator = mock_hass.data[DOMAIN]["test_entry_id"]["coordinator"]
+
+        handler = next(
+            call.args[2]
+            for call in mock_hass.services.async_register.call_args_list
+            if call.args[1] == "refresh_recipe"
+        )
+        await handler(MagicMock())
+        fetch_url.assert_not_called()
+        assert coordinator.data["daily"].title == "Old daily"
+
+        ((name, refresh),) = background
+        assert name == "chefkoch_ha refresh"
+        await refresh
+        # The refreshed search sensor prefetches its next recipe again
+        for _, coro in background[1:]:
+            coro.close()
+
+    assert fetch_url.await_count == 2
+    assert coordinator.data["daily"].title == "New"
+    assert coordinator.data["test_sensor"].title == "New"
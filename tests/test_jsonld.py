@@ -0,0 +1,72 @@
+"""Tests for the JSON-LD extraction of recipe pages."""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from custom_components.chefkoch_ha.jsonld import (
+    find_recipe_json_ld,
+    find_recipe_json_ld_soup,
+    scan_json_ld,
+)
+
+from . import mock_ha  # noqa: F401
+
+RECIPE = {
+    "@context": "https://schema.org",
+    "@type": "Recipe",
+    "name": "Käsespätzle von Oma",
+    "recipeIngredient": ["500 g Mehl", "5 Eier"],
+    "image": ["https://img.chefkoch-cdn.de/rezepte/1/bilder/2/crop-960x720/x.jpg"],
+}
+BREADCRUMB = {"@context": "https://schema.org", "@type": "BreadcrumbList"}
+
+PAGES = {
+    "plain": f"""<html><head>
+        <meta property="og:image" content="https://img.chefkoch-cdn.de/og.jpg?a=1&amp;b=2">
+        <script type="application/ld+json">{json.dumps(BREADCRUMB)}</script>
+        <script type="application/ld+json">{json.dumps(RECIPE)}</script>
+        </head><body><script>var x = "<div>";</script></body></html>""",
+    "graph": f"""<html><head>
+        <meta content='https://img.chefkoch-cdn.de/og.jpg' property='og:image'/>
+        <script  type='application/ld+json' >
+        {json.dumps({"@graph": [BREADCRUMB, RECIPE]})}
+        </script></head></html>""",
+    "list_and_broken": f"""<html><head>
+        <SCRIPT type="application/ld+json">{{"@type": "Recipe", broken</SCRIPT>
+        <script type="application/ld+json">{json.dumps([BREADCRUMB, RECIPE])}</script>
+        </head></html>""",
+    "other_script_type": f"""<html><head>
+        <script type="text/javascript">{json.dumps(RECIPE)}</script>
+        <meta name="description" content="og:image is mentioned here">
+        </head></html>""",
+    "no_json_ld": """<html><head><meta property="og:image" content=""></head>
+        <body>Chefkoch Plus</body></html>""",
+}
+
+
+@pytest.mark.parametrize("page", sorted(PAGES))
+def test_fast_extractor_matches_soup(page):
+    """Test that the byte scanner returns the same result as the DOM parser."""
+    body = PAGES[page].encode()
+    assert find_recipe_json_ld(body) == find_recipe_json_ld_soup(body)
+
+
+def test_fast_extractor_results():
+    """Test the extracted recipe and the unescaped og:image URL."""
+    recipe, og_image = find_recipe_json_ld(PAGES["plain"].encode())
+    assert recipe == RECIPE
+    assert og_image == "https://img.chefkoch-cdn.de/og.jpg?a=1&b=2"
+
+
+def test_scan_only_decodes_recipe_blocks():
+    """Test that only JSON-LD blocks mentioning a Recipe are passed to json.loads."""
+    payloads, _ = scan_json_ld(PAGES["plain"].encode())
+    assert len(payloads) == 1
+
+    with patch(
+        "custom_components.chefkoch_ha.jsonld.json.loads", side_effect=json.loads
+    ) as mock_loads:
+        find_recipe_json_ld(PAGES["plain"].encode())
+    mock_loads.assert_called_once()
@@ -0,0 +1,117 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+import requests
+
+from custom_components.chefkoch_ha.api import (
+    ChefkochClient,
+    ChefkochResponse,
+    _async_hedged,
+)
+from custom_components.chefkoch_ha.latency import (
+    MIN_SAMPLES,
+    MIN_TIMEOUT,
+    LatencyHistogram,
+)
+
+from . import mock_ha  # noqa: F401
+
+
+def test_latency_histogram_percentiles_and_timeout():
+    """Test percentiles come from the rolling window and bound the timeout."""
+    histogram = LatencyHistogram()
+    assert histogram.timeout(10) == 10
+    assert histogram.hedge_delay() is None
+
+    for _ in range(MIN_SAMPLES):
+        histogram.record(0.08)
+    assert histogram.timeout(10) == MIN_TIMEOUT
+    histogram.record(0.4)
+    assert histogram.percentile(0.5) == 0.1
+    assert histogram.hedge_delay() == 0.1
+    assert histogram.percentile(0.99) == 0.5
+    assert histogram.timeout(10) == 1.5
+
+    for _ in range(MIN_SAMPLES):
+        histogram.record(2.5)
+    assert histogram.timeout(10) == 9
+    assert histogram.timeout(5) == 5
+
+    histogram.record(30)
+    assert histogram.percentile(1) == 30
+    stats = histogram.as_dict()
+    assert stats["samples"] == 2 * MIN_SAMPLES + 2
+    assert stats["buckets"]["<=0.1s"] == MIN_SAMPLES
+    assert stats["buckets"][">10s"] == 1
+
+
+@pytest.mark.asyncio
+async def test_client_retries_failed_requests():
+    """Test errors and 5xx answers are retried after a backoff."""
+    hass = MagicMock()
+    hass.async_add_executor_job = AsyncMock(side_effect=lambda func, *args: func(*args))
+    client = ChefkochClient(hass, use_async=False)
+    unavailable = MagicMock(status_code=502, headers={}, content=b"")
+    ok = MagicMock(status_code=200, headers={}, content=b"{}")
+
+    with (
+        patch(
+            "requests.get",
+            side_effect=[requests.ConnectionError("reset"), unavailable, ok],
+        ) as mock_get,
+        patch(
+            "custom_components.chefkoch_ha.api.asyncio.sleep", AsyncMock()
+        ) as mock_sleep,
+    ):
+        response = await client.async_get(
+            "https://api.chefkoch.de/v2/recipes/123", retries=2
+        )
+
+    assert response.status == 200
+    assert mock_get.call_count == 3
+    assert mock_sleep.await_count == 2
+    latency = client.latency_diagnostics()["api.chefkoch.de/v2/recipes/{id}"]
+    assert latency["samples"] == 1
+
+
+@pytest.mark.asyncio
+async def test_hedged_request_first_good_response_wins():
+    """Test a slow request is sent again and the faster answer is used."""
+    calls = []
+
+    async def send():
+        calls.append(None)
+        if len(calls) == 1:
+            await asyncio.sleep(10)
+        return ChefkochResponse(f"attempt {len(calls)}", 200, {}, b"")
+
+    response = await asyncio.wait_for(_async_hedged(send, 0.01), 1)
+    assert response.url == "attempt 2"
+    assert len(calls) == 2
+
+    # A fast answer does not trigger a second request
+    calls.clear()
+    calls.append(None)
+    response = await _async_hedged(send, 0.5)
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_partial_reads_do_not_shorten_full_read_timeout():
+    """Test streamed reads that stop early have their own latency histogram."""
+    hass = MagicMock()
+    hass.async_add_executor_job = AsyncMock(side_effect=lambda func, *args: func(*args))
+    client = ChefkochClient(hass, use_async=False)
+    url = "https://www.chefkoch.de/rezepte/123456/carbonara.html"
+    page = MagicMock(status_code=200, headers={}, content=b"<html></html>")
+    page.iter_content.return_value = [b"<head></head>"]
+
+    with patch("requests.get", return_value=page):
+        for _ in range(MIN_SAMPLES):
+            await client.async_get(url, stop_at=(b"</head>",))
+
+    latency = client.latency_diagnostics()
+    assert latency["www.chefkoch.de/rezepte/{id} (partial)"]["samples"] == MIN_SAMPLES
+    assert "www.chefkoch.de/rezepte/{id}" not in latency
+    assert client._histogram(url, ()).timeout(10) == 10
@@ -0,0 +1,140 @@
+import tracemalloc
+from dataclasses import replace
+
+from custom_components.chefkoch_ha.models import (
+    Ingredient,
+    Recipe,
+    parse_amount,
+    parse_ingredients,
+)
+
+RECIPE = Recipe(
+    title="Spaghetti Carbonara",
+    subtitle="Klassiker aus Italien",
+    url="https://www.chefkoch.de/rezepte/123456/",
+    image_url="https://img.chefkoch-cdn.de/rezepte/123456/bilder/1/crop-900x600/rezept.jpg",
+    calories="582 kcal",
+    protein="27.67 g",
+    fat="24 g",
+    carbohydrates="62 g",
+    cuisine="Italien",
+    difficulty="einfach",
+    ingredients=("400 g Spaghetti", "150 g Pancetta", "4 Eigelb"),
+    instructions="Kochen.",
+    category_breadcrumb=("Kochen", "Pasta"),
+    servings="4 Port.",
+    author="ChefMaster",
+    publisher="Chefkoch",
+    keywords="Pasta, Italien",
+    tags=("Pasta", "Italien"),
+    saved_recipes_count=116412,
+    view_count=3965603,
+    date_published="2005-01-01",
+    total_time="0:30:00",
+    prep_time="0:20:00",
+    cook_time="0:10:00",
+    rating=4.7,
+    rating_count=2000,
+)
+
+
+def test_recipe_attributes():
+    """Test the state attributes keep their names and skip empty values."""
+    attributes = RECIPE.as_attributes()
+
+    assert "title" not in attributes
+    assert "status" not in attributes
+    assert "video_url" not in attributes
+    assert attributes["totalTime"] == "0:30:00"
+    assert attributes["number_ratings"] == attributes["rating_count"] == 2000
+    assert attributes["ingredients"] == (
+        "400 g Spaghetti",
+        "150 g Pancetta",
+        "4 Eigelb",
+    )
+    assert "stale" not in attributes
+    assert replace(RECIPE, stale=True).as_attributes()["stale"] is True
+
+
+def test_recipe_from_dict():
+    """Test recipes round-trip through their stored form, also the former one."""
+    stored = {**RECIPE.as_dict(), "tags": ["Pasta", "Italien"]}
+    assert Recipe.from_dict(stored) == RECIPE
+
+    recipe = replace(
+        RECIPE,
+        ingredient_items=(Ingredient("Spaghetti", 400, "g", "al dente", "Nudeln"),),
+        serving_count=4,
+    )
+    assert Recipe.from_dict(recipe.as_dict()) == recipe
+
+    legacy = {
+        "title": "Old",
+        "prepTime": "0:20:00",
+        "number_ratings": 3,
+        "ingredients": ["--- Teig ---", "500 g Mehl"],
+        "servings": "2 Port.",
+    }
+    recipe = Recipe.from_dict(legacy)
+    assert recipe.prep_time == "0:20:00"
+    assert recipe.rating_count is None
+    assert recipe.ingredient_items == (Ingredient("g Mehl", 500, group="Teig"),)
+    assert recipe.serving_count == 2
+
+
+def test_parse_amount():
+    """Test the leading number of quantities the website gives as text."""
+    assert parse_amount(4) == 4
+    assert parse_amount("4 Portionen") == 4
+    assert parse_amount(["6", "6 Portionen"]) == 6
+    assert parse_amount("1,5 Liter") == 1.5
+    assert parse_amount("1/2 TL Salz") == 0.5
+    assert parse_amount("½ TL Salz") == 0.5
+    assert parse_amount("Salz und Pfeffer") is None
+    assert parse_amount("") is None
+    assert parse_amount(None) is None
+
+
+def test_ingredient_scaling():
+    """Test ingredients scale by arithmetic on their amount only."""
+    item = Ingredient("Pancetta", amount=150, unit="g", usage="roher")
+    assert item.text() == "150 g Pancetta (roher)"
+    assert item.text(0.5) == "75 g Pancetta (roher)"
+    assert item.text(2 / 3) == "100 g Pancetta (roher)"
+    assert Ingredient("Eier", amount=3).text(1 / 3 * 2) == "2 Eier"
+    assert Ingredient("Zucker", amount=1, unit="EL").text(1 / 3) == "0,33 EL Zucker"
+    assert Ingredient("Milch", amount=0.125, unit="l").text() == "0.125 l Milch"
+    # Small amounts keep two significant digits instead of showing as 0
+    assert Ingredient("Safran", amount=0.01, unit="g").text(0.25) == "0,0025 g Safran"
+    # Numbers in names are not amounts
+    assert Ingredient("Ei(er), Größe M 2").text(2) == "Ei(er), Größe M 2"
+
+    items = parse_ingredients(["--- Soße ---", "1,5 l Milch", "Salz und Pfeffer"])
+    assert items == (
+        Ingredient("l Milch", 1.5, group="Soße"),
+        Ingredient("Salz und Pfeffer", group="Soße"),
+    )
+    assert [item.text(2) for item in items] == ["3 l Milch", "Salz und Pfeffer"]
+    assert items[0].text(1.5) == "2,25 l Milch"
+
+
+def test_recipe_uses_less_memory_than_attribute_dicts():
+    """Test many recipes take far less memory than the former attribute dicts."""
+    count = 2000
+    attributes = {**RECIPE.as_attributes(), "title": RECIPE.title, "status": "success"}
+
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        dicts = [{**attributes, "view_count": i} for i in range(count)]
+        dict_size = tracemalloc.get_traced_memory()[0] - before
+        del dicts
+
+        before = tracemalloc.get_traced_memory()[0]
+        recipes = [replace(RECIPE, view_count=i) for i in range(count)]
+        recipe_size = tracemalloc.get_traced_memory()[0] - before
+        del recipes
+    finally:
+        tracemalloc.stop()
+
+    assert recipe_size < dict_size / 2
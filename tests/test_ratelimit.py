@@ -0,0 +1,74 @@
+import time
+from datetime import UTC, datetime, timedelta
+from email.utils import format_datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from custom_components.chefkoch_ha.api import ChefkochClient
+from custom_components.chefkoch_ha.ratelimit import (
+    MIN_RATE,
+    TokenBucket,
+    parse_retry_after,
+)
+
+from . import mock_ha  # noqa: F401
+
+
+def test_parse_retry_after():
+    """Test Retry-After in seconds and as HTTP date."""
+    assert parse_retry_after("12") == 12
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after("100000") == 300
+
+    retry_at = datetime.now(UTC) + timedelta(seconds=30)
+    assert 25 < parse_retry_after(format_datetime(retry_at, usegmt=True)) <= 30
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_limits_rate():
+    """Test requests beyond the burst wait for new tokens."""
+    bucket = TokenBucket(rate=20, burst=2)
+    start = time.monotonic()
+    for _ in range(4):
+        await bucket.acquire()
+    # Two tokens from the burst, two more at 20 per second
+    assert time.monotonic() - start >= 0.09
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_honours_retry_after_and_adapts():
+    """Test throttling pauses the bucket, halves the rate and recovers slowly."""
+    bucket = TokenBucket(rate=10, burst=10)
+    bucket.throttled(retry_after=0.1)
+    assert bucket.rate == 5
+
+    start = time.monotonic()
+    await bucket.acquire()
+    assert time.monotonic() - start >= 0.1
+
+    for _ in range(10):
+        bucket.succeeded()
+    assert bucket.rate == 10
+
+    for _ in range(20):
+        bucket.throttled(retry_after=0)
+    assert bucket.rate == MIN_RATE
+
+
+@pytest.mark.asyncio
+async def test_client_reports_throttling_per_host():
+    """Test a 429 from one host only slows down that host."""
+    hass = MagicMock()
+    hass.async_add_executor_job = AsyncMock(side_effect=lambda func, *args: func(*args))
+    client = ChefkochClient(hass, use_async=False, rate_limit=10)
+    throttled = MagicMock(status_code=429, headers={"Retry-After": "0"}, content=b"")
+
+    with patch("requests.get", return_value=throttled):
+        response = await client.async_get("https://api.chefkoch.de/v2/recipes")
+
+    assert response.status == 429
+    buckets = client._rate_limiter._buckets
+    assert buckets["api.chefkoch.de"].rate == 5
+    assert "www.chefkoch.de" not in buckets
@@ -3,7 +3,12 @@ from unittest.mock import MagicMock
 import pytest
 
 from custom_components.chefkoch_ha.const import DOMAIN
-from custom_components.chefkoch_ha.sensor import ChefkochSensor, async_setup_entry
+from custom_components.chefkoch_ha.models import Recipe
+from custom_components.chefkoch_ha.sensor import (
+    ChefkochSensor,
+    RecordedChefkochSensor,
+    async_setup_entry,
+)
 
 from . import mock_ha  # noqa: F401
 
@@ -27,7 +32,7 @@ async def test_async_setup_entry():
 def test_chefkoch_sensor():
     """Test ChefkochSensor properties."""
     coordinator = MagicMock()
-    coordinator.data = {"test_id": {"title": "Test Recipe", "calories": "500"}}
+    coordinator.data = {"test_id": Recipe(title="Test Recipe", calories="500")}
     sensor_config = {"id": "test_id", "name": "Daily Recipe"}
 
     sensor = ChefkochSensor(coordinator, sensor_config)
@@ -48,3 +53,50 @@ def test_chefkoch_sensor_unknown_value():
 
     sensor = ChefkochSensor(coordinator, sensor_config)
     assert sensor.native_value == "unknown"
+
+
+def test_chefkoch_sensor_compact_attributes():
+    """Test compact sensors leave the bulky recipe fields out of their state."""
+    coordinator = MagicMock()
+    coordinator.data = {
+        "test_id": Recipe(
+            title="Test Recipe",
+            calories="500",
+            ingredients=("1 Ei",),
+            instructions="Kochen.",
+            top_comments=("Lecker",),
+        )
+    }
+    sensor_config = {"id": "test_id", "name": "Daily Recipe"}
+
+    full = ChefkochSensor(coordinator, sensor_config).extra_state_attributes
+    compact = ChefkochSensor(
+        coordinator, sensor_config, compact=True
+    ).extra_state_attributes
+
+    assert full["ingredients"] == ("1 Ei",)
+    assert compact == {"calories": "500"}
+
+
+@pytest.mark.asyncio
+async def test_bulky_attributes_not_recorded_by_default():
+    """Test the bulky attributes are only recorded if enabled in the options."""
+    assert {"ingredients", "instructions", "top_comments", "image_url"} <= (
+        ChefkochSensor._unrecorded_attributes
+    )
+    assert "calories" not in ChefkochSensor._unrecorded_attributes
+
+    mock_hass = MagicMock()
+    mock_hass.data = {DOMAIN: {"test_entry_id": {"coordinator": MagicMock()}}}
+    mock_entry = MagicMock()
+    mock_entry.entry_id = "test_entry_id"
+    mock_entry.options = {
+        "sensors": [{"id": "test_id", "type": "daily", "name": "Daily"}],
+        "record_recipe_details": True,
+    }
+    async_add_entities = MagicMock()
+    await async_setup_entry(mock_hass, mock_entry, async_add_entities)
+
+    (entity,) = async_add_entities.call_args.args[0]
+    assert isinstance(entity, RecordedChefkochSensor)
+    assert entity._unrecorded_attributes == frozenset()